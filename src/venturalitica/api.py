@@ -9,11 +9,11 @@ from typing import Any, Dict, List, Optional, Union
 
 from .binding import COLUMN_SYNONYMS, discover_column
 from .core import AssuranceValidator, ComplianceResult
-from .formatting import VenturalíticaJSONEncoder, print_summary
+from .formatting import VenturalíticaJSONEncoder, load_json_file, print_summary
 from .integrations import auto_log
 from .oscal.builder import AssessmentResultsBuilder, POAMBuilder
 from .oscal.serializer import to_json as oscal_to_json
-from .session import GovernanceSession
+from .session import GovernanceSession, append_to_json_array
 
 # We need the version for the enforce print statement
 try:
@@ -126,8 +126,7 @@ def _generate_oscal_artifacts(
         if not results_path.exists():
             return
 
-        with open(results_path, "r") as f:
-            raw = json.load(f)
+        raw = load_json_file(results_path)
 
         # Parse cached results back into ComplianceResult objects
         items = raw if isinstance(raw, list) else raw.get("metrics", [])
@@ -216,7 +215,9 @@ def _generate_oscal_artifacts(
 def enforce(
     data: Any = None,
     metrics: Optional[Dict[str, float]] = None,
-    policy: Union[str, Path, List[Union[str, Path]]] = "risks.oscal.yaml",
+    policy: Union[
+        str, Path, Dict[str, Any], List[Union[str, Path, Dict[str, Any]]]
+    ] = "risks.oscal.yaml",
     target: str = "target",
     prediction: str = "prediction",
     strict: bool = False,
@@ -227,6 +228,8 @@ def enforce(
     Main entry point for enforcing AI Assurance policies.
 
     Parameters:
+        policy: Path to an OSCAL policy file, an already-parsed policy dict
+            (skips the filesystem and YAML parsing), or a list of either.
         phase: Optional lifecycle_phase filter. When provided, only controls
             tagged with that phase (or untagged) are evaluated. Typical values:
             `training` (raw data, Art. 10), `validation` (model predictions,
@@ -241,7 +244,8 @@ def enforce(
     all_results = []
 
     for p in policies:
-        print(f"\n[Venturalítica v{__version__}] 🛡  Enforcing policy: {p}")
+        label = "<in-memory policy>" if isinstance(p, dict) else p
+        print(f"\n[Venturalítica v{__version__}] 🛡  Enforcing policy: {label}")
         try:
             validator = AssuranceValidator(p)
             results = []
@@ -281,15 +285,15 @@ def enforce(
                 all_results.extend(results)
                 print_summary(results, is_data_only=(prediction is None))
             else:
-                print(f"  ⚠ No applicable controls found in {p}")
+                print(f"  ⚠ No applicable controls found in {label}")
 
         except FileNotFoundError:
-            print(f"  ⚠ Policy file not found: {p}")
+            print(f"  ⚠ Policy file not found: {label}")
         except Exception as e:
             if strict:
                 # In strict mode we propagate unexpected errors so callers can fail-fast
                 raise
-            print(f"  ⚠ Unexpected error loading {p}: {e}")
+            print(f"  ⚠ Unexpected error loading {label}: {e}")
 
     if all_results:
         auto_log(all_results)
@@ -298,36 +302,39 @@ def enforce(
         try:
             os.makedirs(".venturalitica", exist_ok=True)
             results_path = ".venturalitica/results.json"
-
-            existing_results = []
-            if os.path.exists(results_path):
-                try:
-                    with open(results_path, "r") as f:
-                        existing_results = json.load(f)
-                except Exception:
-                    pass
-
-            # Normalize existing results to a list if file contains a bundle/dict
-            if isinstance(existing_results, dict):
-                if isinstance(existing_results.get("metrics"), list):
-                    existing_results = existing_results.get("metrics")
-                elif isinstance(existing_results.get("post_metrics"), list):
-                    existing_results = existing_results.get("post_metrics")
-                else:
-                    # Flatten any list values inside dict
-                    flattened = []
-                    for v in existing_results.values():
-                        if isinstance(v, list):
-                            flattened.extend(v)
-                    existing_results = flattened
-
             new_results = [asdict(r) for r in all_results]
-            # Avoid duplicates if exactly the same control results are added
-            # For now, just append to keep it simple for the handshake
-            combined = existing_results + new_results
 
-            with open(results_path, "w") as f:
-                json.dump(combined, f, indent=2, cls=VenturalíticaJSONEncoder)
+            # Fast path: append in place to an existing results array
+            if not append_to_json_array(
+                results_path, new_results, encoder=VenturalíticaJSONEncoder
+            ):
+                existing_results = []
+                if os.path.exists(results_path):
+                    try:
+                        existing_results = load_json_file(results_path)
+                    except Exception:
+                        pass
+
+                # Normalize existing results to a list if file contains a bundle/dict
+                if isinstance(existing_results, dict):
+                    if isinstance(existing_results.get("metrics"), list):
+                        existing_results = existing_results.get("metrics")
+                    elif isinstance(existing_results.get("post_metrics"), list):
+                        existing_results = existing_results.get("post_metrics")
+                    else:
+                        # Flatten any list values inside dict
+                        flattened = []
+                        for v in existing_results.values():
+                            if isinstance(v, list):
+                                flattened.extend(v)
+                        existing_results = flattened
+
+                # Avoid duplicates if exactly the same control results are added
+                # For now, just append to keep it simple for the handshake
+                combined = existing_results + new_results
+
+                with open(results_path, "w") as f:
+                    json.dump(combined, f, indent=2, cls=VenturalíticaJSONEncoder)
 
             # [GovOps] Save to Session-specific storage
             session = GovernanceSession.get_current()
@@ -26,8 +26,7 @@ def calc_demographic_parity(df: pd.DataFrame, **kwargs) -> float:
             df[target], df[outcome], sensitive_features=df[dim]
         )
 
-    groups = df.groupby(dim)
-    pprs = [grp[outcome].mean() for _, grp in groups]
+    pprs = df.groupby(dim)[outcome].mean().tolist()
     return max(pprs) - min(pprs) if pprs else 0.0
 
 
@@ -48,12 +47,9 @@ def calc_equal_opportunity(df: pd.DataFrame, **kwargs) -> float:
             df[target], df[outcome], sensitive_features=df[dim]
         )
 
-    groups = df.groupby(dim)
-    tprs = []
-    for _, grp in groups:
-        pos_grp = grp[grp[target] == 1]
-        if len(pos_grp) > 0:
-            tprs.append(grp[outcome].mean())  # Use outcome
+    # Groups without positives are absent from the grouped result
+    pos = df[df[target] == 1]
+    tprs = pos.groupby(dim)[outcome].mean().tolist()
 
     tprs = [t for t in tprs if not np.isnan(t)]
     return max(tprs) - min(tprs) if tprs else 0.0
@@ -68,15 +64,11 @@ def calc_equalized_odds_ratio(df: pd.DataFrame, **kwargs) -> float:
     if any(v in [None, "MISSING"] for v in [target, pred, dim]):
         raise ValueError("Missing columns for equalized_odds_ratio")
 
-    groups = df.groupby(dim)
-    tprs, fprs = [], []
-    for _, grp in groups:
-        pos_grp = grp[grp[target] == 1]
-        if len(pos_grp) > 0:
-            tprs.append(pos_grp[pred].mean())
-        neg_grp = grp[grp[target] == 0]
-        if len(neg_grp) > 0:
-            fprs.append((neg_grp[pred] == 1).mean())
+    # Groups without positives (negatives) are absent from the grouped result
+    pos = df[df[target] == 1]
+    neg = df[df[target] == 0]
+    tprs = pos.groupby(dim)[pred].mean().tolist()
+    fprs = (neg[pred] == 1).groupby(neg[dim]).mean().tolist()
 
     tprs = [t for t in tprs if not np.isnan(t)]
     fprs = [f for f in fprs if not np.isnan(f)]
@@ -95,12 +87,10 @@ def calc_predictive_parity(df: pd.DataFrame, **kwargs) -> float:
     if any(v in [None, "MISSING"] for v in [target, pred, dim]):
         raise ValueError("Missing columns for predictive_parity")
 
-    groups = df.groupby(dim)
-    precisions = []
-    for _, grp in groups:
-        tp = ((grp[target] == 1) & (grp[pred] == 1)).sum()
-        fp = ((grp[target] == 0) & (grp[pred] == 1)).sum()
-        if (tp + fp) > 0:
-            precisions.append(tp / (tp + fp))
+    predicted_pos = df[pred] == 1
+    tp = ((df[target] == 1) & predicted_pos).groupby(df[dim]).sum()
+    fp = ((df[target] == 0) & predicted_pos).groupby(df[dim]).sum()
+    flagged = (tp + fp) > 0
+    precisions = (tp[flagged] / (tp + fp)[flagged]).tolist()
 
     return max(precisions) - min(precisions) if precisions else 0.0
@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 from sklearn.metrics import accuracy_score, f1_score, precision_score, recall_score
 
@@ -17,7 +18,15 @@ def calc_accuracy(df: pd.DataFrame, **kwargs) -> float:
     target, pred = _require_target_and_prediction(kwargs)
     if target not in df.columns or pred not in df.columns:
         raise KeyError(f"Column '{target}' or '{pred}' not found in DataFrame.")
-    return float(accuracy_score(df[target], df[pred]))
+    y_true = df[target].to_numpy()
+    y_pred = df[pred].to_numpy()
+    # Fast path for plain integer/bool labels, where accuracy is just the
+    # match rate. The power bootstrap calls this ~1000x per control and
+    # sklearn's target-type validation dominates each call. Anything else
+    # (strings, floats, nullable dtypes, empty input) keeps sklearn's checks.
+    if y_true.size and y_true.dtype.kind in "biu" and y_pred.dtype.kind in "biu":
+        return float(np.mean(y_true == y_pred))
+    return float(accuracy_score(y_true, y_pred))
 
 def calc_precision(df: pd.DataFrame, **kwargs) -> float:
     target, pred = _require_target_and_prediction(kwargs)
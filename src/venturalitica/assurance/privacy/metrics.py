@@ -161,24 +161,18 @@ def calc_t_closeness(df: pd.DataFrame, **kwargs) -> float:
     # Calculate overall distribution
     overall_dist = df[sensitive_attr].value_counts(normalize=True).sort_index()
 
-    # Calculate max distance in any group
-    grouped = df.groupby(quasi_identifiers)
-    max_distance = 0.0
-
-    for _, group in grouped:
-        group_dist = group[sensitive_attr].value_counts(normalize=True).sort_index()
-
-        # Simple L1 distance (can be extended to EMD for ordinal)
-        all_values = set(overall_dist.index) | set(group_dist.index)
-        distance = 0.0
-
-        for val in all_values:
-            overall_prob = overall_dist.get(val, 0.0)
-            group_prob = group_dist.get(val, 0.0)
-            distance += abs(overall_prob - group_prob)
-
-        distance = distance / 2  # Normalize L1
-        max_distance = max(max_distance, distance)
+    # Per-group distributions as one (groups x values) table; groups whose
+    # sensitive values are all missing get an all-zero row.
+    grouped = df.groupby(quasi_identifiers)[sensitive_attr]
+    group_dist = (
+        grouped.value_counts(normalize=True)
+        .unstack(fill_value=0.0)
+        .reindex(index=grouped.size().index, columns=overall_dist.index, fill_value=0.0)
+    )
+
+    # Simple L1 distance (can be extended to EMD for ordinal), normalised
+    distances = (group_dist - overall_dist).abs().sum(axis=1) / 2
+    max_distance = distances.max() if not distances.empty else 0.0
 
     return float(max_distance)
 
@@ -122,20 +122,21 @@ def calc_group_min_positive_rate(df: pd.DataFrame, **kwargs) -> tuple:
     else:
         groups = series
 
-    grouped = df.groupby(groups)
-    rates = {}
-    for name, g in grouped:
-        grp_y = g[target]
-        try:
-            grp_y_num = pd.to_numeric(grp_y, errors="coerce")
-            pos_rate = (
-                (grp_y_num == grp_y_num.max()).sum() / len(grp_y_num.dropna())
-                if len(grp_y_num.dropna()) > 0
-                else 0.0
-            )
-        except Exception:
-            pos_rate = float((grp_y == grp_y.max()).sum() / len(grp_y))
-        rates[str(name)] = pos_rate
+    # One vectorised pass instead of a Python loop over groups: a row is
+    # positive when it equals its group's max; NaNs (after numeric coercion)
+    # are excluded from the denominator.
+    y = df[target]
+    try:
+        y = pd.to_numeric(y, errors="coerce")
+        valid = y.notna()
+    except Exception:
+        valid = pd.Series(True, index=y.index)
+    is_pos = y == y.groupby(groups).transform("max")
+    counts = pd.DataFrame({"pos": is_pos, "n": valid}).groupby(groups).sum()
+    rates = {
+        str(name): (pos / n if n > 0 else 0.0)
+        for name, pos, n in zip(counts.index, counts["pos"], counts["n"])
+    }
 
     if len(rates) == 0:
         min_rate = 0.0
@@ -11,16 +11,20 @@ Usage:
                generate_compliance_badge('passing', 'loan', '2026-01-22')"
 """
 
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, List, Literal, Union
+from typing import Any, List, Literal, Optional, Union
+
+# Bound once so metric badges don't re-parse the format spec per value.
+_FMT_VALUE = "{:.4f}".format
 
 
 def generate_compliance_badge(
     status: Union[Literal['passing', 'failing', 'unknown'], List[Any]],
     policy_name: str = 'fairness',
     date: str = '',
-    output_path: Union[str, Path] = Path('badge.svg')
-) -> Path:
+    output_path: Optional[Union[str, Path]] = Path('badge.svg')
+) -> Union[str, Path]:
     """
     Generate an SVG badge for compliance status.
     
@@ -29,11 +33,9 @@ def generate_compliance_badge(
                OR a list of ComplianceResult objects.
         policy_name: Name of policy checked
         date: ISO date string
-        output_path: Where to save the SVG
+        output_path: Where to save the SVG. Pass None to get the SVG
+            markup back as a string without touching the filesystem.
     """
-    if isinstance(output_path, str):
-        output_path = Path(output_path)
-
     # If status is a list of results, determine the overall status
     if isinstance(status, list):
         if not status:
@@ -44,7 +46,20 @@ def generate_compliance_badge(
             final_status = 'failing'
     else:
         final_status = status
-    
+
+    svg_content = _render_compliance_svg(final_status, policy_name)
+    if output_path is None:
+        return svg_content
+
+    if isinstance(output_path, str):
+        output_path = Path(output_path)
+    output_path.write_text(svg_content)
+    return output_path
+
+
+@lru_cache(maxsize=64)
+def _render_compliance_svg(final_status: str, policy_name: str) -> str:
+    """Build the compliance badge markup (pure, so safe to memoize)."""
     colors = {
         'passing': '#28a745',  # Green
         'failing': '#dc3545',  # Red
@@ -54,7 +69,7 @@ def generate_compliance_badge(
     color = colors.get(final_status, colors['unknown'])
     status_text = 'PASSING' if final_status == 'passing' else ('FAILING' if final_status == 'failing' else 'UNKNOWN')
     
-    svg_content = f'''<svg xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink" width="180" height="20" role="img" aria-label="Compliance: {status_text}">
+    return f'''<svg xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink" width="180" height="20" role="img" aria-label="Compliance: {status_text}">
   <title>Compliance: {status_text}</title>
   <linearGradient id="s" x2="0" y2="100%">
     <stop offset="0" stop-color="#bbb"/>
@@ -76,17 +91,14 @@ def generate_compliance_badge(
   </g>
 </svg>
 '''
-    
-    output_path.write_text(svg_content)
-    return output_path
 
 
 def generate_metric_badge(
     metric_name: str,
     value: float,
     threshold: float,
-    output_path: Path = Path('metric_badge.svg')
-) -> Path:
+    output_path: Optional[Path] = Path('metric_badge.svg')
+) -> Union[str, Path]:
     """
     Generate a badge for a specific metric value.
     
@@ -94,12 +106,25 @@ def generate_metric_badge(
         metric_name: e.g., 'Demographic Parity'
         value: Actual metric value
         threshold: Threshold value
-        output_path: Where to save the SVG
+        output_path: Where to save the SVG. Pass None to get the SVG
+            markup back as a string without touching the filesystem.
     
     Returns:
-        Path to generated badge
+        Path to generated badge, or the SVG markup when output_path is None
     """
-    
+    svg_content = _render_metric_svg(metric_name, value, threshold)
+    if output_path is None:
+        return svg_content
+
+    output_path.write_text(svg_content)
+    return output_path
+
+
+@lru_cache(maxsize=256)
+def _render_metric_svg(metric_name: str, value: float, threshold: float) -> str:
+    """Build the metric badge markup (pure, so safe to memoize)."""
+    value_text = _FMT_VALUE(value)
+
     # Determine color based on comparison
     if value <= threshold:
         color = '#28a745'  # Green
@@ -108,8 +133,8 @@ def generate_metric_badge(
         color = '#dc3545'  # Red
         status = '✗'
     
-    svg_content = f'''<svg xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink" width="240" height="20" role="img" aria-label="{metric_name}: {value:.4f}">
-  <title>{metric_name}: {value:.4f}</title>
+    return f'''<svg xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink" width="240" height="20" role="img" aria-label="{metric_name}: {value_text}">
+  <title>{metric_name}: {value_text}</title>
   <linearGradient id="s" x2="0" y2="100%">
     <stop offset="0" stop-color="#bbb"/>
     <stop offset="1" stop-color="#999"/>
@@ -125,14 +150,11 @@ def generate_metric_badge(
   <g fill="#fff" text-anchor="middle" font-family="Verdana,Geneva,DejaVu Sans,sans-serif" text-rendering="geometricPrecision" font-size="11">
     <text aria-hidden="true" x="80" y="15" fill="#010101" fill-opacity="0.3" transform="scale(.1)" textLength="1500">{metric_name}</text>
     <text x="80" y="14" transform="scale(.1)" fill="#fff" textLength="1500">{metric_name}</text>
-    <text aria-hidden="true" x="199" y="15" fill="#010101" fill-opacity="0.3" transform="scale(.1)" textLength="600">{status} {value:.4f}</text>
-    <text x="199" y="14" transform="scale(.1)" fill="#fff" textLength="600">{status} {value:.4f}</text>
+    <text aria-hidden="true" x="199" y="15" fill="#010101" fill-opacity="0.3" transform="scale(.1)" textLength="600">{status} {value_text}</text>
+    <text x="199" y="14" transform="scale(.1)" fill="#fff" textLength="600">{status} {value_text}</text>
   </g>
 </svg>
 '''
-    
-    output_path.write_text(svg_content)
-    return output_path
 
 
 if __name__ == '__main__':
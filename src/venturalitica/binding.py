@@ -77,9 +77,11 @@ def resolve_col_names(
     else:
         return val
 
+    # One hashed snapshot of the column labels for all the lookups below.
+    columns = frozenset(data.columns)
     resolved = []
     for item in parts:
-        if item in data.columns:
+        if item in columns:
             resolved.append(item)
             continue
 
@@ -88,7 +90,7 @@ def resolve_col_names(
         for key, cand_list in synonyms.items():
             if item in cand_list or item == key:
                 for cand in cand_list:
-                    if cand in data.columns:
+                    if cand in columns:
                         found = cand
                         break
                 if found:
@@ -98,7 +100,7 @@ def resolve_col_names(
             resolved.append(found)
         else:
             # Fallback to lower-cased column name if exists
-            if item.lower() in data.columns:
+            if item.lower() in columns:
                 resolved.append(item.lower())
             else:
                 # Keep original (metric functions may handle missing columns themselves)
@@ -133,19 +135,21 @@ def discover_column(
     if actual_col:
         return actual_col
 
+    columns = frozenset(data.columns)
+
     # Check if requested name is a direct column
-    if requested in data.columns:
+    if requested in columns:
         return requested
 
     # Try synonym discovery - find which group contains the requested name
     for key, cand_list in synonyms.items():
         if requested in cand_list or requested == key:
             for cand in cand_list:
-                if cand in data.columns:
+                if cand in columns:
                     return cand
 
     # Last resort: lowercase fallback
-    if requested.lower() in data.columns:
+    if requested.lower() in columns:
         return requested.lower()
 
     return "MISSING"
@@ -17,3 +17,8 @@ from . import (
 from .common import app
 
 __all__ = ["app"]
+
+
+def _main() -> None:
+    """Entry point for ``python -m venturalitica.cli``."""
+    app(prog_name="vl")
@@ -1,11 +1,10 @@
 import json
 from typing import Optional
 
-import requests
 import typer
 
 from ..telemetry import track_command
-from .common import SAAS_URL, app, console, get_config_path
+from .common import SAAS_URL, app, console, get_config_path, http_session
 
 
 @app.command()
@@ -20,7 +19,7 @@ def login(system_id: str):
     console.print(f"[bold green]🔐 Authenticating for system:[/bold green] {system_id}")
 
     try:
-        response = requests.post(
+        response = http_session.post(
             f"{SAAS_URL}/api/cli-auth", json={"aiSystemId": system_id}
         )
         response.raise_for_status()
@@ -1,13 +1,59 @@
 import os
+from typing import Any
 
+import requests
 import typer
+from requests.adapters import HTTPAdapter
 from rich.console import Console
 
+from ..formatting import loads_json
+
 app = typer.Typer()
 console = Console()
 
 SAAS_URL = os.getenv("VENTURALITICA_SAAS_URL", "http://localhost:3000")
 
+
+def _build_http_session() -> requests.Session:
+    """Keep-alive session shared by the SaaS commands (login/push/pull)."""
+    session = requests.Session()
+    # Pooling only: no automatic retries, so a failed login/push/pull
+    # surfaces immediately and a push POST is never re-sent.
+    adapter = HTTPAdapter(pool_connections=2, pool_maxsize=4)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+http_session = _build_http_session()
+
+
+def _read_bytes(path) -> bytes:
+    """Read a whole file with one fstat-sized read (no text decoding)."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        data = os.read(fd, size)
+        while len(data) < size:  # short reads only happen on very large files
+            chunk = os.read(fd, size - len(data))
+            if not chunk:
+                break
+            data += chunk
+        return data
+    finally:
+        os.close(fd)
+
+
+def read_json(path) -> Any:
+    """Parse a JSON file, using orjson when installed.
+
+    Goes through ``formatting.loads_json`` so the ``NaN``/``Infinity`` that
+    ``enforce()`` writes for non-finite metrics still parse. Malformed input
+    raises ``json.JSONDecodeError``.
+    """
+    return loads_json(_read_bytes(path))
+
+
 def get_config_path(filename: str) -> str:
     path = os.path.expanduser(f"~/.venturalitica/{filename}")
     dir_path = os.path.dirname(path)
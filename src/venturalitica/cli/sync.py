@@ -2,12 +2,11 @@ import json
 import os
 from typing import Optional
 
-import requests
 import typer
 import yaml
 
 from ..telemetry import track_command
-from .common import SAAS_URL, app, console, get_config_path
+from .common import SAAS_URL, app, console, get_config_path, http_session, read_json
 
 
 @app.command()
@@ -36,8 +35,7 @@ def pull(
         )
         raise typer.Exit(code=1)
 
-    with open(creds_path, "r") as f:
-        creds = json.load(f)
+    creds = read_json(creds_path)
 
     # 1-token-1-system tokens carry the target inside their scope; the
     # SaaS auto-derives it. Multi-system tokens (rare) require explicit
@@ -50,7 +48,7 @@ def pull(
         url = f"{SAAS_URL}/api/pull?format=oscal"
         if target_system:
             url += f"&system={target_system}"
-        response = requests.get(
+        response = http_session.get(
             url,
             headers={"Authorization": f"Bearer {creds['key']}"},
         )
@@ -93,17 +91,18 @@ def pull(
 
         # Log risk binding status. Each requirement carries a `risk_id`
         # prop that points to the IdentifiedRisk.
-        risks_seen = set()
-        for req in all_requirements:
-            for p in req.get("props", []) or []:
-                if p.get("name") == "risk_id" and p.get("value"):
-                    risks_seen.add(p["value"])
+        risks_seen = {
+            p["value"]
+            for req in all_requirements
+            for p in (req.get("props") or [])
+            if p.get("name") == "risk_id" and p.get("value")
+        }
         console.print(
             f"  Risks referenced by policy: {len(risks_seen)}"
         )
 
         # Also pull general config for display/verification
-        response = requests.get(
+        response = http_session.get(
             f"{SAAS_URL}/api/pull",
             headers={"Authorization": f"Bearer {creds['key']}"},
         )
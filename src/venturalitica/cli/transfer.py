@@ -1,24 +1,52 @@
+import hashlib
+import hmac
 import json
 import os
+import re
+import time
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
-import requests
 import typer
 
+from ..formatting import dumps_json
 from ..telemetry import track_command
 from .annex_iv import build_annex_iv_doc
-from .common import SAAS_URL, app, console, get_config_path
+from .common import (
+    SAAS_URL,
+    app,
+    console,
+    get_config_path,
+    http_session,
+    read_json,
+)
 
 VL_DIR = Path(".venturalitica")
 RUNS_DIR = VL_DIR / "runs"
 
+DEFAULT_SIGNING_KEY = b"default-local-key"
 
-def _latest_ar_path() -> Optional[Path]:
+# Legacy Annex_IV.md fields, matched in one pass over the whole file.
+_ANNEX_MD_RE = re.compile(r"(Intended Purpose|Hardware):([^\r\n]*)")
+
+
+@lru_cache(maxsize=8)
+def _hmac_prototype(key: bytes) -> hmac.HMAC:
+    """Keyed HMAC-SHA256 with the ipad/opad setup already done.
+
+    Callers must ``.copy()`` it before ``update()`` so the cached state
+    is never mutated.
+    """
+    return hmac.new(key, digestmod=hashlib.sha256)
+
+
+def _latest_ar_path(project_dir: Optional[Path] = None) -> Optional[Path]:
     """Find the OSCAL assessment-results doc of the most recent local run."""
-    if not RUNS_DIR.exists():
+    runs_dir = project_dir / RUNS_DIR if project_dir is not None else RUNS_DIR
+    if not runs_dir.exists():
         return None
-    runs = [p for p in RUNS_DIR.iterdir() if p.is_dir()]
+    runs = [p for p in runs_dir.iterdir() if p.is_dir()]
     if not runs:
         return None
     latest = max(runs, key=lambda p: p.stat().st_mtime)
@@ -26,29 +54,41 @@ def _latest_ar_path() -> Optional[Path]:
     return ar if ar.exists() else None
 
 
-def _create_bundle_payload() -> dict:
+def _create_bundle_payload(project_dir: Optional[Path] = None) -> dict:
     """
     Internal helper: Creates a signed compliance bundle payload.
+
+    Artifacts are resolved under *project_dir* (defaults to the current
+    working directory).
     """
     console.print("[bold blue]📦 Preparing compliance bundle...[/bold blue]")
 
+    project_dir = Path(project_dir) if project_dir is not None else Path.cwd()
+    vl_dir = project_dir / VL_DIR
+    results_path = vl_dir / "results.json"
+    annex_md_path = project_dir / "Annex_IV.md"
+
     # 1. Verification of Synchronized State
-    if not os.path.exists(".venturalitica/results.json"):
+    if not results_path.exists():
         console.print(
             "[bold red]Error:[/bold red] results.json not found. Run your audit/training first."
         )
         raise typer.Exit(code=1)
 
+    # Read once; both the Annex IV lookup and metric extraction use it.
+    results_data = read_json(results_path)
+
     # 2. Collect Artifacts Metadata (Shadow Artifacts)
     artifacts = []
 
     # Check MLflow
-    if os.getenv("MLFLOW_RUN_ID"):
+    mlflow_run_id = os.getenv("MLFLOW_RUN_ID")
+    if mlflow_run_id:
         artifacts.append(
             {
-                "name": f"MLflow Run: {os.getenv('MLFLOW_RUN_ID')}",
+                "name": f"MLflow Run: {mlflow_run_id}",
                 "type": "MODEL",
-                "uri": f"mlflow-run://{os.getenv('MLFLOW_RUN_ID')}",
+                "uri": f"mlflow-run://{mlflow_run_id}",
                 "context": "train",
                 "metadata": {"framework": "mlflow"},
             }
@@ -62,38 +102,29 @@ def _create_bundle_payload() -> dict:
     # is absent, so projects that predate the new CLI still send something.
     annex_iv: dict = {}
     legacy_md = False
-    if os.path.exists(".venturalitica/results.json"):
-        try:
-            with open(".venturalitica/results.json", "r") as f:
-                maybe = json.load(f)
-            if isinstance(maybe, dict) and isinstance(maybe.get("annex_iv"), dict):
-                annex_iv = maybe["annex_iv"]
-        except json.JSONDecodeError:
-            pass
-    if not annex_iv and os.path.exists("Annex_IV.md"):
+    if isinstance(results_data, dict) and isinstance(results_data.get("annex_iv"), dict):
+        annex_iv = results_data["annex_iv"]
+    if not annex_iv and annex_md_path.exists():
         legacy_md = True
-        with open("Annex_IV.md", "r") as f:
-            for line in f:
-                if "Intended Purpose:" in line:
-                    annex_iv["intended_purpose"] = line.split(":", 1)[1].strip()
-                elif "Hardware:" in line:
-                    annex_iv["hardware"] = line.split(":", 1)[1].strip()
+        annex_iv = {
+            m.group(1).lower().replace(" ", "_"): m.group(2).strip()
+            for m in _ANNEX_MD_RE.finditer(annex_md_path.read_text())
+        }
     if legacy_md and not annex_iv.get("generated_by"):
         annex_iv["generated_by"] = "legacy-annex-md-parser"
     if not annex_iv:
         console.print("[cyan]ℹ[/cyan] No Annex IV found — generating from OSCAL evidence...")
+        latest_ar = _latest_ar_path(project_dir)
         try:
-            annex_iv = build_annex_iv_doc()
+            annex_iv = build_annex_iv_doc(
+                run_dir=latest_ar.parent if latest_ar is not None else None
+            )
         except Exception as exc:  # noqa: BLE001
             console.print(f"[yellow]⚠[/yellow] Could not auto-generate Annex IV: {exc}")
 
     # Intelligent Metrics Extraction
     metrics = []
 
-    # 3. Load Results
-    with open(".venturalitica/results.json", "r") as f:
-        results_data = json.load(f)
-
     if isinstance(results_data, list):
         metrics = results_data
     elif isinstance(results_data, dict):
@@ -116,68 +147,67 @@ def _create_bundle_payload() -> dict:
             artifacts.extend(results_data["artifacts"])
 
     # 4. Auto-discover Audit Traces and Extract BOM
-    trace_dir = ".venturalitica"
+    trace_dir = vl_dir
     bom = {}
     latest_trace_time = 0
 
+    trace_entries = []
     if os.path.exists(trace_dir):
-        for f in os.listdir(trace_dir):
-            if f.startswith("trace_") and f.endswith(".json"):
-                try:
-                    with open(os.path.join(trace_dir, f), "r") as tf:
-                        trace_data = json.load(tf)
-                        # Extract BOM from trace (if present)
-                        # We prioritize the most recent trace's BOM
-                        trace_ts = trace_data.get(
-                            "timestamp_unix", 0
-                        )  # Assumes we add this
-                        if not trace_ts:
-                            # Fallback to file mtime if timestamp missing
-                            trace_ts = os.path.getmtime(os.path.join(trace_dir, f))
-
-                        if "bom" in trace_data:
-                            if trace_ts > latest_trace_time:
-                                bom = trace_data["bom"]
-                                latest_trace_time = trace_ts
-
-                        label = (
-                            trace_data.get("label")
-                            or trace_data.get("name")
-                            or "Audit Trace"
-                        )
-                        artifacts.append(
-                            {
-                                "name": label,
-                                "type": "CODE",
-                                "uri": f"trace://{f}",
-                                "context": "audit-trail",
-                                "metadata": trace_data,
-                            }
-                        )
-                except Exception:
-                    pass
+        # scandir's DirEntry caches the stat result, so the mtime fallback
+        # below costs no extra syscall per trace.
+        with os.scandir(trace_dir) as it:
+            trace_entries = [
+                e for e in it if e.name.startswith("trace_") and e.name.endswith(".json")
+            ]
+    for entry in trace_entries:
+        try:
+            trace_data = read_json(entry.path)
+            # Extract BOM from trace (if present)
+            # We prioritize the most recent trace's BOM
+            trace_ts = trace_data.get(
+                "timestamp_unix", 0
+            )  # Assumes we add this
+            if not trace_ts:
+                # Fallback to file mtime if timestamp missing
+                trace_ts = entry.stat().st_mtime
+
+            if "bom" in trace_data:
+                if trace_ts > latest_trace_time:
+                    bom = trace_data["bom"]
+                    latest_trace_time = trace_ts
+
+            label = (
+                trace_data.get("label")
+                or trace_data.get("name")
+                or "Audit Trace"
+            )
+            artifacts.append(
+                {
+                    "name": label,
+                    "type": "CODE",
+                    "uri": f"trace://{entry.name}",
+                    "context": "audit-trail",
+                    "metadata": trace_data,
+                }
+            )
+        except Exception:
+            pass
 
     # Fallback to local .venturalitica/bom.json if trace didn't have it (backward compat)
-    if not bom and os.path.exists(".venturalitica/bom.json"):
-        with open(".venturalitica/bom.json", "r") as f:
-            bom = json.load(f)
+    if not bom and (vl_dir / "bom.json").exists():
+        bom = read_json(vl_dir / "bom.json")
 
     # Cryptographic Signing (HMAC-SHA256)
-    import hashlib
-    import hmac
-    import time
-
     timestamp = time.time()
 
     # Load secret key
-    secret_key = b"default-local-key"  # Fallback
+    secret_key = DEFAULT_SIGNING_KEY  # Fallback
     creds_path = get_config_path("credentials.json")
     if os.path.exists(creds_path):
         try:
-            with open(creds_path, "r") as f:
-                creds = json.load(f)
-                if "key" in creds:
-                    secret_key = creds["key"].encode()
+            creds = read_json(creds_path)
+            if "key" in creds:
+                secret_key = creds["key"].encode()
         except Exception:
             pass
 
@@ -187,7 +217,9 @@ def _create_bundle_payload() -> dict:
         f"{json.dumps(metrics, sort_keys=True)}{timestamp}{bom_hash}".encode()
     )
 
-    signature = hmac.new(secret_key, sign_payload, hashlib.sha256).hexdigest()
+    signer = _hmac_prototype(secret_key).copy()
+    signer.update(sign_payload)
+    signature = signer.hexdigest()
 
     bundle_data = {
         "bundle": {
@@ -216,23 +248,28 @@ def push(
     treatment_id: Optional[str] = typer.Option(
         None, "--treatment-id", help="Risk Treatment ID to link this trace"
     ),
+    project_dir: Optional[Path] = typer.Option(
+        None, "--project-dir", help="Project root holding .venturalitica/ (defaults to cwd)"
+    ),
 ):
     """
     Pushes the compliance results and artifacts to the SaaS.
     """
     console.print("[bold blue]📤 Pushing to SaaS...[/bold blue]")
 
+    project_dir = Path(project_dir) if project_dir is not None else Path.cwd()
+    results_path = project_dir / VL_DIR / "results.json"
+
     creds_path = get_config_path("credentials.json")
     if not os.path.exists(creds_path):
         console.print("[bold red]Error:[/bold red] Not logged in.")
         raise typer.Exit(code=1)
 
-    with open(creds_path, "r") as f:
-        creds = json.load(f)
+    creds = read_json(creds_path)
 
     # OSCAL-native push: ship the `assessment-results.oscal.json`
     # produced by the monitor() run. The platform rejects any other shape.
-    ar_path = _latest_ar_path()
+    ar_path = _latest_ar_path(project_dir)
     if ar_path is None:
         console.print(
             "[bold red]No OSCAL assessment-results found.[/bold red] "
@@ -242,8 +279,7 @@ def push(
         raise typer.Exit(code=1)
 
     try:
-        with open(ar_path, "r") as f:
-            ar_doc = json.load(f)
+        ar_doc = read_json(ar_path)
     except Exception as e:
         console.print(f"[bold red]Failed to load AR doc {ar_path}:[/bold red] {e}")
         raise typer.Exit(code=1)
@@ -260,10 +296,9 @@ def push(
     # OSCAL-native rewrite), so this injection is the only path that lands
     # the doc on the platform side.
     annex_iv_payload: dict = {}
-    if os.path.exists(".venturalitica/results.json"):
+    if results_path.exists():
         try:
-            with open(".venturalitica/results.json", "r") as f:
-                maybe = json.load(f)
+            maybe = read_json(results_path)
             if isinstance(maybe, dict) and isinstance(maybe.get("annex_iv"), dict):
                 annex_iv_payload = maybe["annex_iv"]
         except json.JSONDecodeError:
@@ -308,8 +343,7 @@ def push(
     bom_doc: dict = {}
     if run_dir is not None and (run_dir / "bom.json").exists():
         try:
-            with open(run_dir / "bom.json", "r") as f:
-                maybe_bom = json.load(f)
+            maybe_bom = read_json(run_dir / "bom.json")
             if isinstance(maybe_bom, dict) and isinstance(maybe_bom.get("components"), list):
                 bom_doc = maybe_bom
         except (json.JSONDecodeError, OSError):
@@ -351,10 +385,13 @@ def push(
         payload["treatment_id"] = treatment_id
 
     try:
-        response = requests.post(
+        response = http_session.post(
             f"{SAAS_URL}/api/push",
-            headers={"Authorization": f"Bearer {creds['key']}"},
-            json=payload,
+            headers={
+                "Authorization": f"Bearer {creds['key']}",
+                "Content-Type": "application/json",
+            },
+            data=dumps_json(payload),
         )
         response.raise_for_status()
         data = response.json()
@@ -1,5 +1,6 @@
+import operator
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import IO, Any, Dict, List, Optional, Union
 
 import pandas as pd
 
@@ -8,6 +9,26 @@ from .models import ComplianceResult, InternalPolicy
 from .storage import BaseStorage, LocalFileSystemStorage
 
 
+def _metric_call_key(
+    metric_key: str, eval_context: Dict[str, Any], params: Dict[str, Any]
+) -> Optional[tuple]:
+    """Hashable identity of one metric invocation, or None if the kwargs can't be hashed."""
+    kwargs = {**eval_context, **params}
+    key = (
+        metric_key,
+        tuple(
+            sorted(
+                (k, tuple(v) if isinstance(v, list) else v) for k, v in kwargs.items()
+            )
+        ),
+    )
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
 class ComplianceBlockError(RuntimeError):
     """Raised when a control with enforcement_mode='block' fails.
 
@@ -25,7 +46,9 @@ class AssuranceValidator:
     ):
         import os
 
-        self.storage = storage or LocalFileSystemStorage()
+        # Default storage is only needed (and its directory only created) for
+        # path-based policies; see `_load_policy`.
+        self.storage = storage
         self.policy_source = policy
         self.policy: Optional[InternalPolicy] = None
 
@@ -40,6 +63,25 @@ class AssuranceValidator:
 
         self._load_policy()
 
+    @classmethod
+    def from_stream(
+        cls,
+        stream: Union[bytes, str, IO],
+        storage: Optional[BaseStorage] = None,
+        strict: bool = False,
+    ) -> "AssuranceValidator":
+        """Builds a validator from in-memory policy YAML (bytes, str or a readable stream).
+
+        Skips the filesystem entirely, which is handy for policies fetched over
+        the network or generated on the fly.
+        """
+        import yaml
+
+        from .loader import _YAML_LOADER, OSCALPolicyLoader
+
+        data = yaml.load(stream, Loader=_YAML_LOADER) or {}
+        return cls(OSCALPolicyLoader(data).load(), storage=storage, strict=strict)
+
     @property
     def controls(self):
         """Backward compatibility for existing tests."""
@@ -71,6 +113,8 @@ class AssuranceValidator:
             self.policy = loader.load()
         else:
             # File-based policy - use storage
+            if self.storage is None:
+                self.storage = LocalFileSystemStorage()
             self.policy = self.storage.get_policy(str(self.policy_source))
 
     def compute_and_evaluate(
@@ -102,12 +146,23 @@ class AssuranceValidator:
         if not isinstance(data, pd.DataFrame):
             raise ValueError("Data must be a pandas DataFrame")
 
+        # Column names snapshot for auto-binding: plain set membership instead
+        # of a pandas Index lookup for every (role, synonym) candidate.
+        columns = frozenset(data.columns)
+
+        # Resolve each in-phase control's metric function up front; unknown
+        # metrics stay in the list (as None) so they are reported in order.
+        registry_get = METRIC_REGISTRY.get
+        bound_controls = [
+            (ctrl, registry_get(ctrl.metric_key))
+            for ctrl in self.policy.controls
+            if self._control_matches_phase(ctrl, phase)
+        ]
+
         results = []
-        for ctrl in self.policy.controls:
-            if not self._control_matches_phase(ctrl, phase):
-                continue
+        metric_cache: Dict[tuple, tuple] = {}
+        for ctrl, calc_fn in bound_controls:
             metric_key = ctrl.metric_key
-            calc_fn = METRIC_REGISTRY.get(metric_key)
 
             if not calc_fn:
                 msg = f"No metric function registered for '{metric_key}' in control '{ctrl.id}'"
@@ -145,13 +200,13 @@ class AssuranceValidator:
 
                 # [PLG] Auto-Binding: Smart discovery based on variable synonyms
                 if not actual_col:
-                    if var in data.columns:
+                    if var in columns:
                         actual_col = var
                     else:
                         for cand in COLUMN_SYNONYMS.get(var, []) + COLUMN_SYNONYMS.get(
                             role, []
                         ):
-                            if cand in data.columns:
+                            if cand in columns:
                                 actual_col = cand
                                 break
 
@@ -200,14 +255,34 @@ class AssuranceValidator:
                     else:
                         resolved_params[k] = v
 
-                metric_result = calc_fn(data, **eval_context, **resolved_params)
+                # Controls sharing a metric and its bindings (e.g. a warn and a
+                # block threshold on the same score) compute it only once.
+                call_key = _metric_call_key(metric_key, eval_context, resolved_params)
+                cached = metric_cache.get(call_key) if call_key is not None else None
+                if cached is None:
+                    metric_result = calc_fn(data, **eval_context, **resolved_params)
 
-                # Support metric functions that return (value, metadata)
-                if isinstance(metric_result, tuple):
-                    metric_value, meta_data = metric_result
+                    # Support metric functions that return (value, metadata)
+                    if isinstance(metric_result, tuple):
+                        metric_value, meta_data = metric_result
+                    else:
+                        metric_value = metric_result
+                        meta_data = {}
+
+                    # Statistical reliability of `metric_value`: a percentile
+                    # bootstrap CI over the SAME in-memory df, recomputing the SAME
+                    # calc_fn (cheap, no retraining). Online — never persists a CSV.
+                    power = self._compute_power(
+                        data=data,
+                        calc_fn=calc_fn,
+                        eval_context=eval_context,
+                        resolved_params=resolved_params,
+                        metric_value=metric_value,
+                    )
+                    if call_key is not None:
+                        metric_cache[call_key] = (metric_value, meta_data, power)
                 else:
-                    metric_value = metric_result
-                    meta_data = {}
+                    metric_value, meta_data, power = cached
 
                 passed = self._check_condition(
                     metric_value, ctrl.operator, ctrl.threshold
@@ -217,17 +292,6 @@ class AssuranceValidator:
                 combined_metadata = dict(ctrl.metadata or {})
                 combined_metadata.update(meta_data or {})
 
-                # Statistical reliability of `metric_value`: a percentile
-                # bootstrap CI over the SAME in-memory df, recomputing the SAME
-                # calc_fn (cheap, no retraining). Online — never persists a CSV.
-                power = self._compute_power(
-                    data=data,
-                    calc_fn=calc_fn,
-                    eval_context=eval_context,
-                    resolved_params=resolved_params,
-                    metric_value=metric_value,
-                )
-
                 result = ComplianceResult(
                     control_id=ctrl.id,
                     description=ctrl.description,
@@ -238,7 +302,7 @@ class AssuranceValidator:
                     passed=passed,
                     severity=ctrl.severity,
                     metadata=combined_metadata,
-                    power=power,
+                    power=dict(power),
                 )
                 results.append(result)
                 self._apply_enforcement_mode(ctrl, result)
@@ -434,22 +498,32 @@ class AssuranceValidator:
                 file=sys.stderr,
             )
 
-    def _check_condition(self, actual: float, operator: str, threshold: float) -> bool:
-        """Helper to evaluate logical operators."""
-        ops = {
-            "<": lambda a, b: a < b,
-            "lt": lambda a, b: a < b,
-            ">": lambda a, b: a > b,
-            "gt": lambda a, b: a > b,
-            "<=": lambda a, b: a <= b,
-            "le": lambda a, b: a <= b,
-            "lte": lambda a, b: a <= b,
-            ">=": lambda a, b: a >= b,
-            "ge": lambda a, b: a >= b,
-            "gte": lambda a, b: a >= b,
-            "==": lambda a, b: a == b,
-            "eq": lambda a, b: a == b,
-            "!=": lambda a, b: a != b,
-            "ne": lambda a, b: a != b,
-        }
-        return ops.get(operator, lambda a, b: False)(actual, threshold)
+    # Comparison operators accepted in policies, symbolic and word forms.
+    # Built once at class creation rather than on every evaluation.
+    _OPS = {
+        "<": operator.lt,
+        "lt": operator.lt,
+        ">": operator.gt,
+        "gt": operator.gt,
+        "<=": operator.le,
+        "le": operator.le,
+        "lte": operator.le,
+        ">=": operator.ge,
+        "ge": operator.ge,
+        "gte": operator.ge,
+        "==": operator.eq,
+        "eq": operator.eq,
+        "!=": operator.ne,
+        "ne": operator.ne,
+    }
+
+    def _check_condition(self, actual: float, op: str, threshold: float) -> bool:
+        """Helper to evaluate logical operators; unknown operators never pass.
+
+        A NaN metric value never passes either, checked before dispatch so
+        that e.g. ``nan != threshold`` cannot count as a pass.
+        """
+        if actual != actual:  # NaN
+            return False
+        fn = self._OPS.get(op)
+        return False if fn is None else fn(actual, threshold)
@@ -98,12 +98,14 @@ def _run_local_scan(target_dir: str):
     """Scan the project directory to populate evidence for Phase 3."""
     from pathlib import Path
 
-    # 1. Evidence hash — SHA-256 of all .py files
+    # 1. Evidence hash — SHA-256 of all .py files. Excluded directories are
+    #    pruned during the walk instead of listing a whole virtualenv first.
     h = hashlib.sha256()
-    py_files = sorted(Path(target_dir).rglob("*.py"))
-    for pf in py_files:
-        if ".venv" in pf.parts or "__pycache__" in pf.parts:
-            continue
+    py_files = []
+    for root, dirs, files in os.walk(target_dir):
+        dirs[:] = [d for d in dirs if d not in (".venv", "__pycache__")]
+        py_files.extend(Path(root, f) for f in files if f.endswith(".py"))
+    for pf in sorted(py_files):
         try:
             h.update(pf.read_bytes())
         except OSError:
@@ -9,8 +9,6 @@ from pathlib import Path
 
 import yaml
 
-from venturalitica.metrics import METRIC_METADATA
-
 # Extended Metadata for Data Policies
 DATA_METRIC_METADATA = {
     "k_anonymity": {
@@ -42,9 +40,17 @@ DATA_METRIC_METADATA = {
 }
 
 
+def _model_metric_metadata():
+    """Model metric catalog, imported on first use: `venturalitica.metrics`
+    pulls in scikit-learn and would otherwise load with the dashboard."""
+    from venturalitica.metrics import METRIC_METADATA
+
+    return METRIC_METADATA
+
+
 def interpret_rule(metric_key, operator, threshold, is_data=False):
     """Generates a plain English interpretation of a risk control rule."""
-    meta = DATA_METRIC_METADATA.get(metric_key, {}) if is_data else METRIC_METADATA.get(metric_key, {})
+    meta = DATA_METRIC_METADATA.get(metric_key, {}) if is_data else _model_metric_metadata().get(metric_key, {})
     name = meta.get("name", metric_key)
 
     # Base interpretation templates
@@ -210,7 +216,7 @@ def render_policy_editor(target_dir):
     controls = policy.get("controls", [])
 
     # Metadata Source
-    active_metadata = DATA_METRIC_METADATA if is_data_policy else METRIC_METADATA
+    active_metadata = DATA_METRIC_METADATA if is_data_policy else _model_metric_metadata()
 
     # Sidebar
     with st.sidebar:
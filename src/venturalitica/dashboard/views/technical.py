@@ -13,6 +13,19 @@ from venturalitica.badges import generate_compliance_badge
 from venturalitica.dashboard.components.metrics import parse_bom_metrics
 
 
+def _load_emissions(path, mtime_ns, size):
+    """Read codecarbon's emissions.csv; `mtime_ns`/`size` only key the cache."""
+    import pandas as pd
+
+    return pd.read_csv(path)
+
+
+# Streamlit reruns the whole script on every widget interaction; only re-read
+# the CSV when the file changes. The test-time streamlit stub has no cache.
+if hasattr(st, "cache_data"):
+    _load_emissions = st.cache_data(show_spinner=False, max_entries=8)(_load_emissions)
+
+
 def render_technical_view(target_dir):
     st.header("Technical Integrity")
 
@@ -63,7 +76,11 @@ def render_technical_view(target_dir):
             sub_tabs = st.tabs(["Supply Chain", "Raw BOM"])
             with sub_tabs[0]:
                 if libs:
-                    lib_df = [{"Library": lib["name"], "Version": lib.get("version", "N/A")} for lib in libs]
+                    # Column-oriented: one list per column instead of a dict per row.
+                    lib_df = {
+                        "Library": [lib["name"] for lib in libs],
+                        "Version": [lib.get("version", "N/A") for lib in libs],
+                    }
                     st.dataframe(lib_df, use_container_width=True, hide_index=True)
             with sub_tabs[1]:
                 st.json(st.session_state["bom"], expanded=False)
@@ -72,10 +89,9 @@ def render_technical_view(target_dir):
         st.subheader("🍃 Sustainability Tracker")
         emissions_path = os.path.join(target_dir, "emissions.csv")
         if os.path.exists(emissions_path):
-            import pandas as pd
-
             try:
-                df = pd.read_csv(emissions_path)
+                stat = os.stat(emissions_path)
+                df = _load_emissions(emissions_path, stat.st_mtime_ns, stat.st_size)
                 last_run = df.iloc[-1]
                 st.metric("Total CO2 Emissions", f"{last_run['emissions'] * 1000:.4f} gCO2")
                 st.markdown(f"**Compute:** {last_run['cpu_model'] if 'cpu_model' in last_run else 'Cloud Instance'}")
@@ -13,6 +13,41 @@ import numpy as np
 
 from .core import ComplianceResult
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def loads_json(data: bytes):
+    """Parse JSON bytes, using orjson when installed.
+
+    orjson rejects the ``NaN``/``Infinity`` literals that ``json.dump`` writes
+    for non-finite metric values, so such input falls back to the stdlib parser.
+    Malformed input raises ``ValueError`` either way.
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+def load_json_file(path):
+    """Parse a JSON file, using orjson when installed (see ``loads_json``)."""
+    with open(path, "rb") as f:
+        return loads_json(f.read())
+
+
+def dumps_json(obj) -> bytes:
+    """Serialize a request body to UTF-8 JSON bytes, using orjson when installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(obj).encode("utf-8")
+
 
 class VenturalíticaJSONEncoder(json.JSONEncoder):
     """Encoder que maneja tipos complejos de numpy, pandas y datetime"""
@@ -1,5 +1,11 @@
+import copy
+import functools
+import hashlib
+import json
+import os
+import sys
 from pathlib import Path
-from typing import Any, Dict, List, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import yaml
 
@@ -25,12 +31,93 @@ PROFILE_PROPERTY_NAMES = frozenset({
 # `^(\p{L}|_)(\p{L}|\p{N}|[.\-_])*$`.
 _INPUT_PREFIX = "input."
 
+# libyaml-backed loader when PyYAML was built with it; same safe semantics,
+# several times faster than the pure-Python SafeLoader.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+# Opt-in on-disk cache of parsed policies, shared across processes (CLI runs,
+# CI jobs). Unset by default so nothing is written outside the user's control.
+_POLICY_CACHE_ENV = "VENTURALITICA_POLICY_CACHE_DIR"
+
+
+def _policy_cache_file(path: str, mtime_ns: int, size: int) -> Optional[str]:
+    """Return the JSON cache file for this policy version, or None if disabled."""
+    cache_dir = os.getenv(_POLICY_CACHE_ENV)
+    if not cache_dir:
+        return None
+    digest = hashlib.blake2b(
+        f"{path}\0{mtime_ns}\0{size}".encode(), digest_size=16
+    ).hexdigest()
+    return os.path.join(cache_dir, f"{digest}.json")
+
+
+def _write_policy_cache(cache_file: str, data: Any) -> None:
+    """Best-effort atomic write; skipped if JSON cannot represent `data` exactly."""
+    try:
+        encoded = json.dumps(data)
+        # YAML can yield dates, non-string keys or NaN that JSON would alter.
+        if json.loads(encoded) != data:
+            return
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        tmp = f"{cache_file}.{os.getpid()}.tmp"
+        with open(tmp, "w") as f:
+            f.write(encoded)
+        os.replace(tmp, cache_file)
+    except (OSError, TypeError, ValueError):
+        pass
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_policy_file(path: str, mtime_ns: int, size: int) -> Any:
+    """Parse a policy file once per (absolute path, mtime, size).
+
+    `mtime_ns` and `size` are only part of the cache key: rewriting the file
+    changes at least one of them (size catches rewrites within the mtime
+    granularity of coarse filesystems) and forces a re-parse. Callers must
+    not mutate the returned object.
+
+    With ``VENTURALITICA_POLICY_CACHE_DIR`` set, the parse is also stored there
+    as JSON under the same key, so later processes skip YAML parsing.
+    """
+    cache_file = _policy_cache_file(path, mtime_ns, size)
+    if cache_file is not None:
+        try:
+            with open(cache_file, "r") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            pass
+    with open(path, "r") as f:
+        data = yaml.load(f, Loader=_YAML_LOADER) or {}
+    if cache_file is not None:
+        _write_policy_cache(cache_file, data)
+    return data
+
 
 def _is_input_prop(name: str) -> bool:
     """Return True if a prop name encodes an input-binding slot."""
     return name.startswith(_INPUT_PREFIX)
 
 
+def _intern(value: Any) -> Any:
+    """Intern short, highly repeated control fields (severity, operator, metric key).
+
+    Every control of a large policy then shares one string object per distinct
+    value, and equality checks against them hit the identity fast path.
+    """
+    return sys.intern(value) if type(value) is str else value
+
+
+def _prop_value(value: Any) -> Any:
+    """Return a prop value that is safe to store on a control.
+
+    Parsed files are shared through the `_parse_policy_file` cache, so the
+    rare list/dict prop value is copied; scalars are immutable and returned
+    as-is. This keeps `load()` from having to deep-copy the whole document.
+    """
+    return copy.deepcopy(value) if isinstance(value, (list, dict)) else value
+
+
 def _input_slot(name: str) -> str:
     """Extract the slot name from an `input.<slot>` prop name."""
     if not name.startswith(_INPUT_PREFIX):
@@ -38,10 +125,36 @@ def _input_slot(name: str) -> str:
     return name[len(_INPUT_PREFIX):]
 
 
+_METRIC_CORE_PROPS = frozenset({"metric_key", "threshold", "operator"})
+
+
+def _split_metric_props(
+    props: Dict[str, Any],
+) -> Tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any]]:
+    """Split a metric's name->value props into (input_mapping, params, metadata).
+
+    Profile properties and severity are metadata; anything else that is not
+    an input binding or a core metric field is passed to the metric function.
+    """
+    input_mapping: Dict[str, Any] = {}
+    params: Dict[str, Any] = {}
+    metadata: Dict[str, Any] = {}
+    for k, v in props.items():
+        if _is_input_prop(k):
+            input_mapping[_input_slot(k)] = v
+        elif k in _METRIC_CORE_PROPS:
+            continue
+        elif k in PROFILE_PROPERTY_NAMES or k == "severity":
+            metadata[k] = v
+        else:
+            params[k] = v
+    return input_mapping, params, metadata
+
+
 class OSCALPolicyLoader:
-    def __init__(self, policy_source: Union[str, Path, Dict[str, Any]]):
-        """Initialize loader with either a file path or an in-memory dict."""
-        if isinstance(policy_source, dict):
+    def __init__(self, policy_source: Union[str, Path, Dict[str, Any], List[Any]]):
+        """Initialize loader with either a file path or already-parsed YAML (dict or flat list)."""
+        if isinstance(policy_source, (dict, list)):
             self.policy_dict = policy_source
             self.policy_path = None
         else:
@@ -58,9 +171,12 @@ class OSCALPolicyLoader:
             # Use in-memory dict
             data = self.policy_dict
         else:
-            # Load from file
-            with open(self.policy_path, "r") as f:
-                data = yaml.safe_load(f) or {}
+            # Load from file (parsed YAML is cached per path + mtime + size).
+            # Parsing below only reads `data`; mutable prop values are copied
+            # individually by `_prop_value`.
+            path = os.path.abspath(self.policy_path)
+            st = os.stat(path)
+            data = _parse_policy_file(path, st.st_mtime_ns, st.st_size)
 
         # Determine root object — canonical NIST OSCAL roots only.
         root_key = next(
@@ -94,7 +210,8 @@ class OSCALPolicyLoader:
         )
         policy = InternalPolicy(title=title)
 
-        # 1. Build Inventory of Metrics (from local-definitions or root)
+        # 1. Build Inventory of Metrics (from local-definitions or root), keyed
+        #    by uuid. Each item's props are split once here, not once per link.
         inventory = {}
         # Try finding inventory-items in local-definitions or at the root of the object
         local_defs = obj.get("local-definitions", {})
@@ -111,11 +228,12 @@ class OSCALPolicyLoader:
             if not item_uuid:
                 continue
             props = {
-                p["name"]: p["value"]
+                p["name"]: _prop_value(p["value"])
                 for p in item.get("props", [])
                 if "name" in p and "value" in p
             }
-            inventory[item_uuid] = props
+            if "metric_key" in props:
+                inventory[item_uuid] = (props, _split_metric_props(props))
 
         # 2. Process Control Implementations from the canonical NIST locations:
         #    - `component-definition.components[].control-implementations[]` (array)
@@ -158,7 +276,7 @@ class OSCALPolicyLoader:
         metadata: Dict[str, Any] = {}
         for p in req.get("props", []):
             name = p.get("name")
-            value = p.get("value")
+            value = _prop_value(p.get("value"))
             if name == "severity":
                 severity = value
                 metadata[name] = value
@@ -202,10 +320,10 @@ class OSCALPolicyLoader:
                 InternalControl(
                     id=control_id,
                     description=description or f"Control {control_id}",
-                    severity=severity,
-                    metric_key=direct_props["metric_key"],
+                    severity=_intern(severity),
+                    metric_key=_intern(direct_props["metric_key"]),
                     threshold=float(direct_props.get("threshold", 0.0)),
-                    operator=direct_props.get("operator", "=="),
+                    operator=_intern(direct_props.get("operator", "==")),
                     input_mapping=direct_props.get("input_mapping", {}),
                     params=direct_props.get("params", {}),
                     metadata=metadata,
@@ -216,73 +334,44 @@ class OSCALPolicyLoader:
         # Link hunting (Standard OSCAL - check explicit links that reference inventory items)
         for link in req.get("links", []):
             href = link.get("href", "")
-            if href.startswith("#"):
-                metric_uuid = href[1:]
-                if metric_uuid in inventory:
-                    m_def = inventory[metric_uuid]
-                    if "metric_key" in m_def:
-                        # Separate profile metadata from function params
-                        inventory_metadata = dict(metadata)
-                        params = {}
-                        for k, v in m_def.items():
-                            if _is_input_prop(k) or k in ("metric_key", "threshold", "operator"):
-                                continue
-                            if k in PROFILE_PROPERTY_NAMES or k == "severity":
-                                inventory_metadata[k] = v
-                            else:
-                                params[k] = v
-                        policy.controls.append(
-                            InternalControl(
-                                id=control_id,
-                                description=description or f"Control {control_id}",
-                                severity=severity,
-                                metric_key=m_def["metric_key"],
-                                threshold=float(m_def.get("threshold", 0.0)),
-                                operator=m_def.get("operator", "=="),
-                                input_mapping={
-                                    _input_slot(k): v
-                                    for k, v in m_def.items()
-                                    if _is_input_prop(k)
-                                },
-                                params=params,
-                                metadata=inventory_metadata,
-                            )
-                        )
+            entry = inventory.get(href[1:]) if href.startswith("#") else None
+            if entry is not None:
+                m_def, (input_mapping, params, item_metadata) = entry
+                policy.controls.append(
+                    InternalControl(
+                        id=control_id,
+                        description=description or f"Control {control_id}",
+                        severity=_intern(severity),
+                        metric_key=_intern(m_def["metric_key"]),
+                        threshold=float(m_def.get("threshold", 0.0)),
+                        operator=_intern(m_def.get("operator", "==")),
+                        input_mapping=dict(input_mapping),
+                        params=dict(params),
+                        metadata={**metadata, **item_metadata},
+                    )
+                )
 
     def _process_catalog_recursive(
         self, control: Dict[str, Any], policy: InternalPolicy
     ):
         """Recursively processes catalog controls looking for metric properties."""
         props = {
-            p["name"]: p["value"]
+            p["name"]: _prop_value(p["value"])
             for p in control.get("props", [])
             if "name" in p and "value" in p
         }
 
         if "metric_key" in props:
-            # Separate profile metadata from function params
-            catalog_metadata: Dict[str, Any] = {}
-            params: Dict[str, Any] = {}
-            for k, v in props.items():
-                if _is_input_prop(k) or k in ("metric_key", "threshold", "operator"):
-                    continue
-                if k in PROFILE_PROPERTY_NAMES or k == "severity":
-                    catalog_metadata[k] = v
-                else:
-                    params[k] = v
+            input_mapping, params, catalog_metadata = _split_metric_props(props)
             policy.controls.append(
                 InternalControl(
                     id=control.get("id", "unknown"),
                     description=control.get("title", control.get("id", "")),
-                    severity=props.get("severity", "low"),
-                    metric_key=props["metric_key"],
+                    severity=_intern(props.get("severity", "low")),
+                    metric_key=_intern(props["metric_key"]),
                     threshold=float(props.get("threshold", 0.0)),
-                    operator=props.get("operator", "=="),
-                    input_mapping={
-                        _input_slot(k): v
-                        for k, v in props.items()
-                        if _is_input_prop(k)
-                    },
+                    operator=_intern(props.get("operator", "==")),
+                    input_mapping=input_mapping,
                     params=params,
                     metadata=catalog_metadata,
                 )
@@ -300,10 +389,10 @@ class OSCALPolicyLoader:
                     InternalControl(
                         id=item["id"],
                         description=item.get("description", ""),
-                        severity=item.get("severity", "low"),
-                        metric_key=item["metric_key"],
+                        severity=_intern(item.get("severity", "low")),
+                        metric_key=_intern(item["metric_key"]),
                         threshold=float(item["threshold"]),
-                        operator=item["operator"],
+                        operator=_intern(item["operator"]),
                     )
                 )
         return policy
@@ -18,6 +18,8 @@ from typing import Any
 
 import yaml
 
+from ..loader import _YAML_LOADER
+
 _CATALOG_PATH = Path(__file__).parent / "catalog.yaml"
 
 
@@ -32,7 +34,7 @@ def _load_catalog() -> dict[str, dict[str, Any]]:
     if not _CATALOG_PATH.exists():
         return {}
     with _CATALOG_PATH.open("r", encoding="utf-8") as fh:
-        raw = yaml.safe_load(fh) or {}
+        raw = yaml.load(fh, Loader=_YAML_LOADER) or {}
     out: dict[str, dict[str, Any]] = {}
     for key, meta in raw.items():
         if not isinstance(meta, dict):
@@ -2,7 +2,7 @@ from dataclasses import dataclass, field
 from typing import Any, Dict, List
 
 
-@dataclass
+@dataclass(slots=True)
 class InternalControl:
     """Standardized representation of a assurance control."""
     id: str
@@ -15,13 +15,13 @@ class InternalControl:
     input_mapping: dict = field(default_factory=dict) # Role -> VirtualVarName
     params: dict = field(default_factory=dict)  # Additional params for metric functions (e.g., quasi_identifiers)
 
-@dataclass
+@dataclass(slots=True)
 class InternalPolicy:
     """Standardized representation of a assurance policy."""
     title: str
     controls: List[InternalControl] = field(default_factory=list)
 
-@dataclass
+@dataclass(slots=True)
 class ComplianceResult:
     """The result of evaluating a single control."""
     control_id: str
@@ -3,6 +3,8 @@ from typing import Any, Dict, List
 
 import yaml
 
+from .loader import _YAML_LOADER
+
 POLICY_SCHEMA = {
     "$schema": "http://json-schema.org/draft-07/schema#",
     "title": "Venturalitica Simplified OSCAL Policy",
@@ -43,7 +45,7 @@ class PolicyManager:
         """Loads and returns the policy as a dict."""
         if self.policy_path.exists():
             with open(self.policy_path, "r") as f:
-                data = yaml.safe_load(f) or {}
+                data = yaml.load(f, Loader=_YAML_LOADER) or {}
                 # Handle potential list-only legacy format
                 if isinstance(data, list):
                     data = {"title": "Legacy Policy", "controls": data}
@@ -1,7 +1,7 @@
-import json
 import os
 from typing import Any, Callable, Dict
 
+from ..formatting import load_json_file
 from .base import BaseProbe
 
 SIGNUP_URL = "https://app.venturalitica.ai/signup?ref=sdk"
@@ -27,8 +27,7 @@ class HandshakeProbe(BaseProbe):
             results_path = ".venturalitica/results.json"
             if not os.path.exists(results_path):
                 return 0
-            with open(results_path, "r") as f:
-                data = json.load(f)
+            data = load_json_file(results_path)
             if isinstance(data, list):
                 return sum(1 for r in data if not r.get("passed", True))
             return 0
@@ -1,10 +1,79 @@
 import json
 import os
+import textwrap
 import threading
 from dataclasses import asdict
 from datetime import datetime
 from pathlib import Path
-from typing import Any, List, Optional
+from typing import Any, Dict, List, Optional, Union
+
+from .formatting import loads_json
+
+# Files this process last validated or appended to, keyed by absolute path,
+# with the (inode, size, mtime) they had afterwards. A matching stat means
+# no other writer has touched the file since, so it need not be re-parsed.
+_VERIFIED_ARRAYS: Dict[str, tuple] = {}
+
+
+def _stat_key(st: os.stat_result) -> tuple:
+    return (st.st_ino, st.st_size, st.st_mtime_ns)
+
+
+def append_to_json_array(
+    path: Union[str, Path], records: List[Any], encoder=None
+) -> bool:
+    """Append records to an existing ``json.dump(..., indent=2)`` array file in place.
+
+    The first call for a file parses it once to confirm it is a well-formed
+    array. Later calls skip that parse while the file's inode, size and mtime
+    still match what this process last wrote, so repeated appends cost
+    O(new records) instead of re-reading and rewriting the whole file. The
+    bytes written match what a full ``indent=2`` rewrite would produce.
+
+    Returns False, without touching the file, when it is missing, is not a
+    top-level array, or does not parse (e.g. a torn concurrent write); callers
+    then fall back to a full rewrite.
+    """
+    key = os.path.abspath(path)
+    try:
+        f = open(path, "r+b")
+    except FileNotFoundError:
+        _VERIFIED_ARRAYS.pop(key, None)
+        return False
+    with f:
+        st = os.fstat(f.fileno())
+        size = st.st_size
+        if not f.read(64).lstrip().startswith(b"["):
+            return False
+        window = min(size, 64)
+        f.seek(size - window)
+        tail = f.read(window).rstrip()
+        head = tail[:-1].rstrip()
+        if not tail.endswith(b"]") or not head:
+            return False
+        if _VERIFIED_ARRAYS.get(key) != _stat_key(st):
+            # Changed outside this process (or never seen): the bracket check
+            # is blind to damage inside the array, so parse it once.
+            f.seek(0)
+            try:
+                if not isinstance(loads_json(f.read()), list):
+                    return False
+            except ValueError:
+                return False
+        if records:
+            body = ",\n".join(
+                textwrap.indent(json.dumps(r, indent=2, cls=encoder), "  ")
+                for r in records
+            )
+            f.seek(size - window + len(head))
+            f.truncate()
+            f.write(
+                (b"\n" if head.endswith(b"[") else b",\n") + body.encode() + b"\n]"
+            )
+            f.flush()
+            st = os.fstat(f.fileno())
+        _VERIFIED_ARRAYS[key] = _stat_key(st)
+    return True
 
 
 class GovernanceSession:
@@ -61,7 +130,10 @@ class GovernanceSession:
                 asdict(r) if hasattr(r, "__dataclass_fields__") else r for r in results
             ]
 
-            # Read existing if we are calling enforce multiple times in one monitor session
+            # Calling enforce multiple times in one monitor session appends
+            if append_to_json_array(self.results_file, data, encoder=encoder):
+                return
+
             existing = []
             if self.results_file.exists():
                 with open(self.results_file, "r") as f:
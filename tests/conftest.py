@@ -0,0 +1,64 @@
+import pytest
+from typer.testing import CliRunner
+
+from venturalitica.cli.common import console
+
+
+@pytest.fixture(autouse=True)
+def _isolated_cwd(tmp_path, monkeypatch):
+    """Run every test inside its own ``tmp_path``.
+
+    The SDK writes ``.venturalitica/`` (results cache, runs, BOM, traces)
+    relative to the cwd, so without this any test calling ``enforce()`` or
+    ``monitor()`` would write into the checkout and share that state with
+    every other test (and xdist worker).
+    """
+    monkeypatch.chdir(tmp_path)
+
+
+_MONITOR_PROBES = (
+    "CarbonProbe",
+    "HardwareProbe",
+    "IntegrityProbe",
+    "BOMProbe",
+    "ArtifactProbe",
+    "HandshakeProbe",
+    "TraceProbe",
+)
+
+
+@pytest.fixture
+def no_probes(monkeypatch):
+    """Turn every ``monitor()`` probe's ``start``/``stop`` into a no-op.
+
+    One ``monkeypatch.setattr`` per method instead of fourteen stacked
+    ``mock.patch`` contexts (and their MagicMocks) per test.
+    """
+    import venturalitica.probes as probes
+
+    def _noop(self, *args, **kwargs):
+        return None
+
+    for name in _MONITOR_PROBES:
+        cls = getattr(probes, name)
+        monkeypatch.setattr(cls, "start", _noop)
+        monkeypatch.setattr(cls, "stop", _noop)
+
+
+@pytest.fixture(scope="session")
+def runner():
+    """One stateless Typer ``CliRunner`` shared by every CLI test."""
+    return CliRunner()
+
+
+@pytest.fixture
+def silent_console():
+    """Drop CLI console output for tests that don't assert on it.
+
+    Shadows ``console.print`` with a plain no-op on the instance (cheaper
+    than ``mock.patch`` and skips Rich rendering entirely); deleting the
+    attribute afterwards restores the class method.
+    """
+    console.print = lambda *args, **kwargs: None
+    yield
+    del console.print
@@ -94,7 +94,8 @@ class TestComplianceBadge:
         """Invalid status should raise error or be handled gracefully"""
         try:
             generate_compliance_badge(
-                status="invalid", policy_name="loan", date="2026-01-22"
+                status="invalid", policy_name="loan", date="2026-01-22",
+                output_path=None,
             )
             # If it doesn't raise, it should return something
             assert True
@@ -311,6 +312,15 @@ class TestComplianceBadgeEdgeCases:
         assert "UNKNOWN" in content
         assert "#6c757d" in content  # gray
 
+    def test_none_output_path_returns_svg(self, tmp_path, monkeypatch):
+        """output_path=None returns the markup and writes nothing."""
+        monkeypatch.chdir(tmp_path)
+        result = generate_compliance_badge(status="passing", output_path=None)
+        assert isinstance(result, str)
+        assert result.startswith("<svg")
+        assert "PASSING" in result
+        assert list(tmp_path.iterdir()) == []
+
 
 class TestMetricBadgeEdgeCases:
     """Additional edge-case tests for generate_metric_badge."""
@@ -341,6 +351,16 @@ class TestMetricBadgeEdgeCases:
         assert "#28a745" in content
         assert "✓" in content
 
+    def test_none_output_path_returns_svg(self, tmp_path, monkeypatch):
+        """output_path=None returns the markup and writes nothing."""
+        monkeypatch.chdir(tmp_path)
+        result = generate_metric_badge(
+            metric_name="exact", value=0.05, threshold=0.10, output_path=None
+        )
+        assert isinstance(result, str)
+        assert "0.0500" in result
+        assert list(tmp_path.iterdir()) == []
+
 
 if __name__ == "__main__":
     # Run tests with: pytest test_badges.py -v
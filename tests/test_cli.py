@@ -1,14 +1,22 @@
 import json
 from unittest.mock import MagicMock, patch
 
-from typer.testing import CliRunner
+import responses
 
-from venturalitica.cli import app
+from venturalitica.cli import _main, app
+from venturalitica.cli.common import SAAS_URL, http_session
 
-runner = CliRunner()
+_CLI_AUTH_URL = f"{SAAS_URL}/api/cli-auth"
 
 
-def test_cli_ui_help():
+def test_cli_main_invokes_app():
+    """`python -m venturalitica.cli` delegates to the Typer app."""
+    with patch("venturalitica.cli.app") as mock_app:
+        _main()
+    mock_app.assert_called_once_with(prog_name="vl")
+
+
+def test_cli_ui_help(runner):
     result = runner.invoke(app, ["--help"])
     assert result.exit_code == 0
     assert "ui" in result.stdout
@@ -25,7 +33,7 @@ def _patch_streamlit_available(mp_ctx):
     )
 
 
-def test_cli_ui_keyboard_interrupt():
+def test_cli_ui_keyboard_interrupt(runner):
     # Patch narrowly on the dashboard module to avoid intercepting subprocess
     # calls from unrelated init code (e.g. `distro` inside telemetry).
     with _patch_streamlit_available(patch), patch(
@@ -35,7 +43,7 @@ def test_cli_ui_keyboard_interrupt():
     assert "Dashboard stopped" in result.stdout
 
 
-def test_cli_ui_exception():
+def test_cli_ui_exception(runner):
     with _patch_streamlit_available(patch), patch(
         "venturalitica.cli.dashboard.subprocess.run", side_effect=Exception("Launch fail")
     ):
@@ -47,7 +55,7 @@ def test_cli_ui_exception():
 # --- Merged from test_local_assistant.py ---
 
 
-def test_cli_ui_launch():
+def test_cli_ui_launch(runner):
     """Test CLI ui command invokes `<python> -m streamlit run <dashboard>`."""
     with _patch_streamlit_available(patch), patch(
         "venturalitica.cli.dashboard.subprocess.run"
@@ -68,7 +76,17 @@ def test_cli_ui_launch():
         assert "--server.address" in cmd
 
 
-def test_cli_ui_error_message():
+def test_cli_ui_reports_telemetry_after_dashboard_exits(runner):
+    """The CLI process outlives the dashboard, so track_command still fires."""
+    with _patch_streamlit_available(patch), patch(
+        "venturalitica.cli.dashboard.subprocess.run"
+    ), patch("venturalitica.telemetry.telemetry.capture") as capture:
+        runner.invoke(app, ["ui"])
+    events = [c.args for c in capture.call_args_list if c.args[0] == "cli_command_executed"]
+    assert [props["command"] for _, props in events] == ["ui"]
+
+
+def test_cli_ui_error_message(runner):
     """Test CLI ui command displays error on failure."""
     with _patch_streamlit_available(patch), patch(
         "venturalitica.cli.dashboard.subprocess.run", side_effect=Exception("Launch Error")
@@ -77,7 +95,7 @@ def test_cli_ui_error_message():
         assert "Failed to launch dashboard" in result.stdout
 
 
-def test_cli_ui_missing_dashboard_extra_emits_install_guidance():
+def test_cli_ui_missing_dashboard_extra_emits_install_guidance(runner):
     """When streamlit isn't installed, `vl ui` must print the
     `pip install 'venturalitica[dashboard]'` guidance and exit non-zero —
     rather than letting subprocess.run blow up with an opaque
@@ -92,6 +110,18 @@ def test_cli_ui_missing_dashboard_extra_emits_install_guidance():
     assert "venturalitica[dashboard]" in result.stdout
 
 
+# ===================================================================
+# Shared HTTP session
+# ===================================================================
+
+
+def test_http_session_pools_without_retrying():
+    """Keep-alive only; failed requests (incl. push POSTs) are not re-sent."""
+    for scheme in ("https://", "http://"):
+        adapter = http_session.get_adapter(f"{scheme}example.invalid")
+        assert adapter.max_retries.total == 0
+
+
 # ===================================================================
 # CLI auth: login command
 # ===================================================================
@@ -100,23 +130,19 @@ def test_cli_ui_missing_dashboard_extra_emits_install_guidance():
 class TestCliLogin:
     """Tests for the `login` CLI command (auth.py)."""
 
-    def test_login_success(self, tmp_path):
+    @responses.activate
+    def test_login_success(self, runner, tmp_path):
         """Successful login stores credentials."""
-        mock_resp = MagicMock()
-        mock_resp.raise_for_status = MagicMock()
-        mock_resp.json.return_value = {
-            "key": "sk-test-123",
-            "aiSystemName": "TestSystem",
-        }
+        responses.add(
+            responses.POST,
+            _CLI_AUTH_URL,
+            json={"key": "sk-test-123", "aiSystemName": "TestSystem"},
+            status=200,
+        )
 
         creds_path = str(tmp_path / "credentials.json")
 
-        with (
-            patch(
-                "venturalitica.cli.auth.requests.post", return_value=mock_resp
-            ) as mock_post,
-            patch("venturalitica.cli.auth.get_config_path", return_value=creds_path),
-        ):
+        with patch("venturalitica.cli.auth.get_config_path", return_value=creds_path):
             result = runner.invoke(app, ["login", "sys-abc"])
 
         assert result.exit_code == 0
@@ -129,11 +155,10 @@ class TestCliLogin:
         assert saved["key"] == "sk-test-123"
 
         # Verify the request was made correctly
-        mock_post.assert_called_once()
-        call_kwargs = mock_post.call_args
-        assert call_kwargs[1]["json"] == {"aiSystemId": "sys-abc"}
+        assert len(responses.calls) == 1
+        assert json.loads(responses.calls[0].request.body) == {"aiSystemId": "sys-abc"}
 
-    def test_login_pat_stores_canonical_payload(self, tmp_path):
+    def test_login_pat_stores_canonical_payload(self, runner, tmp_path):
         """`vl login-pat --key vl_pat_… --org X --system Y` writes a JSON
         payload that downstream push/pull readers expect."""
         creds_path = str(tmp_path / "credentials.json")
@@ -159,7 +184,7 @@ class TestCliLogin:
         assert saved["system"] == "spineguard-ai"
         assert saved["default_system"] == "spineguard-ai"
 
-    def test_login_pat_without_system_omits_default_system(self, tmp_path):
+    def test_login_pat_without_system_omits_default_system(self, runner, tmp_path):
         """When `--system` is omitted, the SaaS auto-derives target from
         token scopes — we shouldn't stamp a placeholder client-side."""
         creds_path = str(tmp_path / "credentials.json")
@@ -173,7 +198,7 @@ class TestCliLogin:
         assert "system" not in saved
         assert "default_system" not in saved
 
-    def test_login_pat_without_org_or_system_still_stores_key(self, tmp_path):
+    def test_login_pat_without_org_or_system_still_stores_key(self, runner, tmp_path):
         creds_path = str(tmp_path / "credentials.json")
         with patch("venturalitica.cli.auth.get_config_path", return_value=creds_path):
             result = runner.invoke(app, ["login-pat", "--key", "vl_pat_bare"])
@@ -182,7 +207,7 @@ class TestCliLogin:
             saved = json.load(f)
         assert saved == {"key": "vl_pat_bare", "kind": "pat"}
 
-    def test_login_pat_rejects_invalid_token_prefix(self, tmp_path):
+    def test_login_pat_rejects_invalid_token_prefix(self, runner, tmp_path):
         """A PAT that doesn't start with `vl_pat_` is a typo — fail fast
         before writing anything to disk."""
         creds_path = str(tmp_path / "credentials.json")
@@ -194,13 +219,15 @@ class TestCliLogin:
         import os as _os
         assert not _os.path.exists(creds_path)
 
-    def test_login_failure_http_error(self):
+    @responses.activate
+    def test_login_failure_http_error(self, runner):
         """Login failure (HTTP error) prints error and exits with code 1."""
-        with patch(
-            "venturalitica.cli.auth.requests.post",
-            side_effect=Exception("Connection refused"),
-        ):
-            result = runner.invoke(app, ["login", "sys-abc"])
+        responses.add(
+            responses.POST,
+            _CLI_AUTH_URL,
+            body=ConnectionError("Connection refused"),
+        )
+        result = runner.invoke(app, ["login", "sys-abc"])
 
         assert result.exit_code == 1
         assert "Login failed" in result.stdout
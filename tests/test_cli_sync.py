@@ -5,14 +5,20 @@ document on `/api/pull?format=oscal`.
 """
 from __future__ import annotations
 
+import json
+import os
 from typing import Optional
-from unittest.mock import MagicMock, patch
 
 import pytest
+import requests
+import responses
 import typer
 
+from venturalitica.cli.common import SAAS_URL, http_session
 from venturalitica.cli.sync import pull
 
+_PULL_URL = f"{SAAS_URL}/api/pull"
+
 
 def _requirement(uuid: str, *, target_type: str = "system", risk_id: Optional[str] = None):
     props = [
@@ -73,73 +79,71 @@ def _make_config():
     }
 
 
-def _run_pull_with_requirements(requirements):
-    """Helper: run pull() with mocked OSCAL containing given requirements."""
-    mock_creds = {"key": "test-key"}
-    oscal_data = _make_oscal(requirements)
-    config_data = _make_config()
-
-    m1 = MagicMock()
-    m1.json.return_value = oscal_data
-    m1.status_code = 200
+def _write_credentials(fs, creds=None):
+    """Materialise ~/.venturalitica/credentials.json on the fake filesystem."""
+    fs.create_file(
+        os.path.expanduser("~/.venturalitica/credentials.json"),
+        contents=json.dumps(creds or {"key": "test-key"}),
+    )
 
-    m2 = MagicMock()
-    m2.json.return_value = config_data
-    m2.status_code = 200
 
-    with patch("os.path.exists", return_value=True):
-        with patch("builtins.open", MagicMock()):
-            with patch("json.load", return_value=mock_creds):
-                with patch("requests.get", side_effect=[m1, m2]):
-                    with patch("yaml.dump"):
-                        with patch("json.dump"):
-                            with patch("os.makedirs"):
-                                pull()
+@responses.activate
+def _run_pull_with_requirements(fs, requirements):
+    """Helper: run pull() with mocked OSCAL containing given requirements."""
+    _write_credentials(fs)
+    # Registered twice on the same URL: responses replays them in order,
+    # first the ?format=oscal plan, then the general config.
+    responses.add(responses.GET, _PULL_URL, json=_make_oscal(requirements))
+    responses.add(responses.GET, _PULL_URL, json=_make_config())
+    pull()
 
 
-def test_sync_pull_command_basic():
+def test_sync_pull_command_basic(fs):
     # 1. Test no login
-    with patch("os.path.exists", return_value=False):
-        with pytest.raises(typer.Exit):
-            pull()
+    with pytest.raises(typer.Exit):
+        pull()
 
     # 2. Test successful pull with empty plan
-    _run_pull_with_requirements([])
+    _run_pull_with_requirements(fs, [])
+    assert os.path.exists("assessment_plan.oscal.yaml")
+    assert os.path.exists(".venturalitica/policy.oscal.json")
+    assert os.path.exists(".venturalitica/config.json")
 
 
-def test_risk_bound_in_model_policy():
+def test_risk_bound_in_model_policy(fs):
     """Requirement targeting the system (model) carries a risk_id prop."""
     reqs = [_requirement("req-001", target_type="system", risk_id="risk-001")]
-    _run_pull_with_requirements(reqs)
+    _run_pull_with_requirements(fs, reqs)
 
 
-def test_risk_bound_in_data_policy():
+def test_risk_bound_in_data_policy(fs):
     """Requirement targeting the dataset carries a risk_id prop."""
     reqs = [_requirement("req-002", target_type="dataset", risk_id="risk-002")]
-    _run_pull_with_requirements(reqs)
+    _run_pull_with_requirements(fs, reqs)
 
 
-def test_risk_unbound():
+def test_risk_unbound(fs):
     """Requirement without a risk_id prop is still emitted."""
     reqs = [_requirement("req-999", target_type="system")]
-    _run_pull_with_requirements(reqs)
+    _run_pull_with_requirements(fs, reqs)
 
 
-def test_multiple_risks_mixed_binding():
+def test_multiple_risks_mixed_binding(fs, capsys):
     """Multiple requirements: bound system + unbound dataset."""
     reqs = [
         _requirement("req-1", target_type="system", risk_id="r1"),
         _requirement("req-2", target_type="dataset"),
+        _requirement("req-3", target_type="dataset", risk_id="r1"),
     ]
-    _run_pull_with_requirements(reqs)
+    _run_pull_with_requirements(fs, reqs)
+    assert "Risks referenced by policy: 1" in capsys.readouterr().out
 
 
-def test_pull_network_error_exits():
+def test_pull_network_error_exits(fs, mocker):
     """Exception during pull raises typer.Exit."""
-    mock_creds = {"key": "test-key"}
-    with patch("os.path.exists", return_value=True):
-        with patch("builtins.open", MagicMock()):
-            with patch("json.load", return_value=mock_creds):
-                with patch("requests.get", side_effect=Exception("Connection refused")):
-                    with pytest.raises(typer.Exit):
-                        pull()
+    _write_credentials(fs)
+    mocker.patch.object(
+        http_session, "get", side_effect=requests.ConnectionError("Connection refused")
+    )
+    with pytest.raises(typer.Exit):
+        pull()
@@ -1,16 +1,30 @@
 import json
 import os
-from unittest.mock import MagicMock, patch
+import shutil
+from unittest.mock import patch
 
 import pytest
+import responses
 from click.exceptions import Exit as ClickExit
 
+from venturalitica.cli.common import SAAS_URL
 from venturalitica.cli.transfer import _create_bundle_payload, push
 
+_PUSH_URL = f"{SAAS_URL}/api/push"
+
+# None of these tests assert on console output.
+pytestmark = pytest.mark.usefixtures("silent_console")
+
 # ---------------------------------------------------------------------------
 # Helper: set up a minimal project directory and return config dir
 # ---------------------------------------------------------------------------
 
+_DEFAULT_RESULTS: list = []
+_DEFAULT_CREDENTIALS = {"key": "k"}
+# Pre-serialised forms of the shapes most tests use, written verbatim.
+_DEFAULT_RESULTS_BYTES = json.dumps(_DEFAULT_RESULTS).encode()
+_DEFAULT_CREDENTIALS_BYTES = json.dumps(_DEFAULT_CREDENTIALS).encode()
+
 
 def _synthetic_assessment_results() -> dict:
     """Minimal OSCAL Assessment Results doc for push tests."""
@@ -51,7 +65,9 @@ def _setup_project(
     vent_dir = tmp_path / ".venturalitica"
     vent_dir.mkdir(parents=True, exist_ok=True)
 
-    if results_data is not None:
+    if results_data == _DEFAULT_RESULTS:
+        (vent_dir / "results.json").write_bytes(_DEFAULT_RESULTS_BYTES)
+    elif results_data is not None:
         (vent_dir / "results.json").write_text(json.dumps(results_data))
 
     if traces:
@@ -77,44 +93,63 @@ def _setup_project(
     config_dir = tmp_path / ".venturalitica_config"
     config_dir.mkdir(parents=True, exist_ok=True)
 
-    if credentials is not None:
+    if credentials == _DEFAULT_CREDENTIALS:
+        (config_dir / "credentials.json").write_bytes(_DEFAULT_CREDENTIALS_BYTES)
+    elif credentials is not None:
         (config_dir / "credentials.json").write_text(json.dumps(credentials))
 
     return config_dir
 
 
+@pytest.fixture(scope="session")
+def project_template(tmp_path_factory):
+    """Canonical project skeleton (empty results + default credentials),
+    built once per session and copied into each test by ``project``."""
+    root = tmp_path_factory.mktemp("project_template")
+    vent_dir = root / ".venturalitica"
+    vent_dir.mkdir()
+    (vent_dir / "results.json").write_bytes(_DEFAULT_RESULTS_BYTES)
+    config_dir = root / ".venturalitica_config"
+    config_dir.mkdir()
+    (config_dir / "credentials.json").write_bytes(_DEFAULT_CREDENTIALS_BYTES)
+    return root
+
+
+@pytest.fixture
+def project(tmp_path, project_template):
+    """Per-test copy of ``project_template``; tests overwrite only what they vary."""
+    shutil.copytree(project_template, tmp_path, dirs_exist_ok=True)
+    return tmp_path
+
+
 # ===================================================================
 # EXISTING TEST (preserved)
 # ===================================================================
 
 
 def test_transfer_bundle_payload(tmp_path):
-    curr = os.getcwd()
-    try:
-        os.chdir(tmp_path)
-        os.makedirs(".venturalitica", exist_ok=True)
+    vent_dir = tmp_path / ".venturalitica"
+    os.makedirs(vent_dir, exist_ok=True)
 
-        with open(".venturalitica/results.json", "w") as f:
-            json.dump([{"passed": True, "metric_key": "accuracy"}], f)
+    with open(vent_dir / "results.json", "w") as f:
+        json.dump([{"passed": True, "metric_key": "accuracy"}], f)
 
-        with open(".venturalitica/trace_123.json", "w") as f:
-            json.dump({"bom": {"components": []}, "name": "Test Trace"}, f)
+    with open(vent_dir / "trace_123.json", "w") as f:
+        json.dump({"bom": {"components": []}, "name": "Test Trace"}, f)
 
-        config_dir = tmp_path / ".venturalitica_config"
-        os.makedirs(config_dir, exist_ok=True)
-        with patch(
-            "venturalitica.cli.transfer.get_config_path",
-            return_value=str(config_dir / "credentials.json"),
-        ):
-            with open(config_dir / "credentials.json", "w") as f:
-                json.dump({"key": "test_key"}, f)
+    config_dir = tmp_path / ".venturalitica_config"
+    os.makedirs(config_dir, exist_ok=True)
+    with patch(
+        "venturalitica.cli.transfer.get_config_path",
+        return_value=str(config_dir / "credentials.json"),
+    ):
+        with open(config_dir / "credentials.json", "w") as f:
+            json.dump({"key": "test_key"}, f)
 
-            payload = _create_bundle_payload()
-            assert "bundle" in payload
-            assert "metrics" in payload
-            assert len(payload["metrics"]) == 1
-    finally:
-        os.chdir(curr)
+        payload = _create_bundle_payload(project_dir=tmp_path)
+        assert "bundle" in payload
+        assert "metrics" in payload
+        assert len(payload["metrics"]) == 1
 
 
 # ===================================================================
@@ -126,101 +161,78 @@ class TestCreateBundlePayloadMissingResults:
     """results.json not found -> typer.Exit(1)."""
 
     def test_missing_results_json(self, tmp_path):
-        curr = os.getcwd()
-        try:
-            os.chdir(tmp_path)
-            os.makedirs(".venturalitica", exist_ok=True)
-            # No results.json created
-            with pytest.raises((SystemExit, ClickExit)):
-                _create_bundle_payload()
-        finally:
-            os.chdir(curr)
+        os.makedirs(tmp_path / ".venturalitica", exist_ok=True)
+        # No results.json created
+        with pytest.raises((SystemExit, ClickExit)):
+            _create_bundle_payload(project_dir=tmp_path)
 
 
 class TestCreateBundlePayloadMLflow:
     """MLflow env detection (MLFLOW_RUN_ID set)."""
 
-    def test_mlflow_env_detection(self, tmp_path, monkeypatch):
+    def test_mlflow_env_detection(self, project, monkeypatch):
         monkeypatch.setenv("MLFLOW_RUN_ID", "run-42")
-        curr = os.getcwd()
-        try:
-            os.chdir(tmp_path)
-            config_dir = _setup_project(
-                tmp_path,
-                results_data=[{"metric_key": "a"}],
-                credentials={"key": "k"},
-            )
-            with patch(
-                "venturalitica.cli.transfer.get_config_path",
-                return_value=str(config_dir / "credentials.json"),
-            ):
-                payload = _create_bundle_payload()
-            mlflow_arts = [
-                a
-                for a in payload["artifacts"]
-                if a.get("metadata", {}).get("framework") == "mlflow"
-            ]
-            assert len(mlflow_arts) == 1
-            assert "run-42" in mlflow_arts[0]["uri"]
-        finally:
-            os.chdir(curr)
+        config_dir = _setup_project(
+            project,
+            results_data=[{"metric_key": "a"}],
+        )
+        with patch(
+            "venturalitica.cli.transfer.get_config_path",
+            return_value=str(config_dir / "credentials.json"),
+        ):
+            payload = _create_bundle_payload(project_dir=project)
+        mlflow_arts = [
+            a
+            for a in payload["artifacts"]
+            if a.get("metadata", {}).get("framework") == "mlflow"
+        ]
+        assert len(mlflow_arts) == 1
+        assert "run-42" in mlflow_arts[0]["uri"]
 
 
 class TestCreateBundlePayloadAnnexIV:
     """Annex IV parsing from file."""
 
-    def test_annex_iv_parsing(self, tmp_path):
-        curr = os.getcwd()
-        try:
-            os.chdir(tmp_path)
-            config_dir = _setup_project(
-                tmp_path,
-                results_data=[],
-                credentials={"key": "k"},
-                annex_iv_lines=[
-                    "# Annex IV",
-                    "Intended Purpose: Credit scoring",
-                    "Hardware: GPU server",
-                ],
-            )
-            with patch(
-                "venturalitica.cli.transfer.get_config_path",
-                return_value=str(config_dir / "credentials.json"),
-            ):
-                payload = _create_bundle_payload()
-            assert payload["bundle"]["annex_iv"]["intended_purpose"] == "Credit scoring"
-            assert payload["bundle"]["annex_iv"]["hardware"] == "GPU server"
-        finally:
-            os.chdir(curr)
+    def test_annex_iv_parsing(self, project):
+        config_dir = _setup_project(
+            project,
+            annex_iv_lines=[
+                "# Annex IV",
+                "Intended Purpose: Credit scoring",
+                "Hardware: GPU server",
+            ],
+        )
+        with patch(
+            "venturalitica.cli.transfer.get_config_path",
+            return_value=str(config_dir / "credentials.json"),
+        ):
+            payload = _create_bundle_payload(project_dir=project)
+        assert payload["bundle"]["annex_iv"]["intended_purpose"] == "Credit scoring"
+        assert payload["bundle"]["annex_iv"]["hardware"] == "GPU server"
 
 
 class TestCreateBundlePayloadDictResults:
     """Dict-shaped results with various key patterns."""
 
-    def _run(self, tmp_path, results_data, credentials=None):
-        curr = os.getcwd()
-        try:
-            os.chdir(tmp_path)
-            config_dir = _setup_project(
-                tmp_path,
-                results_data=results_data,
-                credentials=credentials or {"key": "k"},
-            )
-            with patch(
-                "venturalitica.cli.transfer.get_config_path",
-                return_value=str(config_dir / "credentials.json"),
-            ):
-                return _create_bundle_payload()
-        finally:
-            os.chdir(curr)
-
-    def test_metrics_key(self, tmp_path):
-        payload = self._run(tmp_path, {"metrics": [{"m": 1}]})
+    def _run(self, project, results_data, credentials=None):
+        config_dir = _setup_project(
+            project,
+            results_data=results_data,
+            credentials=credentials,
+        )
+        with patch(
+            "venturalitica.cli.transfer.get_config_path",
+            return_value=str(config_dir / "credentials.json"),
+        ):
+            return _create_bundle_payload(project_dir=project)
+
+    def test_metrics_key(self, project):
+        payload = self._run(project, {"metrics": [{"m": 1}]})
         assert payload["metrics"] == [{"m": 1}]
 
-    def test_pre_post_metrics(self, tmp_path):
+    def test_pre_post_metrics(self, project):
         payload = self._run(
-            tmp_path,
+            project,
             {
                 "pre_metrics": [{"m": "pre"}],
                 "post_metrics": [{"m": "post"}],
@@ -229,9 +241,9 @@ class TestCreateBundlePayloadDictResults:
         assert {"m": "pre"} in payload["metrics"]
         assert {"m": "post"} in payload["metrics"]
 
-    def test_artifacts_key(self, tmp_path):
+    def test_artifacts_key(self, project):
         payload = self._run(
-            tmp_path,
+            project,
             {
                 "metrics": [],
                 "artifacts": [{"name": "model.pkl", "type": "MODEL"}],
@@ -240,170 +252,183 @@ class TestCreateBundlePayloadDictResults:
         assert any(a["name"] == "model.pkl" for a in payload["artifacts"])
 
 
+class TestNonFiniteResults:
+    """results.json as written by ``enforce()`` for a NaN metric."""
+
+    _RESULTS = {
+        "metrics": [{"control_id": "acc", "actual_value": float("nan")}],
+        "annex_iv": {"intended_purpose": "Credit scoring"},
+    }
+
+    def test_bundle_parses_nan(self, project):
+        config_dir = _setup_project(project, results_data=self._RESULTS)
+        assert b"NaN" in (project / ".venturalitica" / "results.json").read_bytes()
+        with patch(
+            "venturalitica.cli.transfer.get_config_path",
+            return_value=str(config_dir / "credentials.json"),
+        ):
+            payload = _create_bundle_payload(project_dir=project)
+        assert payload["metrics"][0]["control_id"] == "acc"
+        assert payload["bundle"]["annex_iv"]["intended_purpose"] == "Credit scoring"
+
+    @responses.activate
+    def test_push_keeps_annex_iv(self, project):
+        config_dir = _setup_project(
+            project, results_data=self._RESULTS, assessment_results=True
+        )
+        responses.add(responses.POST, _PUSH_URL, json={"job_id": "j-1"}, status=200)
+        with patch(
+            "venturalitica.cli.transfer.get_config_path",
+            return_value=str(config_dir / "credentials.json"),
+        ):
+            push(external_run_url=None, treatment_id=None, project_dir=project)
+
+        sent = json.loads(responses.calls[0].request.body)
+        resources = sent["assessment_results"]["assessment-results"]["back-matter"]["resources"]
+        assert [r["props"] for r in resources] == [[{"name": "class", "value": "annex-iv"}]]
+
+
 class TestCreateBundlePayloadTraces:
     """Trace auto-discovery, BOM from trace, mtime fallback."""
 
-    def test_trace_with_bom_and_timestamp(self, tmp_path):
-        curr = os.getcwd()
-        try:
-            os.chdir(tmp_path)
-            config_dir = _setup_project(
-                tmp_path,
-                results_data=[],
-                credentials={"key": "k"},
-                traces={
-                    "trace_old.json": {
-                        "timestamp_unix": 100,
-                        "bom": {"old": True},
-                        "label": "Old Trace",
-                    },
-                    "trace_new.json": {
-                        "timestamp_unix": 999,
-                        "bom": {"new": True},
-                        "name": "New Trace",
-                    },
+    def test_trace_with_bom_and_timestamp(self, project):
+        config_dir = _setup_project(
+            project,
+            traces={
+                "trace_old.json": {
+                    "timestamp_unix": 100,
+                    "bom": {"old": True},
+                    "label": "Old Trace",
                 },
-            )
-            with patch(
-                "venturalitica.cli.transfer.get_config_path",
-                return_value=str(config_dir / "credentials.json"),
-            ):
-                payload = _create_bundle_payload()
-            # BOM should come from the most recent trace (timestamp_unix=999)
-            assert payload["bom"] == {"new": True}
-            # Both traces should appear as artifacts
-            trace_names = [a["name"] for a in payload["artifacts"]]
-            assert "Old Trace" in trace_names
-            assert "New Trace" in trace_names
-        finally:
-            os.chdir(curr)
-
-    def test_trace_without_timestamp_mtime_fallback(self, tmp_path):
-        """When trace has no timestamp_unix, file mtime is used."""
-        curr = os.getcwd()
-        try:
-            os.chdir(tmp_path)
-            config_dir = _setup_project(
-                tmp_path,
-                results_data=[],
-                credentials={"key": "k"},
-                traces={
-                    "trace_a.json": {"bom": {"a": True}, "name": "A"},
+                "trace_new.json": {
+                    "timestamp_unix": 999,
+                    "bom": {"new": True},
+                    "name": "New Trace",
                 },
-            )
-            with patch(
-                "venturalitica.cli.transfer.get_config_path",
-                return_value=str(config_dir / "credentials.json"),
-            ):
-                payload = _create_bundle_payload()
-            # BOM should be picked up despite no timestamp_unix
-            assert payload["bom"] == {"a": True}
-        finally:
-            os.chdir(curr)
-
-    def test_trace_invalid_json_skipped(self, tmp_path):
+            },
+        )
+        with patch(
+            "venturalitica.cli.transfer.get_config_path",
+            return_value=str(config_dir / "credentials.json"),
+        ):
+            payload = _create_bundle_payload(project_dir=project)
+        # BOM should come from the most recent trace (timestamp_unix=999)
+        assert payload["bom"] == {"new": True}
+        # Both traces should appear as artifacts
+        trace_names = [a["name"] for a in payload["artifacts"]]
+        assert "Old Trace" in trace_names
+        assert "New Trace" in trace_names
+
+    def test_trace_without_timestamp_mtime_fallback(self, project):
+        """When trace has no timestamp_unix, file mtime is used."""
+        config_dir = _setup_project(
+            project,
+            traces={
+                "trace_a.json": {"bom": {"a": True}, "name": "A"},
+            },
+        )
+        with patch(
+            "venturalitica.cli.transfer.get_config_path",
+            return_value=str(config_dir / "credentials.json"),
+        ):
+            payload = _create_bundle_payload(project_dir=project)
+        # BOM should be picked up despite no timestamp_unix
+        assert payload["bom"] == {"a": True}
+
+    def test_trace_invalid_json_skipped(self, project):
         """Malformed trace files are silently skipped."""
-        curr = os.getcwd()
-        try:
-            os.chdir(tmp_path)
-            vent_dir = tmp_path / ".venturalitica"
-            vent_dir.mkdir(parents=True, exist_ok=True)
-            (vent_dir / "results.json").write_text("[]")
-            (vent_dir / "trace_bad.json").write_text("NOT-JSON!!!")
-            config_dir = _setup_project(
-                tmp_path,
-                credentials={"key": "k"},
-            )
-            with patch(
-                "venturalitica.cli.transfer.get_config_path",
-                return_value=str(config_dir / "credentials.json"),
-            ):
-                payload = _create_bundle_payload()
-            # Should succeed; bad trace is skipped
-            assert payload["bom"] == {}
-        finally:
-            os.chdir(curr)
+        (project / ".venturalitica" / "trace_bad.json").write_text("NOT-JSON!!!")
+        config_dir = project / ".venturalitica_config"
+        with patch(
+            "venturalitica.cli.transfer.get_config_path",
+            return_value=str(config_dir / "credentials.json"),
+        ):
+            payload = _create_bundle_payload(project_dir=project)
+        # Should succeed; bad trace is skipped
+        assert payload["bom"] == {}
 
 
 class TestCreateBundlePayloadBOMFallback:
     """BOM fallback to bom.json when traces have no BOM."""
 
-    def test_bom_json_fallback(self, tmp_path):
-        curr = os.getcwd()
-        try:
-            os.chdir(tmp_path)
-            config_dir = _setup_project(
-                tmp_path,
-                results_data=[],
-                credentials={"key": "k"},
-                bom={"fallback": True},
-                traces={"trace_no_bom.json": {"name": "NoBom"}},
-            )
-            with patch(
-                "venturalitica.cli.transfer.get_config_path",
-                return_value=str(config_dir / "credentials.json"),
-            ):
-                payload = _create_bundle_payload()
-            assert payload["bom"] == {"fallback": True}
-        finally:
-            os.chdir(curr)
+    def test_bom_json_fallback(self, project):
+        config_dir = _setup_project(
+            project,
+            bom={"fallback": True},
+            traces={"trace_no_bom.json": {"name": "NoBom"}},
+        )
+        with patch(
+            "venturalitica.cli.transfer.get_config_path",
+            return_value=str(config_dir / "credentials.json"),
+        ):
+            payload = _create_bundle_payload(project_dir=project)
+        assert payload["bom"] == {"fallback": True}
 
 
 class TestCreateBundlePayloadHMAC:
     """HMAC signing with credentials and without."""
 
-    def test_hmac_with_credentials(self, tmp_path):
-        curr = os.getcwd()
-        try:
-            os.chdir(tmp_path)
-            config_dir = _setup_project(
-                tmp_path,
-                results_data=[],
-                credentials={"key": "my-secret"},
-            )
-            with patch(
-                "venturalitica.cli.transfer.get_config_path",
-                return_value=str(config_dir / "credentials.json"),
-            ):
-                payload = _create_bundle_payload()
-            assert payload["bundle"]["signature"]
-            assert payload["bundle"]["signature_type"] == "HMAC-SHA256"
-        finally:
-            os.chdir(curr)
-
-    def test_hmac_without_credentials(self, tmp_path):
+    def test_hmac_with_credentials(self, project):
+        config_dir = _setup_project(
+            project,
+            credentials={"key": "my-secret"},
+        )
+        with patch(
+            "venturalitica.cli.transfer.get_config_path",
+            return_value=str(config_dir / "credentials.json"),
+        ):
+            payload = _create_bundle_payload(project_dir=project)
+        assert payload["bundle"]["signature"]
+        assert payload["bundle"]["signature_type"] == "HMAC-SHA256"
+
+    def test_hmac_signature_is_reproducible(self, project):
+        """Signature matches a fresh HMAC over the documented payload, even
+        when the cached keyed prototype is reused across bundles."""
+        import hashlib
+        import hmac
+
+        config_dir = _setup_project(
+            project,
+            results_data=[{"m": 1}],
+            credentials={"key": "my-secret"},
+        )
+        with patch(
+            "venturalitica.cli.transfer.get_config_path",
+            return_value=str(config_dir / "credentials.json"),
+        ):
+            _create_bundle_payload(project_dir=project)
+            payload = _create_bundle_payload(project_dir=project)
+        bom_hash = hashlib.sha256(
+            json.dumps(payload["bom"], sort_keys=True).encode()
+        ).hexdigest()
+        signed = (
+            f"{json.dumps(payload['metrics'], sort_keys=True)}"
+            f"{payload['bundle']['timestamp']}{bom_hash}"
+        ).encode()
+        expected = hmac.new(b"my-secret", signed, hashlib.sha256).hexdigest()
+        assert payload["bundle"]["signature"] == expected
+
+    def test_hmac_without_credentials(self, project):
         """Default key used when credentials file does not exist."""
-        curr = os.getcwd()
-        try:
-            os.chdir(tmp_path)
-            _setup_project(tmp_path, results_data=[])
-            # Point to a path that does NOT exist
-            fake_creds = str(tmp_path / "nonexistent" / "credentials.json")
-            with patch(
-                "venturalitica.cli.transfer.get_config_path", return_value=fake_creds
-            ):
-                payload = _create_bundle_payload()
-            assert payload["bundle"]["signature"]
-            assert payload["bundle"]["signature_type"] == "HMAC-SHA256"
-        finally:
-            os.chdir(curr)
-
-    def test_hmac_with_corrupt_credentials(self, tmp_path):
+        # Point to a path that does NOT exist
+        fake_creds = str(project / "nonexistent" / "credentials.json")
+        with patch(
+            "venturalitica.cli.transfer.get_config_path", return_value=fake_creds
+        ):
+            payload = _create_bundle_payload(project_dir=project)
+        assert payload["bundle"]["signature"]
+        assert payload["bundle"]["signature_type"] == "HMAC-SHA256"
+
+    def test_hmac_with_corrupt_credentials(self, project):
         """Corrupt credentials file falls back to default key."""
-        curr = os.getcwd()
-        try:
-            os.chdir(tmp_path)
-            config_dir = _setup_project(tmp_path, results_data=[])
-            creds_path = config_dir / "credentials.json"
-            creds_path.write_text("NOT-JSON")
-            with patch(
-                "venturalitica.cli.transfer.get_config_path",
-                return_value=str(creds_path),
-            ):
-                payload = _create_bundle_payload()
-            assert payload["bundle"]["signature"]
-        finally:
-            os.chdir(curr)
+        creds_path = project / ".venturalitica_config" / "credentials.json"
+        creds_path.write_text("NOT-JSON")
+        with patch(
+            "venturalitica.cli.transfer.get_config_path",
+            return_value=str(creds_path),
+        ):
+            payload = _create_bundle_payload(project_dir=project)
+        assert payload["bundle"]["signature"]
 
 
 # ===================================================================
@@ -420,136 +445,88 @@ class TestPushNotLoggedIn:
             "venturalitica.cli.transfer.get_config_path", return_value=fake_creds
         ):
             with pytest.raises((SystemExit, ClickExit)):
-                push(external_run_url=None, treatment_id=None)
+                push(external_run_url=None, treatment_id=None, project_dir=tmp_path)
 
 
 class TestPushSuccess:
     """push: successful HTTP round-trip."""
 
-    def test_push_success(self, tmp_path):
-        curr = os.getcwd()
-        try:
-            os.chdir(tmp_path)
-            config_dir = _setup_project(
-                tmp_path,
-                results_data=[{"m": 1}],
-                credentials={"key": "bearer-token"},
-                assessment_results=True,
-            )
-            mock_resp = MagicMock()
-            mock_resp.raise_for_status = MagicMock()
-            mock_resp.json.return_value = {"job_id": "j-1"}
-
-            with (
-                patch(
-                    "venturalitica.cli.transfer.get_config_path",
-                    return_value=str(config_dir / "credentials.json"),
-                ),
-                patch(
-                    "venturalitica.cli.transfer.requests.post", return_value=mock_resp
-                ) as mock_post,
-            ):
-                push(external_run_url=None, treatment_id=None)
-
-            mock_post.assert_called_once()
-            call_kwargs = mock_post.call_args
-            assert "Bearer bearer-token" in str(call_kwargs)
-        finally:
-            os.chdir(curr)
-
-    def test_push_with_external_run_url_and_treatment_id(self, tmp_path):
-        curr = os.getcwd()
-        try:
-            os.chdir(tmp_path)
-            config_dir = _setup_project(
-                tmp_path,
-                results_data=[],
-                credentials={"key": "k"},
-                assessment_results=True,
+    @responses.activate
+    def test_push_success(self, project):
+        config_dir = _setup_project(
+            project,
+            results_data=[{"m": 1}],
+            credentials={"key": "bearer-token"},
+            assessment_results=True,
+        )
+        responses.add(responses.POST, _PUSH_URL, json={"job_id": "j-1"}, status=200)
+
+        with patch(
+            "venturalitica.cli.transfer.get_config_path",
+            return_value=str(config_dir / "credentials.json"),
+        ):
+            push(external_run_url=None, treatment_id=None, project_dir=project)
+
+        assert len(responses.calls) == 1
+        sent = responses.calls[0].request
+        assert sent.headers["Authorization"] == "Bearer bearer-token"
+
+    @responses.activate
+    def test_push_with_external_run_url_and_treatment_id(self, project):
+        config_dir = _setup_project(
+            project,
+            assessment_results=True,
+        )
+        responses.add(
+            responses.POST, _PUSH_URL, json={"audit_trace_id": "at-1"}, status=200
+        )
+
+        with patch(
+            "venturalitica.cli.transfer.get_config_path",
+            return_value=str(config_dir / "credentials.json"),
+        ):
+            push(
+                external_run_url="https://mlflow.example/run/1",
+                treatment_id="t-42",
+                project_dir=project,
             )
-            mock_resp = MagicMock()
-            mock_resp.raise_for_status = MagicMock()
-            mock_resp.json.return_value = {"audit_trace_id": "at-1"}
-
-            with (
-                patch(
-                    "venturalitica.cli.transfer.get_config_path",
-                    return_value=str(config_dir / "credentials.json"),
-                ),
-                patch(
-                    "venturalitica.cli.transfer.requests.post", return_value=mock_resp
-                ) as mock_post,
-            ):
-                push(
-                    external_run_url="https://mlflow.example/run/1", treatment_id="t-42"
-                )
-
-            sent_json = mock_post.call_args[1]["json"]
-            assert sent_json["external_run_url"] == "https://mlflow.example/run/1"
-            assert sent_json["treatment_id"] == "t-42"
-        finally:
-            os.chdir(curr)
+
+        sent_json = json.loads(responses.calls[0].request.body)
+        assert sent_json["external_run_url"] == "https://mlflow.example/run/1"
+        assert sent_json["treatment_id"] == "t-42"
 
 
 class TestPushFailure:
     """push: error response paths."""
 
-    def test_push_failure_json_error(self, tmp_path):
+    @responses.activate
+    def test_push_failure_json_error(self, project):
         """Server returns an error with JSON body."""
-        curr = os.getcwd()
-        try:
-            os.chdir(tmp_path)
-            config_dir = _setup_project(
-                tmp_path,
-                results_data=[],
-                credentials={"key": "k"},
-            )
-            error_resp = MagicMock()
-            error_resp.json.return_value = {"error": "quota exceeded"}
-            error_resp.text = '{"error":"quota exceeded"}'
-            error_resp.status_code = 429
-
-            exc = Exception("429 Too Many Requests")
-            exc.response = error_resp
-
-            with (
-                patch(
-                    "venturalitica.cli.transfer.get_config_path",
-                    return_value=str(config_dir / "credentials.json"),
-                ),
-                patch("venturalitica.cli.transfer.requests.post", side_effect=exc),
-            ):
-                with pytest.raises((SystemExit, ClickExit)):
-                    push(external_run_url=None, treatment_id=None)
-        finally:
-            os.chdir(curr)
-
-    def test_push_failure_non_json_error(self, tmp_path):
+        config_dir = _setup_project(project, assessment_results=True)
+        responses.add(
+            responses.POST, _PUSH_URL, json={"error": "quota exceeded"}, status=429
+        )
+
+        with patch(
+            "venturalitica.cli.transfer.get_config_path",
+            return_value=str(config_dir / "credentials.json"),
+        ):
+            with pytest.raises((SystemExit, ClickExit)):
+                push(external_run_url=None, treatment_id=None, project_dir=project)
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_push_failure_non_json_error(self, project):
         """Server returns an error with non-JSON body."""
-        curr = os.getcwd()
-        try:
-            os.chdir(tmp_path)
-            config_dir = _setup_project(
-                tmp_path,
-                results_data=[],
-                credentials={"key": "k"},
-            )
-            error_resp = MagicMock()
-            error_resp.json.side_effect = ValueError("No JSON")
-            error_resp.text = "Internal Server Error"
-            error_resp.status_code = 500
-
-            exc = Exception("500 Server Error")
-            exc.response = error_resp
-
-            with (
-                patch(
-                    "venturalitica.cli.transfer.get_config_path",
-                    return_value=str(config_dir / "credentials.json"),
-                ),
-                patch("venturalitica.cli.transfer.requests.post", side_effect=exc),
-            ):
-                with pytest.raises((SystemExit, ClickExit)):
-                    push(external_run_url=None, treatment_id=None)
-        finally:
-            os.chdir(curr)
+        config_dir = _setup_project(project, assessment_results=True)
+        responses.add(
+            responses.POST, _PUSH_URL, body="Internal Server Error", status=500
+        )
+
+        with patch(
+            "venturalitica.cli.transfer.get_config_path",
+            return_value=str(config_dir / "credentials.json"),
+        ):
+            with pytest.raises((SystemExit, ClickExit)):
+                push(external_run_url=None, treatment_id=None, project_dir=project)
+        assert len(responses.calls) == 1
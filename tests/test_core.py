@@ -1,18 +1,65 @@
+import copy
+import dataclasses
+import hashlib
+import io
+import json
 import os
-import tempfile
-from unittest.mock import MagicMock, patch
+import pickle
+from contextlib import ExitStack
+from pathlib import Path
+from unittest.mock import patch
 
 import pandas as pd
 import pytest
 import yaml
 
+import venturalitica.loader as loader_module
+import venturalitica.models as models_module
 from venturalitica.core import AssuranceValidator
+from venturalitica.loader import OSCALPolicyLoader
+from venturalitica.metrics import METRIC_REGISTRY
 from venturalitica.models import InternalControl, InternalPolicy
 
+try:
+    from yaml import CSafeDumper as _Dumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as _Dumper
+
+
+@pytest.fixture(autouse=True)
+def _clean_strict_env(monkeypatch):
+    """Start every test outside CI/strict mode; tests opt in with ``setenv``."""
+    monkeypatch.delenv("CI", raising=False)
+    monkeypatch.delenv("VENTURALITICA_STRICT", raising=False)
+
+
+def _raise_value_error(*args, **kwargs):
+    raise ValueError()
+
+
+def _raise_runtime_error(*args, **kwargs):
+    raise RuntimeError("Unexpected")
+
 
 @pytest.fixture
-def mock_policy_file():
-    policy_data = {
+def patched_metric():
+    """Callable ``(name, fn)`` that overrides a ``METRIC_REGISTRY`` entry until the test ends."""
+    with ExitStack() as stack:
+        yield lambda name, fn: stack.enter_context(patch.dict(METRIC_REGISTRY, {name: fn}))
+
+
+def _write_policy(tmp_path_factory, name, policy_data):
+    """Dump *policy_data* once into a session temp dir and return its path."""
+    path = tmp_path_factory.mktemp("policies") / name
+    with open(path, "w") as f:
+        yaml.dump(policy_data, f, Dumper=_Dumper)
+    return str(path)
+
+
+@pytest.fixture(scope="session")
+def policy_dict():
+    """Two-control OSCAL policy as an in-memory dict (read-only)."""
+    return {
         "component-definition": {
             "metadata": {"title": "Test Policy"},
             "local-definitions": {
@@ -59,12 +106,71 @@ def mock_policy_file():
             ],
         }
     }
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".oscal.yaml", delete=False) as f:
-        yaml.dump(policy_data, f)
-        path = f.name
-    yield path
-    if os.path.exists(path):
-        os.unlink(path)
+
+
+@pytest.fixture(scope="session")
+def mock_policy_file(tmp_path_factory, policy_dict):
+    """``policy_dict`` on disk, for the tests that exercise file loading."""
+    return _write_policy(tmp_path_factory, "policy.oscal.yaml", policy_dict)
+
+
+@pytest.fixture(scope="session")
+def _base_policy(policy_dict, pytestconfig):
+    """``policy_dict`` run through the loader, pickled in the pytest cache.
+
+    The key covers the policy and the loader/model sources, so editing either
+    invalidates the pickle; later sessions skip ``OSCALPolicyLoader`` entirely.
+    """
+    if getattr(pytestconfig, "cache", None) is None:  # -p no:cacheprovider
+        return OSCALPolicyLoader(policy_dict).load()
+
+    key = hashlib.blake2b(json.dumps(policy_dict, sort_keys=True).encode(), digest_size=8)
+    for module in (loader_module, models_module):
+        key.update(Path(module.__file__).read_bytes())
+    cache = pytestconfig.cache.mkdir("venturalitica-policies") / f"{key.hexdigest()}.pkl"
+    try:
+        return pickle.loads(cache.read_bytes())
+    except (OSError, EOFError, pickle.UnpicklingError):
+        policy = OSCALPolicyLoader(policy_dict).load()
+        cache.write_bytes(pickle.dumps(policy))
+        return policy
+
+
+@pytest.fixture(scope="session")
+def _base_validator(_base_policy):
+    """``_base_policy`` wrapped once, in non-strict mode, without a YAML round-trip."""
+    with patch.dict(os.environ, {"CI": "", "VENTURALITICA_STRICT": ""}):
+        return AssuranceValidator(_base_policy)
+
+
+@pytest.fixture
+def validator(_base_validator):
+    """Per-test copy of the session validator.
+
+    The policy gets its own ``controls`` list so tests can append controls
+    without leaking into other tests; the controls themselves are shared.
+    """
+    v = copy.copy(_base_validator)
+    v.policy = dataclasses.replace(v.policy, controls=list(v.policy.controls))
+    return v
+
+
+@pytest.fixture(scope="module")
+def balanced_df():
+    """Target/prediction/sensitive frame: both groups have 1 pos, 1 neg (read-only)."""
+    return pd.DataFrame({"t": [1, 1, 0, 0], "p": [1, 1, 0, 0], "s": ["A", "B", "A", "B"]})
+
+
+@pytest.fixture(scope="module")
+def qi_df():
+    """Quasi-identifier frame for the k-anonymity / params tests (read-only)."""
+    return pd.DataFrame(
+        {
+            "age": [25, 25, 30, 30],
+            "gender": ["M", "M", "F", "F"],
+            "salary": [100, 200, 150, 250],
+        }
+    )
 
 
 def test_validator_loading(mock_policy_file):
@@ -80,15 +186,22 @@ def test_missing_policy():
         AssuranceValidator("missing.oscal.yaml")
 
 
+def test_in_memory_policy_skips_default_storage(tmp_path, monkeypatch, single_control_policy):
+    monkeypatch.chdir(tmp_path)
+    validator = AssuranceValidator(single_control_policy)
+    assert validator.storage is None
+    assert not (tmp_path / ".venturalitica").exists()
+
+
 def test_validator_no_policy():
     with patch("venturalitica.core.LocalFileSystemStorage.get_policy", return_value=None):
         validator = AssuranceValidator("any.yaml")
         assert validator.controls == []
 
 
-@pytest.fixture
-def mock_single_control_policy():
-    policy_data = {
+@pytest.fixture(scope="session")
+def single_control_policy():
+    return {
         "catalog": {
             "metadata": {"title": "Single Control"},
             "controls": [
@@ -102,71 +215,69 @@ def mock_single_control_policy():
             ],
         }
     }
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".oscal.yaml", delete=False) as f:
-        yaml.dump(policy_data, f)
-        path = f.name
-    yield path
-    if os.path.exists(path):
-        os.unlink(path)
 
 
-@patch.dict(os.environ, {"CI": "", "VENTURALITICA_STRICT": ""})
-def test_compute_and_evaluate_value_error(mock_single_control_policy):
-    validator = AssuranceValidator(mock_single_control_policy)
-    from venturalitica.metrics import METRIC_REGISTRY
+def test_compute_and_evaluate_value_error(single_control_policy, patched_metric):
+    validator = AssuranceValidator(single_control_policy)
+    patched_metric("accuracy_score", _raise_value_error)
 
     df = pd.DataFrame({"a": [1]})
     mapping = {"target": "a"}
 
-    with patch.dict(METRIC_REGISTRY, {"accuracy_score": MagicMock(side_effect=ValueError)}):
-        results = validator.compute_and_evaluate(df, mapping)
-        assert results == []
+    results = validator.compute_and_evaluate(df, mapping)
+    assert results == []
 
 
-@patch.dict(os.environ, {"CI": "", "VENTURALITICA_STRICT": ""})
-def test_compute_and_evaluate_unexpected_error(mock_single_control_policy, capsys):
-    validator = AssuranceValidator(mock_single_control_policy)
-    from venturalitica.metrics import METRIC_REGISTRY
+def test_compute_and_evaluate_unexpected_error(single_control_policy, patched_metric, capsys):
+    validator = AssuranceValidator(single_control_policy)
+    patched_metric("accuracy_score", _raise_runtime_error)
 
     df = pd.DataFrame({"a": [1], "b": [1]})
     mapping = {"target": "a", "prediction": "b"}
 
-    with patch.dict(
-        METRIC_REGISTRY,
-        {"accuracy_score": MagicMock(side_effect=RuntimeError("Unexpected"))},
-    ):
-        validator.compute_and_evaluate(df, mapping)
+    validator.compute_and_evaluate(df, mapping)
 
     captured = capsys.readouterr()
     assert any(x in captured.out for x in ["Unexpected error", "Error computing", "Error evaluating"])
 
 
-def test_operators():
+def test_all_operators():
+    """Symbolic and word-form operators (lt, gt, le, ge, eq, ne), plus an unknown one."""
     v = AssuranceValidator.__new__(AssuranceValidator)
-    assert v._check_condition(1.0, ">", 0.5) is True
-    assert v._check_condition(0.5, ">", 0.5) is False
-    assert v._check_condition(0.4, "<", 0.5) is True
-    assert v._check_condition(0.5, "<=", 0.5) is True
-    assert v._check_condition(0.6, ">=", 0.5) is True
-    assert v._check_condition(0.5, "==", 0.5) is True
-    assert v._check_condition(0.6, "==", 0.5) is False
-    assert v._check_condition(0.6, "!=", 0.5) is True
-    assert v._check_condition(0.5, "invalid", 0.5) is False
-
-
-def test_compute_and_evaluate(mock_policy_file):
-    validator = AssuranceValidator(mock_policy_file)
-    df = pd.DataFrame(
-        {
-            "t": [1, 1, 0, 0],
-            "p": [1, 1, 0, 0],
-            "s": ["A", "B", "A", "B"],  # Balanced: Both A and B have 1 pos, 1 neg
-        }
-    )
-
+    cases = [
+        (1.0, ">", 0.5, True),
+        (0.5, ">", 0.5, False),
+        (0.4, "<", 0.5, True),
+        (0.5, "<=", 0.5, True),
+        (0.6, ">=", 0.5, True),
+        (0.5, "==", 0.5, True),
+        (0.6, "==", 0.5, False),
+        (0.6, "!=", 0.5, True),
+        (0.5, "invalid", 0.5, False),
+        (0.4, "lt", 0.5, True),
+        (0.5, "lt", 0.5, False),
+        (0.6, "gt", 0.5, True),
+        (0.5, "gt", 0.5, False),
+        (0.5, "le", 0.5, True),
+        (0.6, "le", 0.5, False),
+        (0.5, "ge", 0.5, True),
+        (0.4, "ge", 0.5, False),
+        (0.5, "eq", 0.5, True),
+        (0.6, "eq", 0.5, False),
+        (0.6, "ne", 0.5, True),
+        (0.5, "ne", 0.5, False),
+        (float("nan"), ">=", 0.5, False),
+        (float("nan"), "!=", 0.5, False),
+        (float("nan"), "ne", 0.5, False),
+    ]
+    failures = [(a, op, b, e) for a, op, b, e in cases if v._check_condition(a, op, b) is not e]
+    assert not failures, failures
+
+
+def test_compute_and_evaluate(validator, balanced_df):
     # mapping maps Variable Names (from policy) to Actual Columns (in df)
     mapping = {"target": "t", "prediction": "p", "sensitive": "s"}
-    results = validator.compute_and_evaluate(df, mapping)
+    results = validator.compute_and_evaluate(balanced_df, mapping)
 
     assert len(results) == 2
     assert results[0].metric_key == "accuracy_score"
@@ -175,8 +286,7 @@ def test_compute_and_evaluate(mock_policy_file):
     assert results[1].passed
 
 
-def test_evaluate_precomputed(mock_policy_file):
-    validator = AssuranceValidator(mock_policy_file)
+def test_evaluate_precomputed(validator):
     results = validator.evaluate({"accuracy_score": 0.7, "disparate_impact": 0.5, "other": 1.0})
 
     assert len(results) == 2
@@ -191,9 +301,7 @@ def test_compute_and_evaluate_invalid_data():
         v.compute_and_evaluate("not a dataframe", {})
 
 
-@patch.dict(os.environ, {"CI": "", "VENTURALITICA_STRICT": ""})
-def test_unknown_metric(mock_policy_file):
-    validator = AssuranceValidator(mock_policy_file)
+def test_unknown_metric(validator):
     # Inject an unknown metric control into the policy object
     validator.policy.controls.append(
         InternalControl(
@@ -209,20 +317,12 @@ def test_unknown_metric(mock_policy_file):
     assert not any(r.control_id == "U1" for r in results)
 
 
-@patch.dict(os.environ, {"CI": "", "VENTURALITICA_STRICT": ""})
-def test_unexpected_error_eval(mock_policy_file):
-    validator = AssuranceValidator(mock_policy_file)
-    from venturalitica.metrics import METRIC_REGISTRY
-
-    with patch.dict(
-        METRIC_REGISTRY,
-        {"accuracy_score": MagicMock(side_effect=RuntimeError("Serious"))},
-    ):
-        validator.compute_and_evaluate(pd.DataFrame({"t": [1], "p": [1]}), {"target": "t", "prediction": "p"})
+def test_unexpected_error_eval(validator, patched_metric):
+    patched_metric("accuracy_score", _raise_runtime_error)
+    validator.compute_and_evaluate(pd.DataFrame({"t": [1], "p": [1]}), {"target": "t", "prediction": "p"})
 
 
-def test_evaluate_missing_metric(mock_policy_file):
-    validator = AssuranceValidator(mock_policy_file)
+def test_evaluate_missing_metric(validator):
     results = validator.evaluate({"some_other": 1.0})
     assert len(results) == 0
 
@@ -260,7 +360,7 @@ def test_core_resolve_col_names_synonyms(tmp_path):
 
     path = tmp_path / "synonym_policy.yaml"
     with open(path, "w") as f:
-        yaml.dump(policy_dict, f)
+        yaml.dump(policy_dict, f, Dumper=_Dumper)
 
     # y=class, y_pred=pred
     df = pd.DataFrame(
@@ -279,8 +379,6 @@ def test_core_resolve_col_names_synonyms(tmp_path):
 
 
 def test_core_results_processing():
-    from venturalitica.loader import OSCALPolicyLoader
-
     # Test with a simple dict policy using standard hyphenated keys
     policy_data = {
         "component-definition": {
@@ -326,7 +424,6 @@ def test_core_results_processing():
 def test_strict_mode_ci_env(monkeypatch, tmp_path):
     """Line 21-23: CI=true triggers strict mode auto-detection."""
     monkeypatch.setenv("CI", "true")
-    monkeypatch.delenv("VENTURALITICA_STRICT", raising=False)
 
     policy = InternalPolicy(title="Empty", controls=[])
     validator = AssuranceValidator(policy, strict=False)
@@ -335,7 +432,6 @@ def test_strict_mode_ci_env(monkeypatch, tmp_path):
 
 def test_strict_mode_env_var(monkeypatch, tmp_path):
     """Line 21-23: VENTURALITICA_STRICT=true triggers strict mode."""
-    monkeypatch.delenv("CI", raising=False)
     monkeypatch.setenv("VENTURALITICA_STRICT", "true")
 
     policy = InternalPolicy(title="Empty", controls=[])
@@ -343,21 +439,15 @@ def test_strict_mode_env_var(monkeypatch, tmp_path):
     assert validator.strict is True
 
 
-def test_strict_mode_not_set(monkeypatch):
+def test_strict_mode_not_set():
     """Verify strict is False when env vars are absent."""
-    monkeypatch.delenv("CI", raising=False)
-    monkeypatch.delenv("VENTURALITICA_STRICT", raising=False)
-
     policy = InternalPolicy(title="Empty", controls=[])
     validator = AssuranceValidator(policy, strict=False)
     assert validator.strict is False
 
 
-def test_load_policy_from_internal_policy(monkeypatch):
+def test_load_policy_from_internal_policy():
     """Line 47-48: Pass InternalPolicy directly to the constructor."""
-    monkeypatch.delenv("CI", raising=False)
-    monkeypatch.delenv("VENTURALITICA_STRICT", raising=False)
-
     ctrl = InternalControl(
         id="D1",
         description="Direct",
@@ -373,11 +463,8 @@ def test_load_policy_from_internal_policy(monkeypatch):
     assert validator.controls[0]["metric_key"] == "accuracy_score"
 
 
-def test_load_policy_from_dict(monkeypatch):
+def test_load_policy_from_dict():
     """Lines 49-53: Pass a raw dict to the constructor."""
-    monkeypatch.delenv("CI", raising=False)
-    monkeypatch.delenv("VENTURALITICA_STRICT", raising=False)
-
     policy_dict = {
         "component-definition": {
             "components": [
@@ -406,28 +493,18 @@ def test_load_policy_from_dict(monkeypatch):
     assert validator.controls[0]["id"] == "DD-1"
 
 
-def test_word_form_operators():
-    """Lines 326-337: Test word-form operators lt, gt, le, ge, eq, ne."""
-    v = AssuranceValidator.__new__(AssuranceValidator)
-    assert v._check_condition(0.4, "lt", 0.5) is True
-    assert v._check_condition(0.5, "lt", 0.5) is False
-    assert v._check_condition(0.6, "gt", 0.5) is True
-    assert v._check_condition(0.5, "gt", 0.5) is False
-    assert v._check_condition(0.5, "le", 0.5) is True
-    assert v._check_condition(0.6, "le", 0.5) is False
-    assert v._check_condition(0.5, "ge", 0.5) is True
-    assert v._check_condition(0.4, "ge", 0.5) is False
-    assert v._check_condition(0.5, "eq", 0.5) is True
-    assert v._check_condition(0.6, "eq", 0.5) is False
-    assert v._check_condition(0.6, "ne", 0.5) is True
-    assert v._check_condition(0.5, "ne", 0.5) is False
-
-
-def test_resolve_col_names_with_string_splitting(monkeypatch):
-    """Lines 218-250: resolve_col_names with comma-separated string input."""
-    monkeypatch.delenv("CI", raising=False)
-    monkeypatch.delenv("VENTURALITICA_STRICT", raising=False)
+@pytest.mark.parametrize("wrap", [bytes, str, io.BytesIO], ids=["bytes", "str", "stream"])
+def test_from_stream(policy_dict, wrap):
+    """from_stream parses in-memory YAML without touching a policy file."""
+    raw = yaml.dump(policy_dict, Dumper=_Dumper).encode()
+    source = raw.decode() if wrap is str else wrap(raw)
+    validator = AssuranceValidator.from_stream(source)
+    assert [c["id"] for c in validator.controls] == ["C1", "C2"]
+    assert validator.controls[0]["severity"] == "high"
+
 
+def test_resolve_col_names_with_string_splitting(qi_df):
+    """Lines 218-250: resolve_col_names with comma-separated string input."""
     # Build a policy that uses quasi_identifiers param with comma-separated string
     policy = InternalPolicy(
         title="QI Test",
@@ -445,23 +522,13 @@ def test_resolve_col_names_with_string_splitting(monkeypatch):
         ],
     )
     validator = AssuranceValidator(policy)
-    df = pd.DataFrame(
-        {
-            "age": [25, 25, 30, 30],
-            "gender": ["M", "M", "F", "F"],
-            "salary": [100, 200, 150, 250],
-        }
-    )
-    results = validator.compute_and_evaluate(df, {})
+    results = validator.compute_and_evaluate(qi_df, {})
     assert len(results) == 1
     assert results[0].metric_key == "k_anonymity"
 
 
-def test_resolve_col_names_with_list(monkeypatch):
+def test_resolve_col_names_with_list(qi_df):
     """Lines 221-222: resolve_col_names with list input."""
-    monkeypatch.delenv("CI", raising=False)
-    monkeypatch.delenv("VENTURALITICA_STRICT", raising=False)
-
     policy = InternalPolicy(
         title="QI List Test",
         controls=[
@@ -478,23 +545,13 @@ def test_resolve_col_names_with_list(monkeypatch):
         ],
     )
     validator = AssuranceValidator(policy)
-    df = pd.DataFrame(
-        {
-            "age": [25, 25, 30, 30],
-            "gender": ["M", "M", "F", "F"],
-            "salary": [100, 200, 150, 250],
-        }
-    )
-    results = validator.compute_and_evaluate(df, {})
+    results = validator.compute_and_evaluate(qi_df, {})
     assert len(results) == 1
     assert results[0].metric_key == "k_anonymity"
 
 
-def test_resolve_col_names_lowercase_fallback(monkeypatch):
+def test_resolve_col_names_lowercase_fallback():
     """Lines 245-246: resolve_col_names lowercase fallback when synonym not found."""
-    monkeypatch.delenv("CI", raising=False)
-    monkeypatch.delenv("VENTURALITICA_STRICT", raising=False)
-
     # Use a column name that isn't in synonyms but whose lowercase exists in the df
     policy = InternalPolicy(
         title="Lowercase Test",
@@ -524,11 +581,8 @@ def test_resolve_col_names_lowercase_fallback(monkeypatch):
     assert len(results) == 1
 
 
-def test_tuple_metric_result(monkeypatch):
+def test_tuple_metric_result(patched_metric):
     """Lines 263-264: metric returning (value, metadata) tuple is unpacked."""
-    monkeypatch.delenv("CI", raising=False)
-    monkeypatch.delenv("VENTURALITICA_STRICT", raising=False)
-
     def fake_metric(data, **kwargs):
         return (0.95, {"stability": "high", "n_samples": 100})
 
@@ -548,21 +602,50 @@ def test_tuple_metric_result(monkeypatch):
     validator = AssuranceValidator(policy)
     df = pd.DataFrame({"a": [1, 2, 3]})
 
-    from venturalitica.metrics import METRIC_REGISTRY
-
-    with patch.dict(METRIC_REGISTRY, {"fake_tuple_metric": fake_metric}):
-        results = validator.compute_and_evaluate(df, {})
+    patched_metric("fake_tuple_metric", fake_metric)
+    results = validator.compute_and_evaluate(df, {})
     assert len(results) == 1
     assert results[0].actual_value == 0.95
     assert results[0].metadata == {"stability": "high", "n_samples": 100}
     assert results[0].passed is True
 
 
-def test_static_param_average(monkeypatch):
-    """Lines 107-110: input_mapping 'average' role treated as static parameter."""
-    monkeypatch.delenv("CI", raising=False)
-    monkeypatch.delenv("VENTURALITICA_STRICT", raising=False)
+def test_shared_metric_computed_once(patched_metric, monkeypatch):
+    """Controls with the same metric and bindings reuse one computation."""
+    monkeypatch.setenv("VENTURALITICA_POWER", "0")  # no bootstrap re-calls
+    calls = []
+
+    def counting_metric(data, **kwargs):
+        calls.append(kwargs)
+        return 0.7
+
+    policy = InternalPolicy(
+        title="Shared Metric",
+        controls=[
+            InternalControl(
+                id=cid,
+                description=cid,
+                severity="low",
+                metric_key="counting_metric",
+                threshold=threshold,
+                operator="ge",
+            )
+            for cid, threshold in (("WARN", 0.6), ("BLOCK", 0.8))
+        ],
+    )
+    validator = AssuranceValidator(policy)
+    patched_metric("counting_metric", counting_metric)
+    results = validator.compute_and_evaluate(pd.DataFrame({"a": [1, 2, 3]}), {})
+
+    assert [(r.control_id, r.actual_value, r.passed) for r in results] == [
+        ("WARN", 0.7, True),
+        ("BLOCK", 0.7, False),
+    ]
+    assert len(calls) == 1
+
 
+def test_static_param_average(patched_metric):
+    """Lines 107-110: input_mapping 'average' role treated as static parameter."""
     def fake_metric_with_average(data, target=None, prediction=None, average=None, **kwargs):
         # The metric receives average as a kwarg, not a column name
         assert average == "macro"
@@ -589,19 +672,14 @@ def test_static_param_average(monkeypatch):
     validator = AssuranceValidator(policy)
     df = pd.DataFrame({"target": [0, 1, 1], "prediction": [0, 1, 0]})
 
-    from venturalitica.metrics import METRIC_REGISTRY
-
-    with patch.dict(METRIC_REGISTRY, {"fake_avg_metric": fake_metric_with_average}):
-        results = validator.compute_and_evaluate(df, {"target": "target", "prediction": "prediction"})
+    patched_metric("fake_avg_metric", fake_metric_with_average)
+    results = validator.compute_and_evaluate(df, {"target": "target", "prediction": "prediction"})
     assert len(results) == 1
     assert results[0].actual_value == 0.85
 
 
-def test_quasi_identifiers_resolution(monkeypatch):
+def test_quasi_identifiers_resolution(patched_metric, qi_df):
     """Lines 252-258: resolved_params for quasi_identifiers and sensitive_columns."""
-    monkeypatch.delenv("CI", raising=False)
-    monkeypatch.delenv("VENTURALITICA_STRICT", raising=False)
-
     captured_kwargs = {}
 
     def capturing_metric(data, **kwargs):
@@ -628,18 +706,8 @@ def test_quasi_identifiers_resolution(monkeypatch):
         ],
     )
     validator = AssuranceValidator(policy)
-    df = pd.DataFrame(
-        {
-            "age": [25, 30],
-            "gender": ["M", "F"],
-            "salary": [100, 200],
-        }
-    )
-
-    from venturalitica.metrics import METRIC_REGISTRY
-
-    with patch.dict(METRIC_REGISTRY, {"capturing_metric": capturing_metric}):
-        results = validator.compute_and_evaluate(df, {})
+    patched_metric("capturing_metric", capturing_metric)
+    results = validator.compute_and_evaluate(qi_df, {})
 
     assert len(results) == 1
     # quasi_identifiers should be resolved to a list of actual column names
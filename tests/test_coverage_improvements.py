@@ -14,7 +14,6 @@ Strategy:
 
 import json
 import os
-import tempfile
 from unittest.mock import patch
 
 import pandas as pd
@@ -25,6 +24,58 @@ from venturalitica import enforce, monitor
 from venturalitica.core import AssuranceValidator
 from venturalitica.session import GovernanceSession
 
+
+def _single_metric_policy(metric_key, threshold, operator, control_id="C1", inputs=()):
+    """One inventory metric linked from one implemented requirement."""
+    props = [
+        {"name": "metric_key", "value": metric_key},
+        {"name": "threshold", "value": threshold},
+        {"name": "operator", "value": operator},
+    ]
+    props += [{"name": f"input.{role}", "value": var} for role, var in inputs]
+    return {
+        "component-definition": {
+            "local-definitions": {"inventory-items": [{"uuid": "m1", "props": props}]},
+            "components": [
+                {
+                    "control-implementations": [
+                        {
+                            "implemented-requirements": [
+                                {
+                                    "control-id": control_id,
+                                    "description": "Test",
+                                    "links": [{"href": "#m1", "rel": "related"}],
+                                }
+                            ]
+                        }
+                    ]
+                }
+            ],
+        }
+    }
+
+
+@pytest.fixture(scope="session")
+def single_metric_policy(tmp_path_factory):
+    """Return the path of a ``_single_metric_policy`` file, written once per session.
+
+    Files are keyed by the call arguments, so tests asking for the same
+    ``(metric_key, threshold, operator, ...)`` share one YAML file.
+    """
+    base = tmp_path_factory.mktemp("policies")
+    paths = {}
+
+    def _get(metric_key, threshold, operator, control_id="C1", inputs=()):
+        key = (metric_key, threshold, operator, control_id, tuple(inputs))
+        if key not in paths:
+            path = base / f"policy_{len(paths)}.yaml"
+            path.write_text(yaml.dump(_single_metric_policy(*key)))
+            paths[key] = str(path)
+        return paths[key]
+
+    return _get
+
+
 # ============================================================================
 # Coverage: Error Handling and Edge Cases
 # ============================================================================
@@ -33,7 +84,7 @@ from venturalitica.session import GovernanceSession
 class TestCoreErrorHandling:
     """Test error handling in core module."""
 
-    def test_assurance_validator_with_invalid_control(self):
+    def test_assurance_validator_with_invalid_control(self, tmp_path):
         """Validator should handle controls with missing required fields."""
         policy_data = {
             "component-definition": {
@@ -56,112 +107,34 @@ class TestCoreErrorHandling:
             }
         }
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump(policy_data, f)
-            path = f.name
+        path = tmp_path / "policy.yaml"
+        path.write_text(yaml.dump(policy_data))
 
-        try:
-            validator = AssuranceValidator(path)
-            # Should instantiate without error
-            assert validator is not None
-        finally:
-            os.unlink(path)
+        validator = AssuranceValidator(str(path))
+        # Should instantiate without error
+        assert validator is not None
 
-    def test_assurance_validator_strict_mode_with_missing_columns(self):
+    def test_assurance_validator_strict_mode_with_missing_columns(self, single_metric_policy):
         """Validator in strict mode should error on missing columns."""
-        policy = {
-            "component-definition": {
-                "local-definitions": {
-                    "inventory-items": [
-                        {
-                            "uuid": "m1",
-                            "props": [
-                                {"name": "metric_key", "value": "accuracy_score"},
-                                {"name": "threshold", "value": "0.8"},
-                                {"name": "operator", "value": ">="},
-                                {"name": "input.target", "value": "actual"},
-                                {"name": "input.prediction", "value": "predicted"},
-                            ],
-                        }
-                    ]
-                },
-                "components": [
-                    {
-                        "control-implementations": [
-                            {
-                                "implemented-requirements": [
-                                    {
-                                        "control-id": "C1",
-                                        "description": "Test",
-                                        "links": [{"href": "#m1", "rel": "related"}],
-                                    }
-                                ]
-                            }
-                        ]
-                    }
-                ],
-            }
-        }
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump(policy, f)
-            path = f.name
-
-        try:
-            validator = AssuranceValidator(path)
-            df = pd.DataFrame({"wrong_col": [1, 2, 3]})
-
-            # Strict mode: should raise on unresolved virtual variables
-            with pytest.raises(ValueError, match="unresolved virtual variables"):
-                validator.compute_and_evaluate(df, {}, strict=True)
-        finally:
-            os.unlink(path)
-
-    def test_enforce_with_empty_dataframe(self):
+        path = single_metric_policy(
+            "accuracy_score", "0.8", ">=",
+            inputs=[("target", "actual"), ("prediction", "predicted")],
+        )
+        validator = AssuranceValidator(path)
+        df = pd.DataFrame({"wrong_col": [1, 2, 3]})
+
+        # Strict mode: should raise on unresolved virtual variables
+        with pytest.raises(ValueError, match="unresolved virtual variables"):
+            validator.compute_and_evaluate(df, {}, strict=True)
+
+    def test_enforce_with_empty_dataframe(self, single_metric_policy):
         """Enforce should handle empty DataFrames gracefully."""
-        policy = {
-            "component-definition": {
-                "local-definitions": {
-                    "inventory-items": [
-                        {
-                            "uuid": "m1",
-                            "props": [
-                                {"name": "metric_key", "value": "accuracy_score"},
-                                {"name": "threshold", "value": "0.8"},
-                                {"name": "operator", "value": ">="},
-                            ],
-                        }
-                    ]
-                },
-                "components": [
-                    {
-                        "control-implementations": [
-                            {
-                                "implemented-requirements": [
-                                    {
-                                        "control-id": "C1",
-                                        "description": "Test",
-                                        "links": [{"href": "#m1", "rel": "related"}],
-                                    }
-                                ]
-                            }
-                        ]
-                    }
-                ],
-            }
-        }
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump(policy, f)
-            path = f.name
+        path = single_metric_policy("accuracy_score", "0.8", ">=")
 
-        try:
-            # Empty DataFrame
-            df = pd.DataFrame()
-            results = enforce(data=df, policy=path)
-            assert isinstance(results, list)
-        finally:
-            os.unlink(path)
+        # Empty DataFrame
+        df = pd.DataFrame()
+        results = enforce(data=df, policy=path)
+        assert isinstance(results, list)
 
 
 # ============================================================================
@@ -172,51 +145,21 @@ class TestCoreErrorHandling:
 class TestTelemetryFallbacks:
     """Test telemetry fallback paths."""
 
+    @pytest.mark.usefixtures("no_probes")
     def test_telemetry_import_failure_handled(self):
         """Monitor should handle telemetry import failures."""
         import sys
 
         # Temporarily block the telemetry module so `from .telemetry import telemetry`
         # inside monitor() raises ImportError.
-        with (
-            patch.dict(sys.modules, {"venturalitica.telemetry": None}),
-            patch("venturalitica.probes.CarbonProbe.start"),
-            patch("venturalitica.probes.CarbonProbe.stop"),
-            patch("venturalitica.probes.HardwareProbe.start"),
-            patch("venturalitica.probes.HardwareProbe.stop"),
-            patch("venturalitica.probes.IntegrityProbe.start"),
-            patch("venturalitica.probes.IntegrityProbe.stop"),
-            patch("venturalitica.probes.BOMProbe.start"),
-            patch("venturalitica.probes.BOMProbe.stop"),
-            patch("venturalitica.probes.ArtifactProbe.start"),
-            patch("venturalitica.probes.ArtifactProbe.stop"),
-            patch("venturalitica.probes.HandshakeProbe.start"),
-            patch("venturalitica.probes.HandshakeProbe.stop"),
-            patch("venturalitica.probes.TraceProbe.start"),
-            patch("venturalitica.probes.TraceProbe.stop"),
-        ):
+        with patch.dict(sys.modules, {"venturalitica.telemetry": None}):
             with monitor("Test"):
                 pass
 
+    @pytest.mark.usefixtures("no_probes")
     def test_telemetry_capture_exception_handled(self):
         """Monitor should handle exceptions during telemetry capture."""
-        with (
-            patch("venturalitica.telemetry.TelemetryClient.capture", side_effect=Exception("Telemetry error")),
-            patch("venturalitica.probes.CarbonProbe.start"),
-            patch("venturalitica.probes.CarbonProbe.stop"),
-            patch("venturalitica.probes.HardwareProbe.start"),
-            patch("venturalitica.probes.HardwareProbe.stop"),
-            patch("venturalitica.probes.IntegrityProbe.start"),
-            patch("venturalitica.probes.IntegrityProbe.stop"),
-            patch("venturalitica.probes.BOMProbe.start"),
-            patch("venturalitica.probes.BOMProbe.stop"),
-            patch("venturalitica.probes.ArtifactProbe.start"),
-            patch("venturalitica.probes.ArtifactProbe.stop"),
-            patch("venturalitica.probes.HandshakeProbe.start"),
-            patch("venturalitica.probes.HandshakeProbe.stop"),
-            patch("venturalitica.probes.TraceProbe.start"),
-            patch("venturalitica.probes.TraceProbe.stop"),
-        ):
+        with patch("venturalitica.telemetry.TelemetryClient.capture", side_effect=Exception("Telemetry error")):
             # Should not raise even if telemetry fails
             with monitor("Test"):
                 pass
@@ -230,49 +173,14 @@ class TestTelemetryFallbacks:
 class TestIntegrationPaths:
     """Test integration with MLflow, Weights & Biases, etc."""
 
-    def test_enforce_auto_log_handles_import_errors(self, tmp_path):
+    def test_enforce_auto_log_handles_import_errors(self, tmp_path, monkeypatch, single_metric_policy):
         """Auto-log should handle missing MLflow/W&B gracefully."""
-        os.chdir(tmp_path)
-
-        policy = {
-            "component-definition": {
-                "local-definitions": {
-                    "inventory-items": [
-                        {
-                            "uuid": "m1",
-                            "props": [
-                                {"name": "metric_key", "value": "accuracy_score"},
-                                {"name": "threshold", "value": "0.5"},
-                                {"name": "operator", "value": ">="},
-                            ],
-                        }
-                    ]
-                },
-                "components": [
-                    {
-                        "control-implementations": [
-                            {
-                                "implemented-requirements": [
-                                    {
-                                        "control-id": "C1",
-                                        "description": "Test",
-                                        "links": [{"href": "#m1", "rel": "related"}],
-                                    }
-                                ]
-                            }
-                        ]
-                    }
-                ],
-            }
-        }
-
-        policy_path = tmp_path / "policy.yaml"
-        with open(policy_path, "w") as f:
-            yaml.dump(policy, f)
+        monkeypatch.chdir(tmp_path)
+        path = single_metric_policy("accuracy_score", "0.5", ">=")
 
         with patch("venturalitica.integrations.auto_log", side_effect=ImportError("mlflow not available")):
             # Should still return results despite integration error
-            results = enforce(metrics={"accuracy_score": 0.8}, policy=str(policy_path))
+            results = enforce(metrics={"accuracy_score": 0.8}, policy=path)
             assert isinstance(results, list)
 
 
@@ -284,18 +192,18 @@ class TestIntegrationPaths:
 class TestSessionEdgeCases:
     """Test session management edge cases."""
 
-    def test_governance_session_with_symlink_failure(self, tmp_path):
+    def test_governance_session_with_symlink_failure(self, tmp_path, monkeypatch):
         """Session should handle symlink creation failures gracefully."""
-        os.chdir(tmp_path)
+        monkeypatch.chdir(tmp_path)
 
         with patch("os.symlink", side_effect=OSError("symlink not supported")):
             session = GovernanceSession("test_run")
             assert session.base_dir.exists()
             session.stop()
 
-    def test_governance_session_multiple_stops(self, tmp_path):
+    def test_governance_session_multiple_stops(self, tmp_path, monkeypatch):
         """Calling stop multiple times should not error."""
-        os.chdir(tmp_path)
+        monkeypatch.chdir(tmp_path)
 
         session = GovernanceSession("test_run")
         session.stop()
@@ -310,99 +218,23 @@ class TestSessionEdgeCases:
 class TestAPIBoundaryConditions:
     """Test API with boundary conditions."""
 
-    def test_enforce_with_nan_metrics(self):
+    def test_enforce_with_nan_metrics(self, single_metric_policy):
         """Enforce should handle NaN values in metrics gracefully."""
-        policy = {
-            "component-definition": {
-                "local-definitions": {
-                    "inventory-items": [
-                        {
-                            "uuid": "m1",
-                            "props": [
-                                {"name": "metric_key", "value": "accuracy_score"},
-                                {"name": "threshold", "value": "0.8"},
-                                {"name": "operator", "value": ">="},
-                            ],
-                        }
-                    ]
-                },
-                "components": [
-                    {
-                        "control-implementations": [
-                            {
-                                "implemented-requirements": [
-                                    {
-                                        "control-id": "C1",
-                                        "description": "Test",
-                                        "links": [{"href": "#m1", "rel": "related"}],
-                                    }
-                                ]
-                            }
-                        ]
-                    }
-                ],
-            }
-        }
+        import math
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump(policy, f)
-            path = f.name
+        path = single_metric_policy("accuracy_score", "0.8", ">=")
+        results = enforce(metrics={"accuracy_score": math.nan}, policy=path)
+        assert isinstance(results, list)
 
-        try:
-            import math
-
-            results = enforce(metrics={"accuracy_score": math.nan}, policy=path)
-            assert isinstance(results, list)
-        finally:
-            os.unlink(path)
-
-    def test_enforce_with_negative_metrics(self):
+    def test_enforce_with_negative_metrics(self, single_metric_policy):
         """Enforce should handle negative metric values."""
-        policy = {
-            "component-definition": {
-                "local-definitions": {
-                    "inventory-items": [
-                        {
-                            "uuid": "m1",
-                            "props": [
-                                {"name": "metric_key", "value": "loss"},
-                                {"name": "threshold", "value": "0.5"},
-                                {"name": "operator", "value": "<="},
-                            ],
-                        }
-                    ]
-                },
-                "components": [
-                    {
-                        "control-implementations": [
-                            {
-                                "implemented-requirements": [
-                                    {
-                                        "control-id": "C1",
-                                        "description": "Test",
-                                        "links": [{"href": "#m1", "rel": "related"}],
-                                    }
-                                ]
-                            }
-                        ]
-                    }
-                ],
-            }
-        }
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump(policy, f)
-            path = f.name
-
-        try:
-            results = enforce(metrics={"loss": -0.1}, policy=path)
-            assert isinstance(results, list)
-        finally:
-            os.unlink(path)
+        path = single_metric_policy("loss", "0.5", "<=")
+        results = enforce(metrics={"loss": -0.1}, policy=path)
+        assert isinstance(results, list)
 
-    def test_enforce_results_caching_with_existing_results(self, tmp_path):
+    def test_enforce_results_caching_with_existing_results(self, tmp_path, monkeypatch, single_metric_policy):
         """Enforce should append to existing cached results."""
-        os.chdir(tmp_path)
+        monkeypatch.chdir(tmp_path)
 
         # Pre-create results file
         os.makedirs(".venturalitica", exist_ok=True)
@@ -410,43 +242,8 @@ class TestAPIBoundaryConditions:
         with open(".venturalitica/results.json", "w") as f:
             json.dump(existing_results, f)
 
-        policy = {
-            "component-definition": {
-                "local-definitions": {
-                    "inventory-items": [
-                        {
-                            "uuid": "m1",
-                            "props": [
-                                {"name": "metric_key", "value": "accuracy_score"},
-                                {"name": "threshold", "value": "0.5"},
-                                {"name": "operator", "value": ">="},
-                            ],
-                        }
-                    ]
-                },
-                "components": [
-                    {
-                        "control-implementations": [
-                            {
-                                "implemented-requirements": [
-                                    {
-                                        "control-id": "NEW",
-                                        "description": "Test",
-                                        "links": [{"href": "#m1", "rel": "related"}],
-                                    }
-                                ]
-                            }
-                        ]
-                    }
-                ],
-            }
-        }
-
-        policy_path = tmp_path / "policy.yaml"
-        with open(policy_path, "w") as f:
-            yaml.dump(policy, f)
-
-        enforce(metrics={"accuracy_score": 0.8}, policy=str(policy_path))
+        path = single_metric_policy("accuracy_score", "0.5", ">=", control_id="NEW")
+        enforce(metrics={"accuracy_score": 0.8}, policy=path)
 
         # Check results were appended
         with open(".venturalitica/results.json") as f:
@@ -39,13 +39,15 @@ class MockStreamlit:
         self.container = MagicMock()
         self.container.return_value.__enter__ = MagicMock()
         self.container.return_value.__exit__ = MagicMock()
-        self.selectbox = MagicMock(side_effect=lambda label, options, index=0, **kwargs: options[index] if options else None)
-        self.multiselect = MagicMock(side_effect=lambda label, options, default=None: default or [])
+        # Pure passthrough widgets no test asserts on: plain functions skip
+        # MagicMock's call recording.
+        self.selectbox = lambda label, options, index=0, **kwargs: options[index] if options else None
+        self.multiselect = lambda label, options, default=None: default or []
         self.caption = MagicMock()
-        self.text_area = MagicMock(side_effect=lambda label, value=None, **kwargs: value if value is not None else "")
+        self.text_area = lambda label, value=None, **kwargs: value if value is not None else ""
         self.toast = MagicMock()
         self.radio = MagicMock(side_effect=lambda label, options, index=0, **kwargs: options[index] if options else None)
-        self.text_input = MagicMock(side_effect=lambda label, value="", type="default", help="": value)
+        self.text_input = lambda label, value="", type="default", help="": value
         
         # Connect sidebar mocks
         self.sidebar.radio = self.radio
@@ -54,9 +56,24 @@ class MockStreamlit:
         self.sidebar.text_input = self.text_input
         self.sidebar.button = self.button
 
+    def reset(self):
+        """Clear recorded calls and session state; keeps return values and side effects."""
+        for attr in vars(self).values():
+            if isinstance(attr, MagicMock):
+                attr.reset_mock()
+        self.session_state = {}
+
+
+@pytest.fixture(scope="module")
+def _mock_st_template():
+    # ~35 configured MagicMocks: build once per module, reset per test.
+    return MockStreamlit()
+
+
 @pytest.fixture
-def mock_st_obj():
-    mock = MockStreamlit()
+def mock_st_obj(_mock_st_template):
+    mock = _mock_st_template
+    mock.reset()
     mock.sidebar.button.return_value = False
     with patch("venturalitica.dashboard.main.st", mock):
         yield mock
@@ -1,6 +1,5 @@
 import json
 import os
-import tempfile
 from unittest.mock import MagicMock, patch
 
 import pandas as pd
@@ -10,10 +9,16 @@ import yaml
 from venturalitica import enforce, monitor
 from venturalitica.models import ComplianceResult
 
+try:
+    from yaml import CSafeDumper as _Dumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as _Dumper
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def mock_policy():
-    policy = {
+    """Parsed policy dict; ``enforce()`` takes it as-is, no file or YAML."""
+    return {
         "component-definition": {
             "local-definitions": {
                 "inventory-items": [
@@ -46,11 +51,15 @@ def mock_policy():
             ],
         }
     }
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-        yaml.dump(policy, f)
-        path = f.name
-    yield path
-    os.unlink(path)
+
+
+@pytest.fixture(scope="session")
+def mock_policy_file(tmp_path_factory, mock_policy):
+    """``mock_policy`` on disk, for the file-loading branch."""
+    path = tmp_path_factory.mktemp("enforce") / "policy.yaml"
+    with open(path, "w") as f:
+        yaml.dump(mock_policy, f, Dumper=_Dumper)
+    return str(path)
 
 
 def test_enforce_with_data(mock_policy):
@@ -67,6 +76,15 @@ def test_enforce_with_metrics(mock_policy):
     assert results[0].passed is True
 
 
+def test_enforce_policy_file_matches_dict(mock_policy, mock_policy_file, capsys):
+    from_file = enforce(metrics={"accuracy_score": 0.9}, policy=mock_policy_file)
+    from_dict = enforce(metrics={"accuracy_score": 0.9}, policy=mock_policy)
+    assert from_file == from_dict
+    out = capsys.readouterr().out
+    assert f"Enforcing policy: {mock_policy_file}" in out
+    assert "Enforcing policy: <in-memory policy>" in out
+
+
 def test_enforce_no_input(mock_policy):
     results = enforce(policy=mock_policy)
     assert results == []
@@ -107,11 +125,11 @@ def test_enforce_edge_cases_and_strict(tmp_path, mock_policy):
     assert results == []
 
 
-def test_api_results_caching(tmp_path):
-    os.chdir(tmp_path)
+def test_api_results_caching(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
     policy_path = "risks.oscal.yaml"
     with open(policy_path, "w") as f:
-        yaml.dump({"component-definition": {"components": [{"control-implementations": []}]}}, f)
+        yaml.dump({"component-definition": {"components": [{"control-implementations": []}]}}, f, Dumper=_Dumper)
 
     df = pd.DataFrame({"target": [0, 1], "prediction": [0, 1]})
     res = ComplianceResult(
@@ -131,14 +149,14 @@ def test_api_results_caching(tmp_path):
         assert os.path.exists(".venturalitica/results.json")
 
 
-def test_api_save_results_edge_cases(tmp_path):
-    os.chdir(tmp_path)
+def test_api_save_results_edge_cases(tmp_path, monkeypatch, capsys):
+    monkeypatch.chdir(tmp_path)
     os.makedirs(".venturalitica", exist_ok=True)
     results_path = ".venturalitica/results.json"
     policy_path = "dummy_policy.yaml"
 
     with open(policy_path, "w") as f:
-        yaml.dump({"component-definition": {"components": [{"control-implementations": []}]}}, f)
+        yaml.dump({"component-definition": {"components": [{"control-implementations": []}]}}, f, Dumper=_Dumper)
 
     # 1. Test corrupt JSON in results
     with open(results_path, "w") as f:
@@ -175,8 +193,16 @@ def test_api_save_results_edge_cases(tmp_path):
             assert len(data) == 2
 
     # 3. Test caching failure
-    with patch("builtins.open", side_effect=PermissionError("Mock Error")):
-        enforce(df)
+    capsys.readouterr()
+    with patch(
+        "venturalitica.api.AssuranceValidator.compute_and_evaluate",
+        return_value=[new_res],
+    ), patch(
+        "venturalitica.api.append_to_json_array",
+        side_effect=PermissionError("Mock Error"),
+    ):
+        enforce(df, policy=policy_path)
+    assert "Failed to cache results: Mock Error" in capsys.readouterr().out
 
 
 def test_monitor_artifact_logging(tmp_path):
@@ -224,20 +250,14 @@ def test_enforce_strict_missing_metric_raises():
         }
     }
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-        yaml.dump(policy, f)
-        path = f.name
+    df = pd.DataFrame({"target": [1, 0]})
     try:
-        df = pd.DataFrame({"target": [1, 0]})
-        try:
-            enforce(data=df, policy=path, target="target", strict=True)
-            raise AssertionError(
-                "Expected ValueError for missing metric, but enforce returned"
-            )
-        except ValueError as e:
-            assert "No metric function registered" in str(e)
-    finally:
-        os.unlink(path)
+        enforce(data=df, policy=policy, target="target", strict=True)
+        raise AssertionError(
+            "Expected ValueError for missing metric, but enforce returned"
+        )
+    except ValueError as e:
+        assert "No metric function registered" in str(e)
 
 
 # ──────────────────────────────────────────────────────────────────────
@@ -305,9 +325,9 @@ class TestVenturalíticaJSONEncoder:
             json.dumps({"x": Unserializable()}, cls=VenturalíticaJSONEncoder)
 
 
-def test_monitor_telemetry_import_error(tmp_path):
+def test_monitor_telemetry_import_error(tmp_path, monkeypatch):
     """Line 94-95: telemetry ImportError fallback in monitor."""
-    os.chdir(tmp_path)
+    monkeypatch.chdir(tmp_path)
 
     # Simulate ImportError for telemetry module inside monitor
     with patch("venturalitica.api.GovernanceSession.start") as mock_start:
@@ -333,9 +353,9 @@ def test_monitor_telemetry_import_error(tmp_path):
             pass
 
 
-def test_enforce_metrics_only_path(tmp_path):
+def test_enforce_metrics_only_path(tmp_path, monkeypatch):
     """Line 194-195: enforce with data=None, metrics=dict (metrics-only path)."""
-    os.chdir(tmp_path)
+    monkeypatch.chdir(tmp_path)
 
     policy_data = {
         "component-definition": {
@@ -370,7 +390,7 @@ def test_enforce_metrics_only_path(tmp_path):
     }
     policy_path = tmp_path / "metrics_only.yaml"
     with open(policy_path, "w") as f:
-        yaml.dump(policy_data, f)
+        yaml.dump(policy_data, f, Dumper=_Dumper)
 
     results = enforce(
         data=None, metrics={"accuracy_score": 0.85}, policy=str(policy_path)
@@ -380,9 +400,9 @@ def test_enforce_metrics_only_path(tmp_path):
     assert results[0].actual_value == 0.85
 
 
-def test_enforce_dict_normalization_metrics_key(tmp_path):
+def test_enforce_dict_normalization_metrics_key(tmp_path, monkeypatch):
     """Lines 228-230: dict normalization when existing results.json has 'metrics' key."""
-    os.chdir(tmp_path)
+    monkeypatch.chdir(tmp_path)
     os.makedirs(".venturalitica", exist_ok=True)
     results_path = ".venturalitica/results.json"
 
@@ -392,7 +412,7 @@ def test_enforce_dict_normalization_metrics_key(tmp_path):
 
     policy_path = tmp_path / "policy.yaml"
     with open(policy_path, "w") as f:
-        yaml.dump({"component-definition": {"components": [{"control-implementations": []}]}}, f)
+        yaml.dump({"component-definition": {"components": [{"control-implementations": []}]}}, f, Dumper=_Dumper)
 
     res = ComplianceResult(
         control_id="NEW-1",
@@ -418,9 +438,9 @@ def test_enforce_dict_normalization_metrics_key(tmp_path):
     assert data[0]["control_id"] == "old-1"
 
 
-def test_enforce_dict_normalization_post_metrics_key(tmp_path):
+def test_enforce_dict_normalization_post_metrics_key(tmp_path, monkeypatch):
     """Lines 231-232: dict normalization when existing results.json has 'post_metrics' key."""
-    os.chdir(tmp_path)
+    monkeypatch.chdir(tmp_path)
     os.makedirs(".venturalitica", exist_ok=True)
     results_path = ".venturalitica/results.json"
 
@@ -429,7 +449,7 @@ def test_enforce_dict_normalization_post_metrics_key(tmp_path):
 
     policy_path = tmp_path / "policy.yaml"
     with open(policy_path, "w") as f:
-        yaml.dump({"component-definition": {"components": [{"control-implementations": []}]}}, f)
+        yaml.dump({"component-definition": {"components": [{"control-implementations": []}]}}, f, Dumper=_Dumper)
 
     res = ComplianceResult(
         control_id="NEW-2",
@@ -453,9 +473,9 @@ def test_enforce_dict_normalization_post_metrics_key(tmp_path):
     assert len(data) == 2
 
 
-def test_enforce_dict_normalization_flattened(tmp_path):
+def test_enforce_dict_normalization_flattened(tmp_path, monkeypatch):
     """Lines 234-239: dict normalization flattens list values from a generic dict."""
-    os.chdir(tmp_path)
+    monkeypatch.chdir(tmp_path)
     os.makedirs(".venturalitica", exist_ok=True)
     results_path = ".venturalitica/results.json"
 
@@ -471,7 +491,7 @@ def test_enforce_dict_normalization_flattened(tmp_path):
 
     policy_path = tmp_path / "policy.yaml"
     with open(policy_path, "w") as f:
-        yaml.dump({"component-definition": {"components": [{"control-implementations": []}]}}, f)
+        yaml.dump({"component-definition": {"components": [{"control-implementations": []}]}}, f, Dumper=_Dumper)
 
     res = ComplianceResult(
         control_id="NEW-3",
@@ -496,9 +516,9 @@ def test_enforce_dict_normalization_flattened(tmp_path):
     assert len(data) == 4
 
 
-def test_enforce_session_save(tmp_path):
+def test_enforce_session_save(tmp_path, monkeypatch):
     """Lines 250-253: session save path when GovernanceSession is active."""
-    os.chdir(tmp_path)
+    monkeypatch.chdir(tmp_path)
 
     from venturalitica.session import GovernanceSession
 
@@ -506,7 +526,7 @@ def test_enforce_session_save(tmp_path):
     try:
         policy_path = tmp_path / "policy.yaml"
         with open(policy_path, "w") as f:
-            yaml.dump({"component-definition": {"components": [{"control-implementations": []}]}}, f)
+            yaml.dump({"component-definition": {"components": [{"control-implementations": []}]}}, f, Dumper=_Dumper)
 
         res = ComplianceResult(
             control_id="S1",
@@ -534,13 +554,13 @@ def test_enforce_session_save(tmp_path):
         GovernanceSession.stop()
 
 
-def test_enforce_strict_reraises_exception(tmp_path):
+def test_enforce_strict_reraises_exception(tmp_path, monkeypatch):
     """Lines 206-208: strict mode re-raises unexpected exceptions."""
-    os.chdir(tmp_path)
+    monkeypatch.chdir(tmp_path)
 
     policy_path = tmp_path / "policy.yaml"
     with open(policy_path, "w") as f:
-        yaml.dump({"component-definition": {"components": [{"control-implementations": []}]}}, f)
+        yaml.dump({"component-definition": {"components": [{"control-implementations": []}]}}, f, Dumper=_Dumper)
 
     with patch(
         "venturalitica.api.AssuranceValidator.compute_and_evaluate",
@@ -640,15 +660,9 @@ def test_group_min_positive_rate_triggered():
         }
     }
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-        yaml.dump(policy, f)
-        path = f.name
-    try:
-        results = enforce(data=df, policy=path, target="target")
-        assert len(results) == 1
-        r = results[0]
-        assert r.metric_key == "group_min_positive_rate"
-        assert r.actual_value >= 0.66 and r.actual_value <= 0.67
-        assert bool(r.passed) is True
-    finally:
-        os.unlink(path)
+    results = enforce(data=df, policy=policy, target="target")
+    assert len(results) == 1
+    r = results[0]
+    assert r.metric_key == "group_min_positive_rate"
+    assert r.actual_value >= 0.66 and r.actual_value <= 0.67
+    assert bool(r.passed) is True
@@ -273,6 +273,21 @@ class TestTCloseness:
         result = calc_t_closeness(df, quasi_identifiers=["group"], sensitive_attribute="value")
         assert 0 <= result <= 1, f"Expected [0,1], got {result}"
 
+    def test_t_closeness_exact_distance(self):
+        """Max half-L1 distance; a group with no sensitive values is 0.5 away"""
+        df = pd.DataFrame(
+            {
+                "group": ["A"] * 4 + ["B"] * 4,
+                "value": [1, 1, 1, 2] + [1, 2, 2, 2],
+            }
+        )
+        result = calc_t_closeness(df, quasi_identifiers=["group"], sensitive_attribute="value")
+        assert result == pytest.approx(0.25)
+
+        df.loc[len(df)] = {"group": "C", "value": None}
+        result = calc_t_closeness(df, quasi_identifiers=["group"], sensitive_attribute="value")
+        assert result == pytest.approx(0.5)
+
 
 # ============================================================================
 # TESTS: Data Minimization (GDPR Art. 5)
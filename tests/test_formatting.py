@@ -10,6 +10,7 @@ import pytest
 from venturalitica.core import ComplianceResult
 from venturalitica.formatting import (
     VenturalíticaJSONEncoder,
+    load_json_file,
     print_summary,
 )
 
@@ -111,6 +112,29 @@ class TestVenturalíticaJSONEncoder:
         assert parsed["int32"] == 1000
 
 
+class TestLoadJsonFile:
+    """Test the results-file reader."""
+
+    def test_round_trips_encoder_output(self, tmp_path):
+        path = tmp_path / "results.json"
+        rows = [{"control_id": "C1", "actual_value": np.float64(0.5), "passed": np.bool_(True)}]
+        path.write_text(json.dumps(rows, indent=2, cls=VenturalíticaJSONEncoder))
+        assert load_json_file(path) == [{"control_id": "C1", "actual_value": 0.5, "passed": True}]
+
+    def test_non_finite_values(self, tmp_path):
+        path = tmp_path / "results.json"
+        path.write_text(json.dumps([{"actual_value": float("nan")}, {"actual_value": float("inf")}]))
+        data = load_json_file(path)
+        assert np.isnan(data[0]["actual_value"])
+        assert data[1]["actual_value"] == float("inf")
+
+    def test_malformed_raises_json_decode_error(self, tmp_path):
+        path = tmp_path / "results.json"
+        path.write_text("{not json")
+        with pytest.raises(json.JSONDecodeError):
+            load_json_file(path)
+
+
 class TestPrintSummary:
     """Test print_summary function for console output."""
 
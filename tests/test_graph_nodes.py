@@ -11,12 +11,15 @@ import os
 from unittest.mock import MagicMock, patch
 
 import pytest
+import responses
 
 pytest.importorskip("langchain_core", reason="Requires venturalitica[agentic]")
 
 from venturalitica.assurance.graph.nodes import NodeFactory
 from venturalitica.assurance.graph.state import ComplianceState
 
+_OSV_QUERYBATCH_URL = "https://api.osv.dev/v1/querybatch"
+
 
 # ---------------------------------------------------------------------------
 # Default routing (provider="auto"): no PRO flag → Ollama fallback
@@ -124,16 +127,17 @@ def test_node_factory_utilities():
                 assert prompts == {"test": "prompt"}
 
 
-@patch("requests.post")
-def test_node_factory_check_security(mock_post):
+@responses.activate
+def test_node_factory_check_security():
     factory = NodeFactory(model_name="dummy", provider="mock")
 
-    mock_response = MagicMock()
-    mock_response.json.return_value = {
-        "results": [{"vulns": [{"id": "CVE-1", "severity": [{"type": "CVSS_V3", "score": "9.5"}]}]}]
-    }
-    mock_response.status_code = 200
-    mock_post.return_value = mock_response
+    responses.add(
+        responses.POST,
+        _OSV_QUERYBATCH_URL,
+        json={
+            "results": [{"vulns": [{"id": "CVE-1", "severity": [{"type": "CVSS_V3", "score": "9.5"}]}]}]
+        },
+    )
 
     bom = {"components": [{"name": "requests", "version": "2.25.1", "type": "library"}]}
     results = factory.check_security(bom)
@@ -1,10 +1,10 @@
 import os
-import tempfile
+from unittest.mock import patch
 
 import pytest
 import yaml
 
-from venturalitica.loader import OSCALPolicyLoader
+from venturalitica.loader import OSCALPolicyLoader, _parse_policy_file
 
 
 def test_loader_file_not_found():
@@ -12,34 +12,26 @@ def test_loader_file_not_found():
         OSCALPolicyLoader("non_existent.yaml").load()
 
 
-def test_loader_invalid_format():
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-        yaml.dump({"unknown": "root"}, f)
-        path = f.name
-    try:
-        with pytest.raises(ValueError, match="Unsupported OSCAL format"):
-            OSCALPolicyLoader(path).load()
-    finally:
-        os.unlink(path)
+def test_loader_invalid_format(tmp_path):
+    path = tmp_path / "policy.yaml"
+    path.write_text(yaml.dump({"unknown": "root"}))
+    with pytest.raises(ValueError, match="Unsupported OSCAL format"):
+        OSCALPolicyLoader(path).load()
 
 
-def test_loader_flat_list():
+def test_loader_flat_list(tmp_path):
     data = [
         {"id": "C1", "metric_key": "accuracy_score", "threshold": 0.8, "operator": ">="}
     ]
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-        yaml.dump(data, f)
-        path = f.name
-    try:
-        policy = OSCALPolicyLoader(path).load()
-        assert policy.title == "Flat Policy"
-        assert len(policy.controls) == 1
-        assert policy.controls[0].metric_key == "accuracy_score"
-    finally:
-        os.unlink(path)
-
-
-def test_loader_catalog_recursive():
+    path = tmp_path / "policy.yaml"
+    path.write_text(yaml.dump(data))
+    policy = OSCALPolicyLoader(path).load()
+    assert policy.title == "Flat Policy"
+    assert len(policy.controls) == 1
+    assert policy.controls[0].metric_key == "accuracy_score"
+
+
+def test_loader_catalog_recursive(tmp_path):
     data = {
         "catalog": {
             "metadata": {"title": "Recursive Catalog"},
@@ -63,19 +55,15 @@ def test_loader_catalog_recursive():
             ],
         }
     }
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-        yaml.dump(data, f)
-        path = f.name
-    try:
-        policy = OSCALPolicyLoader(path).load()
-        assert len(policy.controls) == 1
-        assert policy.controls[0].id == "C1"
-        assert policy.controls[0].severity == "high"
-    finally:
-        os.unlink(path)
-
-
-def test_loader_direct_props():
+    path = tmp_path / "policy.yaml"
+    path.write_text(yaml.dump(data))
+    policy = OSCALPolicyLoader(path).load()
+    assert len(policy.controls) == 1
+    assert policy.controls[0].id == "C1"
+    assert policy.controls[0].severity == "high"
+
+
+def test_loader_direct_props(tmp_path):
     # Canonical NIST OSCAL v1.2.2 `component-definition` envelope.
     data = {
         "component-definition": {
@@ -100,19 +88,15 @@ def test_loader_direct_props():
             ]
         }
     }
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-        yaml.dump(data, f)
-        path = f.name
-    try:
-        policy = OSCALPolicyLoader(path).load()
-        assert len(policy.controls) == 1
-        assert policy.controls[0].metric_key == "precision_score"
-        assert policy.controls[0].input_mapping["target"] == "y_true"
-    finally:
-        os.unlink(path)
-
-
-def test_loader_hybrid_inventory():
+    path = tmp_path / "policy.yaml"
+    path.write_text(yaml.dump(data))
+    policy = OSCALPolicyLoader(path).load()
+    assert len(policy.controls) == 1
+    assert policy.controls[0].metric_key == "precision_score"
+    assert policy.controls[0].input_mapping["target"] == "y_true"
+
+
+def test_loader_hybrid_inventory(tmp_path):
     # Canonical: inventory-items belong inside `local-definitions`.
     data = {
         "component-definition": {
@@ -137,15 +121,11 @@ def test_loader_hybrid_inventory():
             ],
         }
     }
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-        yaml.dump(data, f)
-        path = f.name
-    try:
-        policy = OSCALPolicyLoader(path).load()
-        assert len(policy.controls) == 1
-        assert policy.controls[0].metric_key == "recall_score"
-    finally:
-        os.unlink(path)
+    path = tmp_path / "policy.yaml"
+    path.write_text(yaml.dump(data))
+    policy = OSCALPolicyLoader(path).load()
+    assert len(policy.controls) == 1
+    assert policy.controls[0].metric_key == "recall_score"
 
 
 def test_oscal_loader_from_dict():
@@ -173,3 +153,139 @@ def test_oscal_loader_from_dict():
     policy = loader.load()
     assert policy is not None
     assert len(policy.controls) > 0
+
+
+def test_loader_reuses_parse_until_file_changes(tmp_path):
+    path = tmp_path / "policy.yaml"
+    data = [{"id": "C1", "metric_key": "accuracy_score", "threshold": 0.8, "operator": ">="}]
+    path.write_text(yaml.dump(data))
+    first = OSCALPolicyLoader(path).load()
+
+    with patch("venturalitica.loader.yaml.load") as yaml_load:
+        second = OSCALPolicyLoader(path).load()
+    yaml_load.assert_not_called()
+    assert second.controls == first.controls
+    assert second.controls[0] is not first.controls[0]
+
+    data[0]["metric_key"] = "f1_score"
+    path.write_text(yaml.dump(data))
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    assert OSCALPolicyLoader(path).load().controls[0].metric_key == "f1_score"
+
+    # Same mtime (coarse filesystem clock), different size: still re-parsed.
+    mtime = os.stat(path).st_mtime_ns
+    data[0]["metric_key"] = "recall_score"
+    path.write_text(yaml.dump(data))
+    os.utime(path, ns=(mtime, mtime))
+    assert OSCALPolicyLoader(path).load().controls[0].metric_key == "recall_score"
+
+
+def test_loader_cached_parse_not_mutated_through_controls(tmp_path):
+    path = tmp_path / "policy.yaml"
+    path.write_text(yaml.dump({
+        "catalog": {
+            "controls": [
+                {
+                    "id": "C1",
+                    "props": [
+                        {"name": "metric_key", "value": "k_anonymity"},
+                        {"name": "quasi_identifiers", "value": ["age", "zip"]},
+                    ],
+                }
+            ]
+        }
+    }))
+    first = OSCALPolicyLoader(path).load()
+    first.controls[0].params["quasi_identifiers"].append("gender")
+    second = OSCALPolicyLoader(path).load()
+    assert second.controls[0].params["quasi_identifiers"] == ["age", "zip"]
+
+
+def test_loader_interns_repeated_control_fields():
+    # Built at runtime so each control starts with distinct string objects.
+    data = [
+        {
+            "id": f"C{i}",
+            "metric_key": "".join(["accuracy", "_score"]),
+            "threshold": 0.8,
+            "operator": "".join([">", "="]),
+            "severity": "".join(["hi", "gh"]),
+        }
+        for i in range(2)
+    ]
+    assert data[0]["operator"] is not data[1]["operator"]
+    first, second = OSCALPolicyLoader(data).load().controls
+    assert first.operator is second.operator
+    assert first.metric_key is second.metric_key
+    assert first.severity is second.severity
+
+
+def test_loader_shared_inventory_item_gives_independent_controls():
+    data = {
+        "component-definition": {
+            "local-definitions": {
+                "inventory-items": [
+                    {
+                        "uuid": "m1",
+                        "props": [
+                            {"name": "metric_key", "value": "k_anonymity"},
+                            {"name": "threshold", "value": "5"},
+                            {"name": "operator", "value": ">="},
+                            {"name": "input.dimension", "value": "age"},
+                            {"name": "quasi_identifiers", "value": "age,zip"},
+                            {"name": "risk_id", "value": "R-1"},
+                        ],
+                    }
+                ],
+            },
+            "components": [
+                {
+                    "control-implementations": [
+                        {
+                            "implemented-requirements": [
+                                {
+                                    "control-id": cid,
+                                    "links": [{"href": "#m1"}],
+                                    "props": [{"name": "severity", "value": sev}],
+                                }
+                                for cid, sev in (("C1", "high"), ("C2", "low"))
+                            ]
+                        }
+                    ]
+                }
+            ],
+        }
+    }
+    first, second = OSCALPolicyLoader(data).load().controls
+    assert first.input_mapping == {"dimension": "age"}
+    assert first.params == {"quasi_identifiers": "age,zip"}
+    assert first.metadata == {"severity": "high", "risk_id": "R-1"}
+    assert second.metadata == {"severity": "low", "risk_id": "R-1"}
+    assert first.params is not second.params
+    assert first.input_mapping is not second.input_mapping
+
+
+def test_loader_persistent_cache_reused_across_processes(tmp_path, monkeypatch):
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setenv("VENTURALITICA_POLICY_CACHE_DIR", str(cache_dir))
+    path = tmp_path / "policy.yaml"
+    path.write_text(yaml.dump([{"id": "C1", "metric_key": "accuracy_score", "threshold": 0.8, "operator": ">="}]))
+    first = OSCALPolicyLoader(path).load()
+    assert len(list(cache_dir.glob("*.json"))) == 1
+
+    # A fresh process has an empty in-memory cache; simulate it.
+    _parse_policy_file.cache_clear()
+    with patch("venturalitica.loader.yaml.load") as yaml_load:
+        second = OSCALPolicyLoader(path).load()
+    yaml_load.assert_not_called()
+    assert second.controls == first.controls
+
+
+def test_loader_persistent_cache_skips_non_json_values(tmp_path, monkeypatch):
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setenv("VENTURALITICA_POLICY_CACHE_DIR", str(cache_dir))
+    path = tmp_path / "policy.yaml"
+    path.write_text("catalog:\n  metadata:\n    last-modified: 2026-01-01\n  controls: []\n")
+    OSCALPolicyLoader(path).load()
+    assert not list(cache_dir.glob("*.json"))
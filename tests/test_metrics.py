@@ -26,6 +26,27 @@ def sample_data():
     )
 
 
+@pytest.mark.parametrize(
+    "y_true,y_pred",
+    [
+        ([True, False, True, True], [1, 0, 0, 1]),  # bool vs int: fast path
+        (["a", "b", "a", "b"], ["a", "a", "a", "b"]),  # labels: sklearn path
+        ([1, 0, 1, 1], [1.0, 0.0, 0.0, 1.0]),  # float predictions: sklearn path
+    ],
+)
+def test_accuracy_matches_sklearn(y_true, y_pred):
+    from sklearn.metrics import accuracy_score
+
+    df = pd.DataFrame({"t": y_true, "p": y_pred})
+    assert calc_accuracy(df, target="t", prediction="p") == accuracy_score(y_true, y_pred)
+
+
+def test_accuracy_empty_still_rejected():
+    df = pd.DataFrame({"t": pd.Series([], dtype=int), "p": pd.Series([], dtype=int)})
+    with pytest.raises(ValueError):
+        calc_accuracy(df, target="t", prediction="p")
+
+
 def test_standard_metrics(sample_data):
     kwargs = {"target": "target", "prediction": "prediction"}
     assert calc_accuracy(sample_data, **kwargs) == 0.75
@@ -78,7 +78,9 @@ def test_integrity_probe():
     probe.results["drift_detected"] = True
     assert "DRIFT DETECTED" in probe.get_summary()
 
-def test_handshake_probe_summary():
+def test_handshake_probe_summary(tmp_path, monkeypatch):
+    # Red-check counting reads .venturalitica/results.json from the cwd
+    monkeypatch.chdir(tmp_path)
     mock_func = MagicMock(return_value=False)
     probe = HandshakeProbe(mock_func)
     probe.start()
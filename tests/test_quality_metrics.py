@@ -156,6 +156,18 @@ class TestCalcGroupMinPositiveRate:
         assert isinstance(rate, float)
         assert len(meta["groups"]) > 0
 
+    def test_per_group_rates(self):
+        """Positive = group max; NaN targets are left out of the denominator."""
+        df = pd.DataFrame(
+            {
+                "target": [1, 0, np.nan, 0, 0, 1, 1, 1],
+                "dim": ["A", "A", "A", "B", "B", "C", "C", "C"],
+            }
+        )
+        rate, meta = calc_group_min_positive_rate(df, target="target", dimension="dim")
+        assert meta["groups"] == {"A": 0.5, "B": 1.0, "C": 1.0}
+        assert rate == 0.5
+
     def test_missing_dimension(self):
         """Missing dimension column raises ValueError."""
         df = pd.DataFrame({"target": [1, 0]})
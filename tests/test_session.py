@@ -13,7 +13,8 @@ from unittest.mock import patch
 
 import pytest
 
-from venturalitica.session import GovernanceSession
+from venturalitica.formatting import loads_json
+from venturalitica.session import GovernanceSession, append_to_json_array
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -150,6 +151,21 @@ class TestSaveResults:
         # The corrupt content was silently ignored (existing=[])
         assert data == [{"ok": True}]
 
+    def test_corrupt_bracketed_file_is_rewritten(self):
+        """A file that only looks like an array is replaced, not appended to."""
+        session = GovernanceSession("torn")
+        session.results_file.write_text('[\n  {"ok": tru\n]')
+
+        session.save_results([{"ok": True}])
+        assert json.loads(session.results_file.read_text()) == [{"ok": True}]
+
+    def test_append_keeps_non_finite_values(self, tmp_path):
+        path = tmp_path / "results.json"
+        path.write_text(json.dumps([{"actual_value": float("nan")}], indent=2))
+        assert append_to_json_array(path, [{"actual_value": 1.0}])
+        data = json.loads(path.read_text())
+        assert data[1] == {"actual_value": 1.0}
+
     def test_save_results_exception_handling(self, capsys):
         """If the entire save operation fails, it prints a warning."""
         session = GovernanceSession("err")
@@ -165,6 +181,50 @@ class TestSaveResults:
         data = json.loads(session.results_file.read_text())
         assert data == []
 
+    def test_append_matches_full_rewrite(self, tmp_path):
+        path = tmp_path / "results.json"
+        path.write_text(json.dumps([], indent=2))
+        batches = [[{"run": 1, "tags": ["a", "b"]}], [{"run": 2}, {"run": 3, "meta": {}}]]
+        for batch in batches:
+            assert append_to_json_array(path, batch)
+        expected = json.dumps([r for batch in batches for r in batch], indent=2)
+        assert path.read_text() == expected
+
+    def test_append_parses_history_once(self, tmp_path):
+        path = tmp_path / "results.json"
+        path.write_text(json.dumps([{"run": 0}], indent=2))
+        with patch("venturalitica.session.loads_json", wraps=loads_json) as parse:
+            for run in range(1, 4):
+                assert append_to_json_array(path, [{"run": run}])
+        assert parse.call_count == 1
+        assert [r["run"] for r in json.loads(path.read_text())] == [0, 1, 2, 3]
+
+    def test_append_revalidates_after_external_write(self, tmp_path):
+        path = tmp_path / "results.json"
+        path.write_text(json.dumps([], indent=2))
+        assert append_to_json_array(path, [{"run": 1}])
+        torn = '[\n  {"run": 1,\n  {"run": 2}\n]'
+        path.write_text(torn)
+        assert append_to_json_array(path, [{"run": 3}]) is False
+        assert path.read_text() == torn
+
+    @pytest.mark.parametrize(
+        "content",
+        [
+            None,
+            "NOT VALID JSON!!!",
+            '{"metrics": []}',
+            # Bracketed but torn inside, e.g. by an interleaved concurrent write
+            '[\n  {"control_id": "a",\n  {"control_id": "b"}\n]',
+        ],
+    )
+    def test_append_declines_non_array_files(self, tmp_path, content):
+        path = tmp_path / "results.json"
+        if content is not None:
+            path.write_text(content)
+        assert append_to_json_array(path, [{"ok": True}]) is False
+        assert (path.read_text() if content is not None else None) == content
+
 
 # ===========================================================================
 # get_current / start / stop lifecycle
@@ -114,83 +114,38 @@ def sample_dataframe():
 class TestMonitorSmokeTests:
     """Smoke tests for vl.monitor() context manager."""
 
+    @pytest.mark.usefixtures("no_probes")
     def test_monitor_creates_session_evidence_vault(self, tmp_work_dir):
         """Monitor should create .venturalitica session directory with evidence."""
-        with (
-            patch("venturalitica.probes.CarbonProbe.start"),
-            patch("venturalitica.probes.CarbonProbe.stop"),
-            patch("venturalitica.probes.HardwareProbe.start"),
-            patch("venturalitica.probes.HardwareProbe.stop"),
-            patch("venturalitica.probes.IntegrityProbe.start"),
-            patch("venturalitica.probes.IntegrityProbe.stop"),
-            patch("venturalitica.probes.BOMProbe.start"),
-            patch("venturalitica.probes.BOMProbe.stop"),
-            patch("venturalitica.probes.ArtifactProbe.start"),
-            patch("venturalitica.probes.ArtifactProbe.stop"),
-            patch("venturalitica.probes.HandshakeProbe.start"),
-            patch("venturalitica.probes.HandshakeProbe.stop"),
-            patch("venturalitica.probes.TraceProbe.start"),
-            patch("venturalitica.probes.TraceProbe.stop"),
-        ):
-            with monitor("Smoke Test Task"):
-                pass
+        with monitor("Smoke Test Task"):
+            pass
 
-            # Check that .venturalitica directory was created
-            assert Path(".venturalitica").exists()
-            assert Path(".venturalitica").is_dir()
+        # Check that .venturalitica directory was created
+        assert Path(".venturalitica").exists()
+        assert Path(".venturalitica").is_dir()
 
+    @pytest.mark.usefixtures("no_probes")
     def test_monitor_yields_control_to_body(self, tmp_work_dir, capsys):
         """Monitor should yield control and execute body code."""
         executed = False
 
-        with (
-            patch("venturalitica.probes.CarbonProbe.start"),
-            patch("venturalitica.probes.CarbonProbe.stop"),
-            patch("venturalitica.probes.HardwareProbe.start"),
-            patch("venturalitica.probes.HardwareProbe.stop"),
-            patch("venturalitica.probes.IntegrityProbe.start"),
-            patch("venturalitica.probes.IntegrityProbe.stop"),
-            patch("venturalitica.probes.BOMProbe.start"),
-            patch("venturalitica.probes.BOMProbe.stop"),
-            patch("venturalitica.probes.ArtifactProbe.start"),
-            patch("venturalitica.probes.ArtifactProbe.stop"),
-            patch("venturalitica.probes.HandshakeProbe.start"),
-            patch("venturalitica.probes.HandshakeProbe.stop"),
-            patch("venturalitica.probes.TraceProbe.start"),
-            patch("venturalitica.probes.TraceProbe.stop"),
-        ):
-            with monitor("Test Task"):
-                executed = True
-                assert True
+        with monitor("Test Task"):
+            executed = True
+            assert True
 
         assert executed
         captured = capsys.readouterr()
         assert "Starting monitor" in captured.out
         assert "Monitor stopped" in captured.out
 
+    @pytest.mark.usefixtures("no_probes")
     def test_monitor_with_custom_name_and_label(self, tmp_work_dir, capsys):
         """Monitor should accept custom name and label parameters."""
         task_name = "ML Training Pipeline"
         task_label = "v0.5.0-release"
 
-        with (
-            patch("venturalitica.probes.CarbonProbe.start"),
-            patch("venturalitica.probes.CarbonProbe.stop"),
-            patch("venturalitica.probes.HardwareProbe.start"),
-            patch("venturalitica.probes.HardwareProbe.stop"),
-            patch("venturalitica.probes.IntegrityProbe.start"),
-            patch("venturalitica.probes.IntegrityProbe.stop"),
-            patch("venturalitica.probes.BOMProbe.start"),
-            patch("venturalitica.probes.BOMProbe.stop"),
-            patch("venturalitica.probes.ArtifactProbe.start"),
-            patch("venturalitica.probes.ArtifactProbe.stop"),
-            patch("venturalitica.probes.HandshakeProbe.start"),
-            patch("venturalitica.probes.HandshakeProbe.stop"),
-            patch("venturalitica.probes.TraceProbe.start"),
-            patch("venturalitica.probes.TraceProbe.stop"),
-        ):
-            with monitor(name=task_name, label=task_label):
-                pass
+        with monitor(name=task_name, label=task_label):
+            pass
 
         captured = capsys.readouterr()
         assert task_name in captured.out
@@ -493,28 +448,13 @@ class TestEnforceSmokeTests:
 class TestMonitorEnforceIntegration:
     """Smoke tests for combined monitor and enforce workflows."""
 
+    @pytest.mark.usefixtures("no_probes")
     def test_monitor_and_enforce_together(self, tmp_work_dir, sample_policy_file, capsys):
         """Monitor and enforce should work together in same session."""
-        with (
-            patch("venturalitica.probes.CarbonProbe.start"),
-            patch("venturalitica.probes.CarbonProbe.stop"),
-            patch("venturalitica.probes.HardwareProbe.start"),
-            patch("venturalitica.probes.HardwareProbe.stop"),
-            patch("venturalitica.probes.IntegrityProbe.start"),
-            patch("venturalitica.probes.IntegrityProbe.stop"),
-            patch("venturalitica.probes.BOMProbe.start"),
-            patch("venturalitica.probes.BOMProbe.stop"),
-            patch("venturalitica.probes.ArtifactProbe.start"),
-            patch("venturalitica.probes.ArtifactProbe.stop"),
-            patch("venturalitica.probes.HandshakeProbe.start"),
-            patch("venturalitica.probes.HandshakeProbe.stop"),
-            patch("venturalitica.probes.TraceProbe.start"),
-            patch("venturalitica.probes.TraceProbe.stop"),
-        ):
-            with monitor("Integration Test"):
-                results = enforce(metrics={"accuracy_score": 0.85, "precision_score": 0.80}, policy=sample_policy_file)
+        with monitor("Integration Test"):
+            results = enforce(metrics={"accuracy_score": 0.85, "precision_score": 0.80}, policy=sample_policy_file)
 
-                assert isinstance(results, list)
+            assert isinstance(results, list)
 
         captured = capsys.readouterr()
         assert "Starting monitor" in captured.out
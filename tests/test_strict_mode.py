@@ -6,15 +6,17 @@ policy that references a metric_key the registry does not implement.
 """
 from __future__ import annotations
 
-import os
-import tempfile
-
 import pandas as pd
 import pytest
 import yaml
 
 from venturalitica.api import enforce
 
+try:
+    from yaml import CSafeDumper as _Dumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as _Dumper
+
 
 def _missing_metric_policy() -> dict:
     return {
@@ -51,15 +53,11 @@ def _missing_metric_policy() -> dict:
     }
 
 
-@pytest.fixture
-def policy_path():
-    with tempfile.NamedTemporaryFile(
-        mode="w", suffix=".oscal.yaml", delete=False
-    ) as f:
-        yaml.dump(_missing_metric_policy(), f)
-        path = f.name
-    yield path
-    os.unlink(path)
+@pytest.fixture(scope="module")
+def policy_path(tmp_path_factory):
+    path = tmp_path_factory.mktemp("strict") / "policy.oscal.yaml"
+    path.write_text(yaml.dump(_missing_metric_policy(), Dumper=_Dumper))
+    return str(path)
 
 
 def test_strict_mode_via_ci_env_raises_on_missing_metric(policy_path, monkeypatch):
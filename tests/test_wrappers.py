@@ -1,6 +1,5 @@
 import json
 import os
-import tempfile
 from unittest.mock import MagicMock, patch
 
 import numpy as np
@@ -9,7 +8,7 @@ import pandas as pd
 from venturalitica.wrappers import AssuranceWrapper, wrap
 
 
-def test_wrappers_basic_flow(tmp_path):
+def test_wrappers_basic_flow(tmp_path, monkeypatch):
     # Mock model
     class MockModel:
         def fit(self, X, y=None, **kwargs):
@@ -25,7 +24,7 @@ def test_wrappers_basic_flow(tmp_path):
     df = pd.DataFrame({"target": [1, 0], "A": [0.5, 0.6]})
 
     # Wrap without policy for now
-    os.chdir(tmp_path)
+    monkeypatch.chdir(tmp_path)
     wrapped = wrap(model)
 
     # Test fit
@@ -40,7 +39,7 @@ def test_wrappers_basic_flow(tmp_path):
     assert os.path.exists(".venturalitica/latest_run.json")
 
 
-def test_assurance_wrapper_predict_proba():
+def test_assurance_wrapper_predict_proba(tmp_path):
     """Test wrapper predict_proba method delegates correctly."""
 
     class DummyModel:
@@ -53,20 +52,16 @@ def test_assurance_wrapper_predict_proba():
         def predict_proba(self, X):
             return np.column_stack([1 - X[:, 0], X[:, 0]])
 
-    with tempfile.NamedTemporaryFile(suffix=".yaml", mode="w", delete=False) as f:
-        f.write("title: Test\ncontrols: []\n")
-        policy_file = f.name
+    policy_file = tmp_path / "policy.yaml"
+    policy_file.write_text("title: Test\ncontrols: []\n")
 
-    try:
-        wrapper = AssuranceWrapper(DummyModel(), policy=policy_file)
-        X = np.array([[0.1], [0.5], [0.9]])
-        proba = wrapper.predict_proba(X)
-        assert proba.shape == (3, 2)
-    finally:
-        os.unlink(policy_file)
+    wrapper = AssuranceWrapper(DummyModel(), policy=str(policy_file))
+    X = np.array([[0.1], [0.5], [0.9]])
+    proba = wrapper.predict_proba(X)
+    assert proba.shape == (3, 2)
 
 
-def test_assurance_wrapper_get_params():
+def test_assurance_wrapper_get_params(tmp_path):
     """Test wrapper preserves model get_params."""
 
     class DummyModel:
@@ -79,16 +74,12 @@ def test_assurance_wrapper_get_params():
         def get_params(self):
             return {"n_estimators": 100, "max_depth": 5}
 
-    with tempfile.NamedTemporaryFile(suffix=".yaml", mode="w", delete=False) as f:
-        f.write("title: Test\ncontrols: []\n")
-        policy_file = f.name
+    policy_file = tmp_path / "policy.yaml"
+    policy_file.write_text("title: Test\ncontrols: []\n")
 
-    try:
-        wrapper = AssuranceWrapper(DummyModel(), policy=policy_file)
-        params = wrapper.get_params()
-        assert params["n_estimators"] == 100
-    finally:
-        os.unlink(policy_file)
+    wrapper = AssuranceWrapper(DummyModel(), policy=str(policy_file))
+    params = wrapper.get_params()
+    assert params["n_estimators"] == 100
 
 
 # ──────────────────────────────────────────────────────────────────────
@@ -114,9 +105,9 @@ def test_call_forwarding():
     assert result == 10
 
 
-def test_audit_kwargs_separation(tmp_path):
+def test_audit_kwargs_separation(tmp_path, monkeypatch):
     """Lines 50-56: audit_kwargs are separated from model_kwargs."""
-    os.chdir(tmp_path)
+    monkeypatch.chdir(tmp_path)
 
     class StrictModel:
         def fit(self, X, y=None):
@@ -135,9 +126,9 @@ def test_audit_kwargs_separation(tmp_path):
     wrapper.fit(df, target="target")
 
 
-def test_fit_with_audit_data_kwarg(tmp_path):
+def test_fit_with_audit_data_kwarg(tmp_path, monkeypatch):
     """Lines 60-64: fit uses audit_data kwarg if provided."""
-    os.chdir(tmp_path)
+    monkeypatch.chdir(tmp_path)
 
     class SimpleModel:
         def fit(self, X, y=None):
@@ -162,9 +153,9 @@ def test_fit_with_audit_data_kwarg(tmp_path):
         assert call_kwargs[1]["data"] is audit_df
 
 
-def test_fit_save_run_metadata_exception(tmp_path, capsys):
+def test_fit_save_run_metadata_exception(tmp_path, monkeypatch, capsys):
     """Lines 71-75: _save_run_metadata exception is caught and printed."""
-    os.chdir(tmp_path)
+    monkeypatch.chdir(tmp_path)
 
     class SimpleModel:
         def fit(self, X, y=None):
@@ -184,9 +175,9 @@ def test_fit_save_run_metadata_exception(tmp_path, capsys):
     assert "Failed to save run metadata" in captured.out
 
 
-def test_fit_upload_policy_artifacts_exception(tmp_path, capsys):
+def test_fit_upload_policy_artifacts_exception(tmp_path, monkeypatch, capsys):
     """Lines 77-81: _upload_policy_artifacts exception is caught and printed."""
-    os.chdir(tmp_path)
+    monkeypatch.chdir(tmp_path)
 
     class SimpleModel:
         def fit(self, X, y=None):
@@ -206,9 +197,9 @@ def test_fit_upload_policy_artifacts_exception(tmp_path, capsys):
     assert "Regulatory Versioning Warning" in captured.out
 
 
-def test_find_dataframe_in_kwargs(tmp_path):
+def test_find_dataframe_in_kwargs(tmp_path, monkeypatch):
     """Lines 112-113: _find_dataframe finds DataFrame in kwargs."""
-    os.chdir(tmp_path)
+    monkeypatch.chdir(tmp_path)
 
     class SimpleModel:
         def fit(self, data=None):
@@ -224,9 +215,9 @@ def test_find_dataframe_in_kwargs(tmp_path):
     assert found is df
 
 
-def test_find_dataframe_in_args(tmp_path):
+def test_find_dataframe_in_args(tmp_path, monkeypatch):
     """Lines 116-118: _find_dataframe finds DataFrame in positional args."""
-    os.chdir(tmp_path)
+    monkeypatch.chdir(tmp_path)
 
     wrapper = AssuranceWrapper.__new__(AssuranceWrapper)
     df = pd.DataFrame({"a": [1, 2]})
@@ -235,18 +226,18 @@ def test_find_dataframe_in_args(tmp_path):
     assert found is df
 
 
-def test_find_dataframe_returns_none(tmp_path):
+def test_find_dataframe_returns_none(tmp_path, monkeypatch):
     """_find_dataframe returns None when no DataFrame found."""
-    os.chdir(tmp_path)
+    monkeypatch.chdir(tmp_path)
 
     wrapper = AssuranceWrapper.__new__(AssuranceWrapper)
     found = wrapper._find_dataframe([np.array([1, 2])], {"x": 42})
     assert found is None
 
 
-def test_save_run_metadata_captures_info(tmp_path):
+def test_save_run_metadata_captures_info(tmp_path, monkeypatch):
     """Lines 124-144: _save_run_metadata captures model class, data info, audit results."""
-    os.chdir(tmp_path)
+    monkeypatch.chdir(tmp_path)
 
     class TrackableModel:
         def fit(self, X, y=None):
@@ -276,9 +267,9 @@ def test_save_run_metadata_captures_info(tmp_path):
     assert meta["model"]["params"]["n_estimators"] == 100
 
 
-def test_save_run_metadata_without_get_params(tmp_path):
+def test_save_run_metadata_without_get_params(tmp_path, monkeypatch):
     """Lines 147-148: _save_run_metadata works when model has no get_params."""
-    os.chdir(tmp_path)
+    monkeypatch.chdir(tmp_path)
 
     class MinimalModel:
         def fit(self, X, y=None):
@@ -299,9 +290,9 @@ def test_save_run_metadata_without_get_params(tmp_path):
     assert "params" not in meta["model"]
 
 
-def test_save_run_metadata_mlflow_integration(tmp_path):
+def test_save_run_metadata_mlflow_integration(tmp_path, monkeypatch):
     """Lines 165-188: _save_run_metadata captures MLflow integration info."""
-    os.chdir(tmp_path)
+    monkeypatch.chdir(tmp_path)
 
     class SimpleModel:
         def fit(self, X, y=None):
@@ -336,9 +327,9 @@ def test_save_run_metadata_mlflow_integration(tmp_path):
     assert meta["integrations"]["mlflow"]["active"] is True
 
 
-def test_save_run_metadata_wandb_integration(tmp_path):
+def test_save_run_metadata_wandb_integration(tmp_path, monkeypatch):
     """Lines 191-203: _save_run_metadata captures WandB integration info."""
-    os.chdir(tmp_path)
+    monkeypatch.chdir(tmp_path)
 
     class SimpleModel:
         def fit(self, X, y=None):
@@ -376,9 +367,9 @@ def test_save_run_metadata_wandb_integration(tmp_path):
     assert meta["integrations"]["wandb"]["project"] == "test-project"
 
 
-def test_upload_policy_artifacts_no_policy(tmp_path):
+def test_upload_policy_artifacts_no_policy(tmp_path, monkeypatch):
     """Lines 215-216: _upload_policy_artifacts returns early when no policy set."""
-    os.chdir(tmp_path)
+    monkeypatch.chdir(tmp_path)
 
     class SimpleModel:
         def fit(self, X, y=None):
@@ -392,9 +383,9 @@ def test_upload_policy_artifacts_no_policy(tmp_path):
     wrapper._upload_policy_artifacts()
 
 
-def test_upload_policy_artifacts_mlflow_path(tmp_path):
+def test_upload_policy_artifacts_mlflow_path(tmp_path, monkeypatch):
     """Lines 223-236: _upload_policy_artifacts logs to MLflow when active."""
-    os.chdir(tmp_path)
+    monkeypatch.chdir(tmp_path)
 
     # Create a real policy file
     policy_path = tmp_path / "test_policy.yaml"
@@ -418,9 +409,9 @@ def test_upload_policy_artifacts_mlflow_path(tmp_path):
     mock_mlflow.log_artifact.assert_called_once_with(str(policy_path), artifact_path="policy_snapshot")
 
 
-def test_upload_policy_artifacts_wandb_path(tmp_path):
+def test_upload_policy_artifacts_wandb_path(tmp_path, monkeypatch):
     """Lines 241-254: _upload_policy_artifacts logs to WandB when active."""
-    os.chdir(tmp_path)
+    monkeypatch.chdir(tmp_path)
 
     policy_path = tmp_path / "test_policy.yaml"
     policy_path.write_text("title: Test\ncontrols: []\n")
@@ -451,9 +442,9 @@ def test_upload_policy_artifacts_wandb_path(tmp_path):
     mock_wandb.log_artifact.assert_called_once_with(mock_artifact)
 
 
-def test_upload_policy_artifacts_mlflow_import_error(tmp_path):
+def test_upload_policy_artifacts_mlflow_import_error(tmp_path, monkeypatch):
     """Lines 235-236: _upload_policy_artifacts handles MLflow ImportError gracefully."""
-    os.chdir(tmp_path)
+    monkeypatch.chdir(tmp_path)
 
     policy_path = tmp_path / "test_policy.yaml"
     policy_path.write_text("title: Test\ncontrols: []\n")
@@ -480,9 +471,9 @@ def test_upload_policy_artifacts_mlflow_import_error(tmp_path):
         pass  # No cleanup needed with patch.dict context manager
 
 
-def test_predict_with_post_audit(tmp_path):
+def test_predict_with_post_audit(tmp_path, monkeypatch):
     """Lines 87-106: predict triggers post-audit with prediction injected."""
-    os.chdir(tmp_path)
+    monkeypatch.chdir(tmp_path)
 
     class PredModel:
         def fit(self, X, y=None):
@@ -506,9 +497,9 @@ def test_predict_with_post_audit(tmp_path):
     assert "prediction" in call_kwargs["data"].columns
 
 
-def test_predict_with_custom_pred_col(tmp_path):
+def test_predict_with_custom_pred_col(tmp_path, monkeypatch):
     """Lines 99-100: predict uses custom prediction column name from audit_kwargs."""
-    os.chdir(tmp_path)
+    monkeypatch.chdir(tmp_path)
 
     class PredModel:
         def fit(self, X, y=None):